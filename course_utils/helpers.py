@@ -17,6 +17,15 @@ import warnings
 import time
 import gc
 import re
+import io
+import hashlib
+import tarfile
+import tempfile
+import atexit
+import weakref
+import threading
+from functools import lru_cache
+from contextlib import contextmanager, nullcontext
 from typing import Optional, List, Dict, Any, Tuple, Callable
 
 # Data manipulation and visualization
@@ -24,7 +33,6 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from scipy import stats, special
-from sklearn.feature_selection import mutual_info_classif
 
 # Machine learning - scikit-learn
 from sklearn.base import BaseEstimator, ClassifierMixin, TransformerMixin
@@ -33,6 +41,7 @@ from sklearn.inspection import PartialDependenceDisplay
 from sklearn.calibration import CalibrationDisplay
 from sklearn.metrics import (
     roc_auc_score,
+    roc_curve,
     average_precision_score,
     precision_score,
     recall_score,
@@ -316,54 +325,192 @@ def predict_positive_class_scores(
     return extract_positive_class_scores(estimator.predict_proba(features))
 
 
-def _find_best_f1_threshold_from_score_support(
+def _is_binary_label_array(y_true: np.ndarray) -> bool:
+    """Return True when labels are 0/1 (or boolean) without missing values."""
+    unique_labels = np.unique(y_true)
+    if np.any(pd.isna(unique_labels)):
+        return False
+    return bool(np.all(np.isin(unique_labels, [0, 1, False, True])))
+
+
+def _confusion_counts_at_thresholds(
     y_true: np.ndarray,
     y_score: np.ndarray,
-) -> float | None:
-    """Search the observed score support exactly for the best F1 threshold."""
-    unique_labels = np.unique(y_true)
-    if np.any(pd.isna(unique_labels)) or not np.all(np.isin(unique_labels, [0, 1, False, True])):
-        return None
+    thresholds: np.ndarray | None = None,
+    sample_weight: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute confusion counts for the rule ``y_score >= threshold`` from one sort.
 
+    When thresholds is None, every distinct observed score is a candidate and
+    the thresholds are returned in descending order. With sample_weight, the
+    counts are weighted sums.
+    """
     y_true_binary = np.asarray(y_true, dtype=int)
     order = np.argsort(y_score, kind="mergesort")[::-1]
     sorted_scores = y_score[order]
     sorted_true = y_true_binary[order]
 
-    true_positives = np.cumsum(sorted_true)
-    false_positives = np.cumsum(1 - sorted_true)
-    total_positives = int(sorted_true.sum())
-    unique_score_mask = np.r_[sorted_scores[1:] != sorted_scores[:-1], True]
+    if sample_weight is None:
+        true_positives = np.cumsum(sorted_true)
+        false_positives = np.cumsum(1 - sorted_true)
+    else:
+        sorted_weight = np.asarray(sample_weight, dtype=float)[order]
+        true_positives = np.cumsum(sorted_true * sorted_weight)
+        false_positives = np.cumsum((1 - sorted_true) * sorted_weight)
+    total_positives = true_positives[-1] if true_positives.size else 0
+    total_negatives = false_positives[-1] if false_positives.size else 0
+
+    if thresholds is None:
+        unique_score_mask = np.r_[sorted_scores[1:] != sorted_scores[:-1], True]
+        thresholds = sorted_scores[unique_score_mask]
+        tp_at_threshold = true_positives[unique_score_mask]
+        fp_at_threshold = false_positives[unique_score_mask]
+    else:
+        # Number of scores >= threshold, read off the descending sort.
+        n_predicted_positive = np.searchsorted(-sorted_scores, -thresholds, side="right")
+        tp_at_threshold = np.r_[0, true_positives][n_predicted_positive]
+        fp_at_threshold = np.r_[0, false_positives][n_predicted_positive]
 
-    candidate_thresholds = sorted_scores[unique_score_mask]
-    tp_at_threshold = true_positives[unique_score_mask]
-    fp_at_threshold = false_positives[unique_score_mask]
     fn_at_threshold = total_positives - tp_at_threshold
-    denominator = (2 * tp_at_threshold) + fp_at_threshold + fn_at_threshold
-    f1_scores = np.divide(
-        2 * tp_at_threshold,
+    tn_at_threshold = total_negatives - fp_at_threshold
+
+    return thresholds, tp_at_threshold, fp_at_threshold, fn_at_threshold, tn_at_threshold
+
+
+def _safe_ratio(numerator, denominator) -> np.ndarray:
+    """Elementwise ratio that returns 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    return np.divide(
+        numerator,
         denominator,
-        out=np.zeros_like(candidate_thresholds, dtype=float),
+        out=np.zeros(np.broadcast(numerator, denominator).shape, dtype=float),
         where=denominator > 0,
     )
 
-    best_score = np.max(f1_scores)
-    best_thresholds = candidate_thresholds[np.isclose(f1_scores, best_score)]
+
+def _threshold_fbeta(tp, fp, fn, tn, beta: float = 1.0) -> np.ndarray:
+    beta_sq = beta ** 2
+    return _safe_ratio((1 + beta_sq) * tp, (1 + beta_sq) * tp + beta_sq * fn + fp)
+
+
+def _threshold_youden_j(tp, fp, fn, tn) -> np.ndarray:
+    return _safe_ratio(tp, tp + fn) - _safe_ratio(fp, fp + tn)
+
+
+def _threshold_mcc(tp, fp, fn, tn) -> np.ndarray:
+    tp, fp, fn, tn = (np.asarray(count, dtype=float) for count in (tp, fp, fn, tn))
+    denominator = np.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn))
+    return _safe_ratio(tp * tn - fp * fn, denominator)
+
+
+def _threshold_negative_cost(tp, fp, fn, tn, fp_cost: float = 1.0, fn_cost: float = 1.0) -> np.ndarray:
+    # Negated so that every registered scorer is maximized.
+    return -(fp_cost * np.asarray(fp, dtype=float) + fn_cost * np.asarray(fn, dtype=float))
+
+
+def _threshold_precision_at_recall(tp, fp, fn, tn, min_recall: float = 0.8) -> np.ndarray:
+    precision = _safe_ratio(tp, tp + fp)
+    recall = _safe_ratio(tp, tp + fn)
+    return np.where(recall >= min_recall, precision, -np.inf)
+
+
+_THRESHOLD_SCORERS: dict[str, Callable[..., np.ndarray]] = {
+    "f1": _threshold_fbeta,
+    "fbeta": _threshold_fbeta,
+    "youden_j": _threshold_youden_j,
+    "mcc": _threshold_mcc,
+    "cost": _threshold_negative_cost,
+    "precision_at_recall": _threshold_precision_at_recall,
+}
+
+
+def register_threshold_scorer(name: str, scorer: Callable[..., np.ndarray]) -> None:
+    """
+    Register a vectorized threshold scorer for find_best_threshold.
+
+    Parameters
+    ----------
+    name : str
+        Name used to select the scorer, e.g. find_best_threshold(..., scorer=name).
+
+    scorer : callable
+        Function with signature scorer(tp, fp, fn, tn, **kwargs) that receives
+        arrays of confusion counts (one entry per candidate threshold) and
+        returns an array of scores where higher is better.
+    """
+    if not callable(scorer):
+        raise ValueError("scorer must be callable.")
+    _THRESHOLD_SCORERS[name] = scorer
+
+
+def _resolve_threshold_scorer(name: str) -> Callable[..., np.ndarray]:
+    if name not in _THRESHOLD_SCORERS:
+        raise ValueError(
+            f"Unknown threshold scorer '{name}'. "
+            f"Available scorers: {sorted(_THRESHOLD_SCORERS)}."
+        )
+    return _THRESHOLD_SCORERS[name]
+
+
+def _find_best_threshold_from_confusion_counts(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    scorer_name: str = "f1",
+    scorer_kwargs: dict | None = None,
+    thresholds: np.ndarray | None = None,
+    sample_weight: np.ndarray | None = None,
+) -> float:
+    """Score every candidate threshold from cumulative confusion counts."""
+    scorer = _resolve_threshold_scorer(scorer_name)
+    candidate_thresholds, tp, fp, fn, tn = _confusion_counts_at_thresholds(
+        y_true,
+        y_score,
+        thresholds=thresholds,
+        sample_weight=sample_weight,
+    )
+    scores = np.asarray(scorer(tp, fp, fn, tn, **(scorer_kwargs or {})), dtype=float)
+
+    if not np.any(np.isfinite(scores)):
+        raise ValueError(f"Scorer '{scorer_name}' is not attainable at any threshold.")
+
+    best_score = np.max(scores)
+    best_thresholds = candidate_thresholds[np.isclose(scores, best_score)]
 
     return float(np.min(best_thresholds))
 
 
+def _find_best_f1_threshold_from_score_support(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    sample_weight: np.ndarray | None = None,
+) -> float | None:
+    """Search the observed score support exactly for the best (weighted) F1 threshold."""
+    if not _is_binary_label_array(y_true):
+        return None
+
+    return _find_best_threshold_from_confusion_counts(
+        y_true,
+        y_score,
+        scorer_name="f1",
+        sample_weight=sample_weight,
+    )
+
+
 def _build_threshold_search_candidates(
     y_true: np.ndarray,
     y_score: np.ndarray,
     num_thresholds: int,
+    quantile_method: str = "exact",
 ) -> np.ndarray:
     """Build threshold candidates from the score distribution and positive scores."""
     quantile_count = max(2, min(int(num_thresholds), y_score.shape[0]))
-    distribution_thresholds = np.quantile(
-        y_score,
-        np.linspace(0.0, 1.0, quantile_count),
-    )
+    quantile_grid = np.linspace(0.0, 1.0, quantile_count)
+    if quantile_method == "sketch":
+        distribution_thresholds = sketch_quantiles(y_score, quantile_grid)
+    else:
+        distribution_thresholds = np.quantile(y_score, quantile_grid)
     positive_score_thresholds = np.unique(y_score[np.asarray(y_true).reshape(-1) == 1])
     boundary_thresholds = np.array([0.0, float(np.min(y_score)), float(np.max(y_score)), 1.0])
 
@@ -383,7 +530,10 @@ def find_best_threshold(
     y_score,
     num_thresholds: int = 200,
     thresholds=None,
-    scorer: Callable[[np.ndarray, np.ndarray], float] | None = None,
+    scorer: Callable[[np.ndarray, np.ndarray], float] | str | None = None,
+    scorer_kwargs: dict[str, Any] | None = None,
+    sample_weight=None,
+    quantile_method: str = "exact",
 ) -> float:
     """
     Low-level utility to search decision thresholds directly on
@@ -408,25 +558,80 @@ def find_best_threshold(
     thresholds : array-like, optional
         Explicit candidate thresholds.
 
-    scorer : callable, optional
-        Function with signature scorer(y_true, y_pred). Defaults to F1-score.
+    scorer : callable or str, optional
+        Function with signature scorer(y_true, y_pred), or the name of a
+        registered vectorized scorer ("f1", "fbeta", "youden_j", "mcc",
+        "cost", "precision_at_recall", or one added with
+        register_threshold_scorer). Named scorers are evaluated on cumulative
+        confusion counts from one sort, so every observed score is searched
+        exactly when thresholds is not provided. Defaults to F1-score.
+
+    scorer_kwargs : dict, optional
+        Keyword arguments for a named scorer, e.g. {"beta": 2.0} for "fbeta",
+        {"fp_cost": 1.0, "fn_cost": 20.0} for "cost", or {"min_recall": 0.8}
+        for "precision_at_recall".
+
+    sample_weight : array-like, optional
+        Observation weights, e.g. the sample_weight column from
+        create_TTD_data. Named scorers and the default F1 search use weighted
+        cumulative sums. A custom callable scorer receives the weights as a
+        sample_weight keyword argument.
+
+    quantile_method : {"exact", "sketch"}, default="exact"
+        How quantile-based candidate thresholds are built for a custom
+        scorer. "sketch" uses KLLQuantileSketch instead of np.quantile,
+        which avoids a full sort of y_score.
 
     Returns
     -------
     float
-        Threshold with the best score under the chosen scorer.
+        Threshold with the best score under the chosen scorer. Ties resolve
+        to the lowest threshold.
     """
+    if quantile_method not in {"exact", "sketch"}:
+        raise ValueError("quantile_method must be either 'exact' or 'sketch'.")
+
     y_true = np.asarray(y_true).reshape(-1)
     y_score = extract_positive_class_scores(y_score).reshape(-1)
 
     if y_true.shape[0] != y_score.shape[0]:
         raise ValueError("y_true and y_score must have the same number of observations.")
 
+    if sample_weight is not None:
+        sample_weight = np.asarray(sample_weight, dtype=float).reshape(-1)
+        if sample_weight.shape[0] != y_true.shape[0]:
+            raise ValueError("sample_weight and y_true must have the same number of observations.")
+
+    if isinstance(scorer, str):
+        _resolve_threshold_scorer(scorer)
+        if not _is_binary_label_array(y_true):
+            raise ValueError("Named threshold scorers require binary 0/1 labels.")
+        if thresholds is not None:
+            thresholds = np.asarray(thresholds, dtype=float).reshape(-1)
+            if thresholds.size == 0:
+                raise ValueError("thresholds must contain at least one value.")
+            if np.any((thresholds < 0) | (thresholds > 1)):
+                raise ValueError("thresholds must be in the interval [0, 1].")
+            thresholds = np.unique(thresholds)
+
+        return _find_best_threshold_from_confusion_counts(
+            y_true,
+            y_score,
+            scorer_name=scorer,
+            scorer_kwargs=scorer_kwargs,
+            thresholds=thresholds,
+            sample_weight=sample_weight,
+        )
+
     if thresholds is None:
         if num_thresholds < 1:
             raise ValueError("num_thresholds must be at least 1.")
         if scorer is None:
-            exact_f1_threshold = _find_best_f1_threshold_from_score_support(y_true, y_score)
+            exact_f1_threshold = _find_best_f1_threshold_from_score_support(
+                y_true,
+                y_score,
+                sample_weight=sample_weight,
+            )
             if exact_f1_threshold is not None:
                 return exact_f1_threshold
 
@@ -434,6 +639,7 @@ def find_best_threshold(
             y_true=y_true,
             y_score=y_score,
             num_thresholds=num_thresholds,
+            quantile_method=quantile_method,
         )
     else:
         thresholds = np.asarray(thresholds, dtype=float).reshape(-1)
@@ -445,18 +651,20 @@ def find_best_threshold(
         raise ValueError("thresholds must be in the interval [0, 1].")
 
     if scorer is None:
-        scorer = lambda y_true_input, y_pred_input: f1_score(
+        scorer = lambda y_true_input, y_pred_input, **kwargs: f1_score(
             y_true_input,
             y_pred_input,
             zero_division=0,
+            **kwargs,
         )
 
+    scorer_call_kwargs = {} if sample_weight is None else {"sample_weight": sample_weight}
     best_threshold = 0.5
     best_score = -np.inf
 
     for threshold in thresholds:
         y_pred = (y_score >= threshold).astype(int)
-        current_score = float(scorer(y_true, y_pred))
+        current_score = float(scorer(y_true, y_pred, **scorer_call_kwargs))
         if current_score > best_score:
             best_score = current_score
             best_threshold = float(threshold)
@@ -727,6 +935,270 @@ def build_strategy_metric_comparison_text(
     return " ".join(sentences)
 
 
+def _sort_for_fused_metrics(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    threshold: float,
+) -> dict[str, Any]:
+    """Sort scores once (descending) and precompute everything the fused kernel shares."""
+    order = np.argsort(y_score, kind="mergesort")[::-1]
+    sorted_scores = y_score[order]
+    sorted_true = np.asarray(y_true, dtype=float)[order]
+
+    # Log loss per observation, clipped the same way as sklearn's log_loss.
+    eps = np.finfo(float).eps
+    clipped_scores = np.clip(sorted_scores, eps, 1 - eps)
+    sample_log_loss = -(
+        sorted_true * np.log(clipped_scores) + (1 - sorted_true) * np.log1p(-clipped_scores)
+    )
+
+    return {
+        "order": order,
+        "sorted_true": sorted_true,
+        "boundary": np.r_[sorted_scores[1:] != sorted_scores[:-1], True],
+        "n_predicted_positive": int(
+            np.searchsorted(-sorted_scores, -threshold, side="right")
+        ),
+        "sample_log_loss": sample_log_loss,
+    }
+
+
+def _fused_binary_metric_matrix(
+    sorted_inputs: dict[str, Any],
+    sorted_weights: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Evaluate AUC, AP, KS, log loss, and thresholded precision/recall/F1 for
+    each row of a (n_replicates, n_obs) weight matrix in sorted order.
+    """
+    sorted_true = sorted_inputs["sorted_true"]
+    boundary = sorted_inputs["boundary"]
+    n_predicted_positive = sorted_inputs["n_predicted_positive"]
+
+    positive_weights = sorted_weights * sorted_true
+    true_positives = np.cumsum(positive_weights, axis=1)
+    false_positives = np.cumsum(sorted_weights - positive_weights, axis=1)
+    total_positives = true_positives[:, -1]
+    total_negatives = false_positives[:, -1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Ranking metrics only change between distinct score values.
+        if boundary.all():
+            tps, fps = true_positives, false_positives
+        else:
+            tps = true_positives[:, boundary]
+            fps = false_positives[:, boundary]
+        tpr = np.c_[np.zeros(tps.shape[0]), tps / total_positives[:, None]]
+        fpr = np.c_[np.zeros(fps.shape[0]), fps / total_negatives[:, None]]
+        roc_auc = np.sum(np.diff(fpr, axis=1) * (tpr[:, 1:] + tpr[:, :-1]) / 2, axis=1)
+        # KS in percent, matching ks_table and StreamingBinaryMetricAccumulator.
+        ks = np.max(np.abs(tpr - fpr), axis=1) * 100
+        precision_curve = _safe_ratio(tps, tps + fps)
+        average_precision = np.sum(np.diff(tpr, axis=1) * precision_curve, axis=1)
+
+        log_loss_value = (
+            sorted_weights @ sorted_inputs["sample_log_loss"]
+        ) / sorted_weights.sum(axis=1)
+
+    if n_predicted_positive > 0:
+        tp_at_threshold = true_positives[:, n_predicted_positive - 1]
+        fp_at_threshold = false_positives[:, n_predicted_positive - 1]
+    else:
+        tp_at_threshold = np.zeros(sorted_weights.shape[0])
+        fp_at_threshold = np.zeros(sorted_weights.shape[0])
+    fn_at_threshold = total_positives - tp_at_threshold
+
+    return {
+        "roc_auc": roc_auc,
+        "average_precision": average_precision,
+        "ks": ks,
+        "log_loss": log_loss_value,
+        "precision": _safe_ratio(tp_at_threshold, tp_at_threshold + fp_at_threshold),
+        "recall": _safe_ratio(tp_at_threshold, total_positives),
+        "f1": _safe_ratio(2 * tp_at_threshold, 2 * tp_at_threshold + fp_at_threshold + fn_at_threshold),
+    }
+
+
+def _fused_binary_metrics(
+    y_true: np.ndarray,
+    y_score: np.ndarray,
+    threshold: float,
+    sample_weight: np.ndarray | None = None,
+) -> dict[str, float]:
+    """Compute the running-summary test metrics from a single argsort."""
+    sorted_inputs = _sort_for_fused_metrics(y_true, y_score, threshold)
+    if sample_weight is None:
+        sorted_weights = np.ones((1, y_score.shape[0]))
+    else:
+        sorted_weights = np.asarray(sample_weight, dtype=float)[sorted_inputs["order"]][None, :]
+
+    metric_matrix = _fused_binary_metric_matrix(sorted_inputs, sorted_weights)
+
+    return {name: float(values[0]) for name, values in metric_matrix.items()}
+
+
+_FUSED_METRIC_COLUMNS: dict[str, str] = {
+    "roc_auc": "Test ROC-AUC",
+    "average_precision": "Test Average Precision",
+    "log_loss": "Test Log Loss",
+    "ks": "Test KS",
+    "precision": "precision",
+    "recall": "recall",
+    "f1": "F1-score",
+}
+
+
+def _bootstrap_metric_block(
+    sorted_inputs: dict[str, Any],
+    sorted_base_weights: np.ndarray | None,
+    n_replicates: int,
+    seed: np.random.SeedSequence,
+    method: str = "multinomial",
+) -> dict[str, np.ndarray]:
+    """Draw one block of replicate count weights and evaluate the fused metrics."""
+    rng = np.random.default_rng(seed)
+    n_obs = sorted_inputs["sorted_true"].shape[0]
+    if method == "poisson":
+        replicate_weights = rng.poisson(1.0, size=(n_replicates, n_obs)).astype(float)
+    else:
+        # Multinomial counts for every replicate from one flat bincount.
+        draws = rng.integers(0, n_obs, size=(n_replicates, n_obs))
+        draws += (np.arange(n_replicates) * n_obs)[:, None]
+        replicate_weights = np.bincount(
+            draws.ravel(), minlength=n_replicates * n_obs
+        ).reshape(n_replicates, n_obs).astype(float)
+    if sorted_base_weights is not None:
+        replicate_weights *= sorted_base_weights
+
+    return _fused_binary_metric_matrix(sorted_inputs, replicate_weights)
+
+
+def bootstrap_binary_metrics(
+    y_true,
+    y_score,
+    threshold: float = 0.5,
+    n_bootstrap: int = 1000,
+    ci_level: float = 0.95,
+    sample_weight=None,
+    random_state: int = 2025,
+    n_jobs: int | None = None,
+    method: str = "multinomial",
+    max_block_elements: int = 5_000_000,
+) -> pd.DataFrame:
+    """
+    Bootstrap confidence intervals for the running-summary test metrics.
+
+    The scores are sorted once. Each replicate reweights the sorted rows with
+    resampling counts, so a block of replicates is evaluated as one weight
+    matrix by the same fused kernel that build_running_metric_row uses.
+
+    Parameters
+    ----------
+    y_true : array-like
+        True binary labels (0/1).
+
+    y_score : array-like
+        Positive-class scores.
+
+    threshold : float, default=0.5
+        Decision threshold for precision, recall, and F1-score.
+
+    n_bootstrap : int, default=1000
+        Number of bootstrap replicates.
+
+    ci_level : float, default=0.95
+        Two-sided percentile interval coverage.
+
+    sample_weight : array-like, optional
+        Observation weights. Replicate weights are Poisson counts times these.
+
+    random_state : int, default=2025
+        Root seed. Pass the seed given to global_set_seed so intervals are
+        reproducible. Each block of replicates gets its own child seed, so
+        results do not depend on n_jobs.
+
+    n_jobs : int, optional
+        Number of joblib workers for replicate blocks. None or 1 runs
+        sequentially.
+
+    method : {"multinomial", "poisson"}, default="multinomial"
+        "multinomial" draws classic resampling counts. "poisson" draws
+        independent Poisson(1) counts, which approximate them for large n.
+
+    max_block_elements : int, default=5_000_000
+        Upper bound on replicates x observations held in memory per block.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per metric with the point estimate, percentile interval
+        bounds, and bootstrap standard error. "Test KS" is in percent, like
+        ks_table.
+    """
+    y_true = np.asarray(y_true).reshape(-1)
+    y_score = extract_positive_class_scores(y_score).reshape(-1)
+
+    if y_true.shape[0] != y_score.shape[0]:
+        raise ValueError("y_true and y_score must have the same number of observations.")
+    if not _is_binary_label_array(y_true) or np.unique(y_true).shape[0] != 2:
+        raise ValueError("y_true must contain both 0 and 1 labels.")
+    if n_bootstrap < 1:
+        raise ValueError("n_bootstrap must be at least 1.")
+    if not 0 < ci_level < 1:
+        raise ValueError("ci_level must be in the interval (0, 1).")
+    if method not in {"multinomial", "poisson"}:
+        raise ValueError("method must be either 'multinomial' or 'poisson'.")
+
+    sorted_inputs = _sort_for_fused_metrics(y_true, y_score, threshold)
+    sorted_base_weights = None
+    if sample_weight is not None:
+        sample_weight = np.asarray(sample_weight, dtype=float).reshape(-1)
+        if sample_weight.shape[0] != y_true.shape[0]:
+            raise ValueError("sample_weight and y_true must have the same number of observations.")
+        sorted_base_weights = sample_weight[sorted_inputs["order"]]
+
+    point_estimates = _fused_binary_metric_matrix(
+        sorted_inputs,
+        np.ones((1, y_true.shape[0])) if sorted_base_weights is None else sorted_base_weights[None, :],
+    )
+
+    block_size = int(max(1, min(n_bootstrap, max_block_elements // max(1, y_true.shape[0]))))
+    block_sizes = [block_size] * (n_bootstrap // block_size)
+    if n_bootstrap % block_size:
+        block_sizes.append(n_bootstrap % block_size)
+    block_seeds = np.random.SeedSequence(random_state).spawn(len(block_sizes))
+
+    if n_jobs is None or n_jobs == 1:
+        block_results = [
+            _bootstrap_metric_block(sorted_inputs, sorted_base_weights, size, seed, method)
+            for size, seed in zip(block_sizes, block_seeds)
+        ]
+    else:
+        from joblib import Parallel, delayed
+
+        block_results = Parallel(n_jobs=n_jobs)(
+            delayed(_bootstrap_metric_block)(sorted_inputs, sorted_base_weights, size, seed, method)
+            for size, seed in zip(block_sizes, block_seeds)
+        )
+
+    alpha = (1 - ci_level) / 2
+    summary_rows = []
+    for metric_key, metric_column in _FUSED_METRIC_COLUMNS.items():
+        replicates = np.concatenate([block[metric_key] for block in block_results])
+        # Replicates that drop every positive or negative give NaN ranking metrics.
+        lower, upper = np.nanquantile(replicates, [alpha, 1 - alpha])
+        summary_rows.append({
+            "metric": metric_column,
+            "estimate": float(point_estimates[metric_key][0]),
+            "ci_lower": float(lower),
+            "ci_upper": float(upper),
+            "std_error": float(np.nanstd(replicates, ddof=1)) if n_bootstrap > 1 else np.nan,
+            "n_bootstrap": int(np.sum(~np.isnan(replicates))),
+        })
+
+    return pd.DataFrame(summary_rows)
+
+
 def build_running_metric_row(
     strategy_name: str,
     model_name: str,
@@ -736,7 +1208,15 @@ def build_running_metric_row(
     test_scores,
     best_threshold: float | None = None,
     threshold_label: str | None = None,
-    threshold_scorer: Callable[[np.ndarray, np.ndarray], float] | None = None,
+    threshold_scorer: Callable[[np.ndarray, np.ndarray], float] | str | None = None,
+    tuning_sample_weight=None,
+    test_sample_weight=None,
+    include_ks: bool = False,
+    n_bootstrap: int = 0,
+    ci_level: float = 0.95,
+    ci_metrics: tuple[str, ...] = ("Test ROC-AUC", "Test KS", "F1-score"),
+    bootstrap_random_state: int = 2025,
+    bootstrap_n_jobs: int | None = None,
 ) -> dict[str, Any]:
     """
     Build one running-summary row from tuning-set scores and test-set scores.
@@ -745,6 +1225,20 @@ def build_running_metric_row(
     omitted, it falls back to find_best_threshold for low-level reporting
     convenience. In Lab 04, prefer passing an AutoGluon-calibrated threshold
     explicitly so the fallback is not treated as the recommended student path.
+
+    tuning_sample_weight weights the fallback threshold search, and
+    test_sample_weight weights every test metric in the row. With 0/1 labels
+    that contain both classes, the test metrics come from one fused pass over
+    a single sort of test_scores instead of six separate sklearn calls.
+
+    include_ks=True adds a "Test KS" column (in percent, like ks_table). It is
+    off by default so the row keeps the columns of the Lab 04 summary table.
+
+    With n_bootstrap > 0, the row also gets "<metric> CI Lower" and
+    "<metric> CI Upper" columns for each entry in ci_metrics, computed by
+    bootstrap_binary_metrics. A metric named there is added to the row even
+    if it is not one of the default columns, so the default ci_metrics
+    brings "Test KS" along with its interval.
     """
     tuning_scores = extract_positive_class_scores(tuning_scores).reshape(-1)
     test_scores = extract_positive_class_scores(test_scores).reshape(-1)
@@ -753,27 +1247,90 @@ def build_running_metric_row(
     if y_test.shape[0] != test_scores.shape[0]:
         raise ValueError("y_test and test_scores must have the same number of observations.")
 
+    if test_sample_weight is not None:
+        test_sample_weight = np.asarray(test_sample_weight, dtype=float).reshape(-1)
+        if test_sample_weight.shape[0] != y_test.shape[0]:
+            raise ValueError("test_sample_weight and y_test must have the same number of observations.")
+
     if best_threshold is None:
         best_threshold = find_best_threshold(
             y_true=y_tuning,
             y_score=tuning_scores,
             scorer=threshold_scorer,
+            sample_weight=tuning_sample_weight,
         )
 
-    y_pred_test = (test_scores >= best_threshold).astype(int)
+    if _is_binary_label_array(y_test) and np.unique(y_test).shape[0] == 2:
+        fused_metrics = _fused_binary_metrics(
+            y_test,
+            test_scores,
+            threshold=float(best_threshold),
+            sample_weight=test_sample_weight,
+        )
+        row = {
+            "Strategy": strategy_name,
+            "Model": model_name,
+            "Threshold Setting": threshold_label,
+            "Test ROC-AUC": fused_metrics["roc_auc"],
+            "Test Average Precision": fused_metrics["average_precision"],
+            "Test Log Loss": fused_metrics["log_loss"],
+            "Test KS": fused_metrics["ks"],
+            "Threshold": float(best_threshold),
+            "precision": fused_metrics["precision"],
+            "recall": fused_metrics["recall"],
+            "F1-score": fused_metrics["f1"],
+        }
+    else:
+        y_pred_test = (test_scores >= best_threshold).astype(int)
+        fpr, tpr, _ = roc_curve(
+            y_test, test_scores, pos_label=np.unique(y_test)[-1], sample_weight=test_sample_weight
+        )
+        row = {
+            "Strategy": strategy_name,
+            "Model": model_name,
+            "Threshold Setting": threshold_label,
+            "Test ROC-AUC": roc_auc_score(y_test, test_scores, sample_weight=test_sample_weight),
+            "Test Average Precision": average_precision_score(
+                y_test, test_scores, sample_weight=test_sample_weight
+            ),
+            "Test Log Loss": log_loss(
+                y_test, test_scores, labels=[0, 1], sample_weight=test_sample_weight
+            ),
+            "Test KS": float(np.max(np.abs(tpr - fpr)) * 100),
+            "Threshold": float(best_threshold),
+            "precision": precision_score(
+                y_test, y_pred_test, zero_division=0, sample_weight=test_sample_weight
+            ),
+            "recall": recall_score(
+                y_test, y_pred_test, zero_division=0, sample_weight=test_sample_weight
+            ),
+            "F1-score": f1_score(
+                y_test, y_pred_test, zero_division=0, sample_weight=test_sample_weight
+            ),
+        }
 
-    return {
-        "Strategy": strategy_name,
-        "Model": model_name,
-        "Threshold Setting": threshold_label,
-        "Test ROC-AUC": roc_auc_score(y_test, test_scores),
-        "Test Average Precision": average_precision_score(y_test, test_scores),
-        "Test Log Loss": log_loss(y_test, test_scores, labels=[0, 1]),
-        "Threshold": float(best_threshold),
-        "precision": precision_score(y_test, y_pred_test, zero_division=0),
-        "recall": recall_score(y_test, y_pred_test, zero_division=0),
-        "F1-score": f1_score(y_test, y_pred_test, zero_division=0),
-    }
+    if not include_ks:
+        del row["Test KS"]
+
+    if n_bootstrap > 0:
+        ci_df = bootstrap_binary_metrics(
+            y_test,
+            test_scores,
+            threshold=float(best_threshold),
+            n_bootstrap=n_bootstrap,
+            ci_level=ci_level,
+            sample_weight=test_sample_weight,
+            random_state=bootstrap_random_state,
+            n_jobs=bootstrap_n_jobs,
+        ).set_index("metric")
+        for metric_column in ci_metrics:
+            if metric_column not in ci_df.index:
+                raise ValueError(f"No bootstrap interval is available for '{metric_column}'.")
+            row.setdefault(metric_column, float(ci_df.loc[metric_column, "estimate"]))
+            row[f"{metric_column} CI Lower"] = float(ci_df.loc[metric_column, "ci_lower"])
+            row[f"{metric_column} CI Upper"] = float(ci_df.loc[metric_column, "ci_upper"])
+
+    return row
 
 
 def append_running_metric_summary(
@@ -814,11 +1371,21 @@ def append_running_metric_summary(
         "Test ROC-AUC": 4,
         "Test Average Precision": 4,
         "Test Log Loss": 4,
+        "Test KS": 2,
         "Threshold": 4,
         "precision": 4,
         "recall": 4,
         "F1-score": 4,
     }
+    # Bootstrap interval columns inherit the rounding of their metric.
+    round_map = {
+        **{
+            f"{column} CI {bound}": decimals
+            for column, decimals in round_map.items()
+            for bound in ("Lower", "Upper")
+        },
+        **round_map,
+    }
     rounded_df = running_metric_df.round({
         column: decimals
         for column, decimals in round_map.items()
@@ -906,6 +1473,253 @@ def plot_named_calibration_curves(
 # AUTOGLUON SKLEARN WRAPPER
 # =============================================================================
 
+# Per-process LRU cache of loaded predictors keyed by (absolute path, mtime), so
+# joblib workers that unpickle the wrapper for every task load the model once.
+# Dict insertion order doubles as recency order; at most
+# _PREDICTOR_REGISTRY_MAXSIZE predictors are kept alive.
+_PREDICTOR_REGISTRY: Dict[Tuple[str, float], Any] = {}
+_PREDICTOR_REGISTRY_MAXSIZE = 4
+_PREDICTOR_REGISTRY_STATS = {"hits": 0, "misses": 0}
+_PREDICTOR_REGISTRY_LOCK = threading.Lock()
+
+
+def _predictor_mtime(predictor_path: str) -> float:
+    """Modification time of the saved predictor (predictor.pkl when present)."""
+    pkl_path = os.path.join(predictor_path, "predictor.pkl")
+    return os.path.getmtime(pkl_path if os.path.exists(pkl_path) else predictor_path)
+
+
+def _load_registered_predictor(predictor_path: str):
+    """
+    Return the predictor saved at predictor_path, loading it at most once per process.
+    
+    The lock covers only the lookup and the insert, so loads of different
+    predictors in different threads run concurrently. Two threads missing on
+    the same key may both load it; the first insert wins.
+    """
+    predictor_path = os.path.abspath(predictor_path)
+    key = (predictor_path, _predictor_mtime(predictor_path))
+    with _PREDICTOR_REGISTRY_LOCK:
+        predictor = _PREDICTOR_REGISTRY.pop(key, None)
+        if predictor is not None:
+            _PREDICTOR_REGISTRY[key] = predictor  # mark most recently used
+            _PREDICTOR_REGISTRY_STATS["hits"] += 1
+            return predictor
+        _PREDICTOR_REGISTRY_STATS["misses"] += 1
+    
+    loaded = TabularPredictor.load(predictor_path)
+    
+    with _PREDICTOR_REGISTRY_LOCK:
+        predictor = _PREDICTOR_REGISTRY.pop(key, loaded)
+        # A re-saved predictor supersedes any stale entry for the same path.
+        for stale_key in [k for k in _PREDICTOR_REGISTRY if k[0] == predictor_path]:
+            del _PREDICTOR_REGISTRY[stale_key]
+        _PREDICTOR_REGISTRY[key] = predictor
+        while len(_PREDICTOR_REGISTRY) > _PREDICTOR_REGISTRY_MAXSIZE:
+            del _PREDICTOR_REGISTRY[next(iter(_PREDICTOR_REGISTRY))]
+        return predictor
+
+
+def get_predictor_registry_stats() -> Dict[str, Any]:
+    """
+    Report the per-process predictor registry used when unpickling wrappers.
+    
+    Returns
+    -------
+    dict
+        "hits" and "misses" counters, the number of cached predictors
+        ("size", at most "maxsize" with least recently used evicted first)
+        and their paths ("paths"). Counters are per process, so call this
+        inside a joblib worker to inspect that worker's reuse.
+    """
+    with _PREDICTOR_REGISTRY_LOCK:
+        return {
+            "hits": _PREDICTOR_REGISTRY_STATS["hits"],
+            "misses": _PREDICTOR_REGISTRY_STATS["misses"],
+            "size": len(_PREDICTOR_REGISTRY),
+            "maxsize": _PREDICTOR_REGISTRY_MAXSIZE,
+            "paths": sorted({path for path, _ in _PREDICTOR_REGISTRY}),
+        }
+
+
+def clear_predictor_registry() -> None:
+    """Drop all cached predictors in this process and reset the hit/miss counters."""
+    with _PREDICTOR_REGISTRY_LOCK:
+        _PREDICTOR_REGISTRY.clear()
+        _PREDICTOR_REGISTRY_STATS["hits"] = 0
+        _PREDICTOR_REGISTRY_STATS["misses"] = 0
+
+
+def _pack_predictor_dir(predictor_path: str) -> Tuple[str, np.ndarray]:
+    """Tar a saved predictor folder in memory; return (sha256 digest, uint8 array)."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        tar.add(predictor_path, arcname=".")
+    payload = np.frombuffer(buffer.getbuffer(), dtype=np.uint8).copy()
+    return hashlib.sha256(payload).hexdigest(), payload
+
+
+# Extracted archives live in <tmp>/ag_predictor_cache/<owner pid>-<digest>,
+# where the owner is the process that packed the archive. Workers of one
+# parent share a copy, and the owner removes its copies when its parallel call
+# ends and at exit. _ACTIVE_PREDICTOR_SHIPMENTS counts in-flight parallel
+# calls per digest so nested or concurrent calls do not remove a live copy.
+_ACTIVE_PREDICTOR_SHIPMENTS: Dict[str, int] = {}
+_PREDICTOR_SHIPMENT_LOCK = threading.Lock()
+_PREDICTOR_CACHE_ATEXIT_REGISTERED = False
+
+
+def _predictor_cache_root() -> str:
+    """Shared directory holding extracted predictor archives."""
+    return os.path.join(tempfile.gettempdir(), "ag_predictor_cache")
+
+
+def _remove_owned_predictor_copies(owner: int, digest: Optional[str] = None) -> None:
+    """Delete extracted copies packed by process owner (one digest, or all of them)."""
+    cache_root = _predictor_cache_root()
+    if not os.path.isdir(cache_root):
+        return
+    prefix = f"{owner}-" if digest is None else f"{owner}-{digest}"
+    for name in os.listdir(cache_root):
+        if name == prefix or (digest is None and name.startswith(prefix)):
+            shutil.rmtree(os.path.join(cache_root, name), ignore_errors=True)
+
+
+def _prune_orphaned_predictor_copies() -> None:
+    """Delete extracted copies whose owner process no longer exists (POSIX only)."""
+    cache_root = _predictor_cache_root()
+    if os.name != "posix" or not os.path.isdir(cache_root):
+        return
+    for name in os.listdir(cache_root):
+        owner = name.lstrip(".").split("-", 1)[0]
+        if not owner.isdigit():
+            continue
+        try:
+            os.kill(int(owner), 0)
+        except ProcessLookupError:
+            shutil.rmtree(os.path.join(cache_root, name), ignore_errors=True)
+        except OSError:
+            pass
+
+
+def _register_predictor_cache_cleanup() -> None:
+    """Remove this process's extracted copies at interpreter exit (registered once)."""
+    global _PREDICTOR_CACHE_ATEXIT_REGISTERED
+    if not _PREDICTOR_CACHE_ATEXIT_REGISTERED:
+        atexit.register(_remove_owned_predictor_copies, os.getpid())
+        _PREDICTOR_CACHE_ATEXIT_REGISTERED = True
+
+
+def clear_predictor_archive_cache() -> None:
+    """
+    Delete every extracted predictor copy under <tmp>/ag_predictor_cache.
+    
+    Copies made for predictor_transport="archive" are normally removed when
+    the parallel call that shipped them ends, or when the process that
+    packed them exits. Use this (or delete the folder by hand) to clean up
+    after killed sessions. Do not call it while parallel predictions that
+    use archive transport are running.
+    """
+    shutil.rmtree(_predictor_cache_root(), ignore_errors=True)
+
+
+def _unpack_predictor_archive(digest: str, payload: np.ndarray, owner: int) -> str:
+    """
+    Extract a packed predictor into the cache directory of its owner and digest.
+    
+    All workers of one owner process share <tmp>/ag_predictor_cache/
+    <owner>-<digest>, so a model is extracted once per parallel call rather
+    than once per worker. Extraction goes to a scratch folder that is
+    atomically renamed into place; a worker that loses the race discards its
+    copy and uses the winner's, so a half-written predictor is never loaded.
+    """
+    cache_root = _predictor_cache_root()
+    target = os.path.join(cache_root, f"{owner}-{digest}")
+    if os.path.isdir(target):
+        return target
+    
+    _prune_orphaned_predictor_copies()
+    os.makedirs(cache_root, exist_ok=True)
+    scratch = tempfile.mkdtemp(dir=cache_root, prefix=f".{owner}-{digest[:12]}-")
+    try:
+        with tarfile.open(fileobj=io.BytesIO(memoryview(np.ascontiguousarray(payload))), mode="r") as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(scratch, filter="data")
+            else:
+                tar.extractall(scratch)
+        os.replace(scratch, target)
+    except OSError:
+        shutil.rmtree(scratch, ignore_errors=True)
+        if not os.path.isdir(target):
+            raise
+    return target
+
+
+def _autogluon_predict_chunk(wrapper, method: str, chunk: pd.DataFrame) -> np.ndarray:
+    """Score one validated chunk with the wrapped predictor (module-level so it pickles)."""
+    return getattr(wrapper.predictor_, method)(TabularDataset(chunk)).values
+
+
+def _is_deferred_query(X) -> bool:
+    """True for inputs that re-run a query when read (DuckDB relations, Polars LazyFrames)."""
+    try:
+        import duckdb
+        if isinstance(X, duckdb.DuckDBPyRelation):
+            return True
+    except ImportError:
+        pass
+    try:
+        import polars as pl
+        if isinstance(X, pl.LazyFrame):
+            return True
+    except ImportError:
+        pass
+    return False
+
+
+def _convert_tabular_input(X):
+    """
+    Convert Polars, Arrow and DuckDB tabular inputs to pandas via Arrow.
+    
+    Arrow buffers are handed to pandas with split_blocks=True, so numeric
+    columns without nulls are not copied or consolidated. Columns keep NumPy
+    dtypes, which AutoGluon's feature generators expect. Other inputs are
+    returned unchanged.
+    """
+    arrow_data = None
+    try:
+        import polars as pl
+        if isinstance(X, pl.LazyFrame):
+            X = X.collect()
+        if isinstance(X, pl.DataFrame):
+            arrow_data = X.to_arrow()
+    except ImportError:
+        pass
+    
+    if arrow_data is None:
+        try:
+            import duckdb
+            if isinstance(X, duckdb.DuckDBPyRelation):
+                arrow_data = X.arrow()
+        except ImportError:
+            pass
+    
+    if arrow_data is None:
+        try:
+            import pyarrow as pa
+            if isinstance(X, (pa.Table, pa.RecordBatch, pa.RecordBatchReader)):
+                arrow_data = X
+        except ImportError:
+            pass
+    
+    if arrow_data is None:
+        return X
+    if hasattr(arrow_data, "read_all"):
+        arrow_data = arrow_data.read_all()
+    
+    return arrow_data.to_pandas(split_blocks=True)
+
+
 class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
     """
     Scikit-learn compatible wrapper for AutoGluon TabularPredictor.
@@ -932,6 +1746,46 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
     n_jobs : int, optional
         Number of CPU cores to use. If None, uses AutoGluon defaults.
     
+    predict_batch_size : int, optional
+        Score predict/predict_proba inputs in chunks of this many rows and
+        stitch the results together in order, which bounds the memory used
+        by AutoGluon's feature-generator copies. None scores in one call
+        unless predict_n_jobs is set.
+    
+    predict_n_jobs : int, optional
+        Number of joblib worker processes for chunked prediction. Each worker
+        reloads the predictor from predictor_path_. Chunks default to an
+        even split across workers when predict_batch_size is None.
+    
+    input_validation : {"full", "schema"}, default="full"
+        "full" runs check_array and copies every prediction input. "schema"
+        trusts DataFrame inputs: the first frame with a given column list and
+        dtypes is fully validated, and later frames with the same schema are
+        only checked for column names and order, then passed through
+        without a copy. Use it for repeated calls from PDP, SHAP or DiCE.
+    
+    predictor_transport : {"path", "archive"}, default="path"
+        How pickled copies (e.g. joblib workers) get the predictor. "path"
+        sends only predictor_path_, so workers must see the same folder.
+        "archive" packs the predictor folder into an in-memory tar once and
+        ships the bytes as a uint8 array, which joblib memory-maps for large
+        models instead of re-pickling it per task. The bytes are held only
+        for the duration of the wrapper's own parallel calls (chunked
+        prediction, show_pdp). Workers of one process share a single
+        extracted copy in <tmp>/ag_predictor_cache/<pid>-<digest>. It is
+        removed when that parallel call ends, or when the packing process
+        exits for other pickles. Copies left by killed sessions are pruned on
+        the next extraction (POSIX), or can be deleted with
+        clear_predictor_archive_cache() or by removing that folder.
+    
+    Notes
+    -----
+    Unpickled wrappers load their predictor through a per-process registry
+    (see get_predictor_registry_stats). Every wrapper unpickled from the
+    same predictor folder in one process therefore shares a single
+    TabularPredictor object: calling persist(), unpersist() or other
+    mutating methods on one copy affects all of them.
+    
     Attributes
     ----------
     predictor_ : TabularPredictor
@@ -974,11 +1828,17 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
         return tags
     
     def __init__(self, label: str, predictor_args: Optional[Dict] = None, 
-                 fit_args: Optional[Dict] = None, n_jobs: Optional[int] = None):
+                 fit_args: Optional[Dict] = None, n_jobs: Optional[int] = None,
+                 input_validation: str = "full", predict_batch_size: Optional[int] = None,
+                 predict_n_jobs: Optional[int] = None, predictor_transport: str = "path"):
         self.label = label
         self.predictor_args = predictor_args if predictor_args else {}
         self.fit_args = fit_args if fit_args else {}
         self.n_jobs = n_jobs
+        self.input_validation = input_validation
+        self.predict_batch_size = predict_batch_size
+        self.predict_n_jobs = predict_n_jobs
+        self.predictor_transport = predictor_transport
 
     def _validate_features(self, X) -> pd.DataFrame:
         """
@@ -986,7 +1846,7 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
         
         Parameters
         ----------
-        X : array-like, DataFrame, or polars.DataFrame
+        X : array-like, DataFrame, polars.DataFrame, pyarrow.Table, or duckdb relation
             Input data to validate.
         
         Returns
@@ -999,13 +1859,7 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
         ValueError
             If feature names or counts don't match training data.
         """
-        # Handle Polars DataFrame
-        try:
-            import polars as pl
-            if isinstance(X, pl.DataFrame):
-                X = X.to_pandas()
-        except ImportError:
-            pass
+        X = self._convert_prediction_input(X)
         
         if hasattr(X, "columns"):
             cols = list(X.columns)
@@ -1018,30 +1872,177 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
 
         return pd.DataFrame(X, columns=self.feature_names_)
 
-    def __sklearn_is_fitted__(self) -> bool:
-        """Official scikit-learn API for checking fitted status."""
-        return getattr(self, "is_fitted_", False)
+    def _convert_prediction_input(self, X):
+        """
+        Convert Polars, Arrow and DuckDB inputs to pandas, reusing the last conversion.
+        
+        The most recent converted Polars DataFrame or Arrow object is
+        remembered through a weak reference, so scoring the same frame again
+        (e.g. predict then predict_proba, or repeated explainer calls)
+        converts it only once. The cached frame is dropped as soon as the
+        source object is freed. DuckDB relations and Polars LazyFrames are
+        queries, so they are re-executed on every call.
+        """
+        if isinstance(X, (pd.DataFrame, np.ndarray)) or _is_deferred_query(X):
+            return _convert_tabular_input(X)
+        
+        cached = self.__dict__.get("_last_conversion_")
+        if cached is not None and cached[0]() is X:
+            return cached[1]
+        
+        converted = _convert_tabular_input(X)
+        if converted is not X:
+            self_ref = weakref.ref(self)
+            
+            def _drop_conversion(source_ref):
+                wrapper = self_ref()
+                if wrapper is not None:
+                    current = wrapper.__dict__.get("_last_conversion_")
+                    if current is not None and current[0] is source_ref:
+                        wrapper.__dict__.pop("_last_conversion_", None)
+            
+            try:
+                self._last_conversion_ = (weakref.ref(X, _drop_conversion), converted)
+            except TypeError:
+                pass
+        return converted
 
-    def __getstate__(self) -> Dict:
-        """Make the wrapper pickle-friendly for joblib/Parallel."""
-        state = self.__dict__.copy()
-        predictor_path = state.get("predictor_path_", None)
-        predictor = state.get("predictor_", None)
+    def _prepare_prediction_frame(self, X) -> pd.DataFrame:
+        """
+        Convert and validate prediction input, shared by predict and predict_proba.
+        
+        With input_validation="schema", DataFrames whose column list and
+        dtypes were already validated are returned as-is.
+        """
+        input_validation = getattr(self, "input_validation", "full")
+        if input_validation not in {"full", "schema"}:
+            raise ValueError("input_validation must be either 'full' or 'schema'.")
+        
+        X = self._convert_prediction_input(X)
+        
+        if not hasattr(X, "columns"):
+            X_checked = check_array(X, accept_sparse=False, dtype=None)
+            return self._validate_features(X_checked)
+        
+        if input_validation == "full":
+            check_array(X, accept_sparse=False, dtype=None)
+            return self._validate_features(X)
+        
+        if list(X.columns) != self.feature_names_:
+            raise ValueError("Feature names do not match training data.")
+        schema = tuple(zip(X.columns, map(str, X.dtypes)))
+        validated_schemas = self.__dict__.setdefault("_validated_schemas_", set())
+        if schema not in validated_schemas:
+            check_array(X, accept_sparse=False, dtype=None)
+            validated_schemas.add(schema)
+        return X
+
+    def _predict_in_chunks(self, df: pd.DataFrame, method: str, batch_size=None,
+                           n_jobs=None) -> np.ndarray:
+        """Run predictor_.<method> on row chunks of df and stitch the results in order."""
+        batch_size = batch_size if batch_size is not None else getattr(self, "predict_batch_size", None)
+        n_jobs = n_jobs if n_jobs is not None else getattr(self, "predict_n_jobs", None)
+        if batch_size is None and (n_jobs is None or n_jobs == 1):
+            return _autogluon_predict_chunk(self, method, df)
+        
+        with self._shipping_predictor_archive():
+            starts, results = _map_row_chunks(
+                _autogluon_predict_chunk, df, batch_size=batch_size, n_jobs=n_jobs,
+                prefer="processes", func_args=(self, method),
+            )
+        return _stitch_row_chunks(starts, results, len(df))
+
+    def __sklearn_is_fitted__(self) -> bool:
+        """Official scikit-learn API for checking fitted status."""
+        return getattr(self, "is_fitted_", False)
+
+    def __getstate__(self) -> Dict:
+        """Make the wrapper pickle-friendly for joblib/Parallel."""
+        state = self.__dict__.copy()
+        predictor_path = state.get("predictor_path_", None)
+        predictor = state.get("predictor_", None)
         if predictor_path is None and predictor is not None:
             predictor_path = predictor.path
         if predictor_path is not None:
             state["predictor_path_"] = os.path.abspath(predictor_path)
         state["predictor_"] = None
+        # The conversion cache holds a weak reference and a possibly large frame.
+        state.pop("_last_conversion_", None)
+        
+        transport = getattr(self, "predictor_transport", "path")
+        if transport not in {"path", "archive"}:
+            raise ValueError("predictor_transport must be either 'path' or 'archive'.")
+        if transport == "archive" and predictor_path is not None:
+            state["_predictor_archive_"] = self._get_predictor_archive(state["predictor_path_"])
+        else:
+            state.pop("_predictor_archive_", None)
         return state
 
     def __setstate__(self, state: Dict) -> None:
-        """Restore predictor on unpickle."""
+        """Restore predictor on unpickle, reusing this process's registry entry if present."""
         self.__dict__.update(state)
+        archive = self.__dict__.get("_predictor_archive_", None)
+        if archive is not None:
+            # Unpickled copies keep only the extracted folder, not the bytes.
+            self.predictor_path_ = _unpack_predictor_archive(archive[1], archive[2], archive[3])
+            del self._predictor_archive_
         predictor_path = self.__dict__.get("predictor_path_", None)
         if predictor_path:
-            self.predictor_ = TabularPredictor.load(predictor_path)
+            self.predictor_ = _load_registered_predictor(predictor_path)
         self.is_fitted_ = predictor_path is not None
 
+    def _get_predictor_archive(self, predictor_path: str) -> Tuple[Tuple[str, float], str, np.ndarray, int]:
+        """
+        Return the archive of the active parallel call, or pack predictor_path afresh.
+        
+        The archive is (key, digest, payload, owner pid); workers extract it
+        under the owner's pid so the owner can remove the copy afterwards.
+        """
+        archive = self.__dict__.get("_predictor_archive_", None)
+        if archive is not None and not os.path.exists(predictor_path):
+            # The folder was cleaned up after packing; the archive is still usable.
+            return archive
+        key = (predictor_path, _predictor_mtime(predictor_path))
+        if archive is None or archive[0] != key:
+            _register_predictor_cache_cleanup()
+            archive = (key,) + _pack_predictor_dir(predictor_path) + (os.getpid(),)
+        return archive
+
+    @contextmanager
+    def _shipping_predictor_archive(self):
+        """
+        Pack the predictor once for the duration of a parallel call.
+        
+        Every task pickle inside the block reuses the same uint8 array, so
+        joblib memory-maps it once. On exit the bytes are released and the
+        workers' extracted copy is removed, unless another parallel call in
+        this process is still shipping the same model. A no-op unless
+        predictor_transport="archive".
+        """
+        predictor = getattr(self, "predictor_", None)
+        predictor_path = getattr(self, "predictor_path_", None) or getattr(predictor, "path", None)
+        if (getattr(self, "predictor_transport", "path") != "archive" or predictor_path is None
+                or "_predictor_archive_" in self.__dict__):
+            yield
+            return
+        
+        archive = self._get_predictor_archive(os.path.abspath(predictor_path))
+        digest = archive[1]
+        with _PREDICTOR_SHIPMENT_LOCK:
+            _ACTIVE_PREDICTOR_SHIPMENTS[digest] = _ACTIVE_PREDICTOR_SHIPMENTS.get(digest, 0) + 1
+        self._predictor_archive_ = archive
+        try:
+            yield
+        finally:
+            self.__dict__.pop("_predictor_archive_", None)
+            with _PREDICTOR_SHIPMENT_LOCK:
+                _ACTIVE_PREDICTOR_SHIPMENTS[digest] -= 1
+                last_shipment = _ACTIVE_PREDICTOR_SHIPMENTS[digest] == 0
+                if last_shipment:
+                    del _ACTIVE_PREDICTOR_SHIPMENTS[digest]
+            if last_shipment:
+                _remove_owned_predictor_copies(archive[3], digest)
+
     @property
     def predictor(self):
         """Backward-compatible access to the fitted AutoGluon predictor."""
@@ -1078,6 +2079,7 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
             train_df = pd.DataFrame(X_checked, columns=self.feature_names_)
 
         self.n_features_in_ = train_df.shape[1]
+        self._validated_schemas_ = set()
 
         predictor_args = dict(self.predictor_args)
         if sample_weight is not None:
@@ -1111,14 +2113,20 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
 
         return self 
 
-    def predict(self, X):
+    def predict(self, X, batch_size: Optional[int] = None, n_jobs: Optional[int] = None):
         """
         Make class predictions.
         
         Parameters
         ----------
-        X : {array-like, sparse matrix, polars.DataFrame} of shape (n_samples, n_features)
+        X : {array-like, polars.DataFrame, pyarrow.Table, duckdb relation} of shape (n_samples, n_features)
             Input data.
+        
+        batch_size : int, optional
+            Rows per chunk. Defaults to predict_batch_size.
+        
+        n_jobs : int, optional
+            Worker processes for chunks. Defaults to predict_n_jobs.
             
         Returns
         -------
@@ -1126,32 +2134,24 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
             Predicted class labels.
         """
         check_is_fitted(self)
-        
-        # Handle Polars DataFrame
-        try:
-            import polars as pl
-            if isinstance(X, pl.DataFrame):
-                X = X.to_pandas()
-        except ImportError:
-            pass
-        
-        if hasattr(X, "columns"):
-            check_array(X, accept_sparse=False, dtype=None)
-            df = self._validate_features(X)
-        else:
-            X_checked = check_array(X, accept_sparse=False, dtype=None)
-            df = self._validate_features(X_checked)
+        df = self._prepare_prediction_frame(X)
 
-        return self.predictor_.predict(TabularDataset(df)).values
+        return self._predict_in_chunks(df, "predict", batch_size=batch_size, n_jobs=n_jobs)
 
-    def predict_proba(self, X):
+    def predict_proba(self, X, batch_size: Optional[int] = None, n_jobs: Optional[int] = None):
         """
         Predict class probabilities.
         
         Parameters
         ----------
-        X : {array-like, sparse matrix, polars.DataFrame} of shape (n_samples, n_features)
+        X : {array-like, polars.DataFrame, pyarrow.Table, duckdb relation} of shape (n_samples, n_features)
             Input data.
+        
+        batch_size : int, optional
+            Rows per chunk. Defaults to predict_batch_size.
+        
+        n_jobs : int, optional
+            Worker processes for chunks. Defaults to predict_n_jobs.
             
         Returns
         -------
@@ -1159,23 +2159,9 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
             Class probabilities.
         """
         check_is_fitted(self)
-        
-        # Handle Polars DataFrame
-        try:
-            import polars as pl
-            if isinstance(X, pl.DataFrame):
-                X = X.to_pandas()
-        except ImportError:
-            pass
-        
-        if hasattr(X, "columns"):
-            check_array(X, accept_sparse=False, dtype=None)
-            df = self._validate_features(X)
-        else:
-            X_checked = check_array(X, accept_sparse=False, dtype=None)
-            df = self._validate_features(X_checked)
+        df = self._prepare_prediction_frame(X)
 
-        return self.predictor_.predict_proba(TabularDataset(df)).values
+        return self._predict_in_chunks(df, "predict_proba", batch_size=batch_size, n_jobs=n_jobs)
 
     def get_params(self, deep: bool = True) -> Dict:
         """Get parameters for this estimator."""
@@ -1183,7 +2169,11 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
             'label': self.label,
             'predictor_args': self.predictor_args,
             'fit_args': self.fit_args,
-            'n_jobs': self.n_jobs
+            'n_jobs': self.n_jobs,
+            'input_validation': getattr(self, 'input_validation', 'full'),
+            'predict_batch_size': getattr(self, 'predict_batch_size', None),
+            'predict_n_jobs': getattr(self, 'predict_n_jobs', None),
+            'predictor_transport': getattr(self, 'predictor_transport', 'path')
         }
 
     def set_params(self, **params) -> 'AutoGluonSklearnWrapper':
@@ -1197,6 +2187,14 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
                 self.fit_args = value
             elif param == 'n_jobs':
                 self.n_jobs = value
+            elif param == 'input_validation':
+                self.input_validation = value
+            elif param == 'predict_batch_size':
+                self.predict_batch_size = value
+            elif param == 'predict_n_jobs':
+                self.predict_n_jobs = value
+            elif param == 'predictor_transport':
+                self.predictor_transport = value
             else:
                 setattr(self, param, value)
         return self
@@ -1221,7 +2219,10 @@ class AutoGluonSklearnWrapper(BaseEstimator, ClassifierMixin):
                 raise ValueError("Feature names mismatch between fit and predict")
 
 
-def load_autogluon(folder_path: str, persist_model: bool = False) -> AutoGluonSklearnWrapper:
+def load_autogluon(folder_path: str, persist_model: bool = False,
+                   input_validation: str = "full", predict_batch_size: Optional[int] = None,
+                   predict_n_jobs: Optional[int] = None,
+                   predictor_transport: str = "path") -> AutoGluonSklearnWrapper:
     """
     Load a pre-trained AutoGluon TabularPredictor into an AutoGluonSklearnWrapper.
     
@@ -1234,6 +2235,19 @@ def load_autogluon(folder_path: str, persist_model: bool = False) -> AutoGluonSk
         If True, calls predictor.persist() after loading to keep models in memory
         for faster predictions.
     
+    input_validation : {"full", "schema"}, default="full"
+        Prediction input validation mode for the wrapper. See
+        AutoGluonSklearnWrapper.
+    
+    predict_batch_size : int, optional
+        Rows per prediction chunk. See AutoGluonSklearnWrapper.
+    
+    predict_n_jobs : int, optional
+        Worker processes for chunked prediction. See AutoGluonSklearnWrapper.
+    
+    predictor_transport : {"path", "archive"}, default="path"
+        How pickled copies receive the predictor. See AutoGluonSklearnWrapper.
+    
     Returns
     -------
     AutoGluonSklearnWrapper
@@ -1260,7 +2274,11 @@ def load_autogluon(folder_path: str, persist_model: bool = False) -> AutoGluonSk
             classes = np.array(predictor.class_labels)
 
         # Create wrapper instance
-        wrapper = AutoGluonSklearnWrapper(label=label, predictor_args={}, fit_args={})
+        wrapper = AutoGluonSklearnWrapper(label=label, predictor_args={}, fit_args={},
+                                          input_validation=input_validation,
+                                          predict_batch_size=predict_batch_size,
+                                          predict_n_jobs=predict_n_jobs,
+                                          predictor_transport=predictor_transport)
         wrapper.predictor_ = predictor
         wrapper.classes_ = classes
         wrapper.n_features_in_ = n_features
@@ -1344,22 +2362,24 @@ def show_pdp(wrappedAGModel: BaseEstimator,
         else:
             X_sample = df.sample(min(sampSize, len(df)), random_state=2025)
 
-        disp = PartialDependenceDisplay.from_estimator(
-            estimator=wrappedAGModel,
-            X=X_sample,
-            features=[feature],
-            categorical_features=list_categ_features if list_categ_features else None,
-            method='brute',
-            kind=plot_kind,
-            subsample=ice_subsample,
-            ice_lines_kw=ice_lines_kw,
-            pd_line_kw=pd_line_kw,
-            percentiles=(0.0001, 0.9999),
-            grid_resolution=100,
-            ax=ax,
-            random_state=2025,
-            n_jobs=n_jobs
-        )
+        shipping = getattr(wrappedAGModel, "_shipping_predictor_archive", None)
+        with shipping() if shipping is not None else nullcontext():
+            disp = PartialDependenceDisplay.from_estimator(
+                estimator=wrappedAGModel,
+                X=X_sample,
+                features=[feature],
+                categorical_features=list_categ_features if list_categ_features else None,
+                method='brute',
+                kind=plot_kind,
+                subsample=ice_subsample,
+                ice_lines_kw=ice_lines_kw,
+                pd_line_kw=pd_line_kw,
+                percentiles=(0.0001, 0.9999),
+                grid_resolution=100,
+                ax=ax,
+                random_state=2025,
+                n_jobs=n_jobs
+            )
 
         plot_title = f"Partial Dependence for {feature}"
         if show_ice:
@@ -1509,7 +2529,46 @@ def show_calibration_plot(estimator, X, y, name: str = 'Model',
 # CREDIT SCORING UTILITIES
 # =============================================================================
 
-def calculate_score(prob_default: np.ndarray, pdo: int = 40, base_score: int = 600) -> np.ndarray:
+SCORE_MIN = 300
+SCORE_MAX = 850
+
+
+@lru_cache(maxsize=32)
+def _score_to_probability_table(pdo: int, base_score: int) -> np.ndarray:
+    """Read-only PD lookup indexed directly by integer score (entries below 300 are NaN)."""
+    table = np.full(SCORE_MAX + 1, np.nan)
+    scores = np.arange(SCORE_MIN, SCORE_MAX + 1, dtype=float)
+    factor = pdo / np.log(2)
+    odds_bad = np.exp((scores - base_score) / -factor)
+    table[SCORE_MIN:] = odds_bad / (1 + odds_bad)
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=32)
+def _score_band_table(band_edges: tuple) -> np.ndarray:
+    """Read-only band-code lookup indexed directly by integer score."""
+    scores = np.arange(SCORE_MAX + 1)
+    codes = np.searchsorted(np.asarray(band_edges), scores, side='right') - 1
+    codes[(scores < band_edges[0]) | (scores >= band_edges[-1])] = -1
+    table = codes.astype(np.int16)
+    table.setflags(write=False)
+    return table
+
+
+def _is_integer_score_array(score) -> bool:
+    """Return True for integer arrays whose values all fall in [300, 850]."""
+    return (
+        isinstance(score, np.ndarray)
+        and np.issubdtype(score.dtype, np.integer)
+        and score.size > 0
+        and score.min() >= SCORE_MIN
+        and score.max() <= SCORE_MAX
+    )
+
+
+def calculate_score(prob_default: np.ndarray, pdo: int = 40, base_score: int = 600,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Convert probability of default to a 3-digit credit score.
     
@@ -1529,24 +2588,44 @@ def calculate_score(prob_default: np.ndarray, pdo: int = 40, base_score: int = 6
     base_score : int, default=600
         Base score corresponding to odds of 1:1.
     
+    out : np.ndarray, optional
+        Preallocated array for the scores, e.g. an int16 buffer reused
+        across batches. Intermediate steps are done in place in one float
+        work array, with the same arithmetic as the default path.
+    
     Returns
     -------
     np.ndarray
         Credit scores clipped to range [300, 850].
     """
     eps = 1e-9
-    prob_default = np.clip(prob_default, eps, 1 - eps)
-    odds_bad = prob_default / (1 - prob_default)
     factor = pdo / np.log(2)
-    score = base_score - factor * np.log(odds_bad)
-    return np.clip(score, 300, 850).astype(int)
-
-
-def score_to_probability(score: np.ndarray, pdo: int = 40, base_score: int = 600) -> np.ndarray:
+    if out is None:
+        prob_default = np.clip(prob_default, eps, 1 - eps)
+        odds_bad = prob_default / (1 - prob_default)
+        score = base_score - factor * np.log(odds_bad)
+        return np.clip(score, SCORE_MIN, SCORE_MAX).astype(int)
+
+    # PD is continuous, so there is no lookup table here; reuse one work array instead.
+    work = np.clip(prob_default, eps, 1 - eps)
+    np.divide(work, 1 - work, out=work)
+    np.log(work, out=work)
+    np.multiply(factor, work, out=work)
+    np.subtract(base_score, work, out=work)
+    np.clip(work, SCORE_MIN, SCORE_MAX, out=work)
+    np.copyto(out, work, casting='unsafe')
+    return out
+
+
+def score_to_probability(score: np.ndarray, pdo: int = 40, base_score: int = 600,
+                         out: Optional[np.ndarray] = None,
+                         use_lookup: Optional[bool] = None) -> np.ndarray:
     """
     Convert credit score back to probability of default.
     
-    Inverse of calculate_score function.
+    Inverse of calculate_score function. Integer scores in [300, 850] are
+    looked up in a cached table keyed by (pdo, base_score) instead of
+    evaluating exp for every element.
     
     Parameters
     ----------
@@ -1559,54 +2638,364 @@ def score_to_probability(score: np.ndarray, pdo: int = 40, base_score: int = 600
     base_score : int, default=600
         Base score corresponding to odds of 1:1.
     
+    out : np.ndarray, optional
+        Preallocated float array for the result (float64 avoids a temporary
+        on the lookup path; other float dtypes are filled by casting).
+    
+    use_lookup : bool, optional
+        Force (True) or disable (False) the lookup table. By default it is
+        used whenever score is an integer array within [300, 850].
+    
     Returns
     -------
     np.ndarray
         Probability of default [0, 1].
     """
-    factor = pdo / np.log(2)
-    odds_bad = np.exp((score - base_score) / -factor)
-    prob_default = odds_bad / (1 + odds_bad)
-    return prob_default
-
-
-# =============================================================================
-# KS TABLE AND EVALUATION UTILITIES
-# =============================================================================
+    if use_lookup is None:
+        use_lookup = _is_integer_score_array(score)
+    elif use_lookup and not _is_integer_score_array(score):
+        raise ValueError("use_lookup=True requires integer scores within [300, 850].")
+
+    if use_lookup:
+        table = _score_to_probability_table(pdo, base_score)
+        if out is None or out.dtype == table.dtype:
+            return np.take(table, score, out=out)
+        np.copyto(out, np.take(table, score), casting='same_kind')
+        return out
 
-def ks_table(data: pd.DataFrame, y_true_col: str, y_pred_col: str, 
-             n_bins: int = 10, is_score: bool = False, 
-             sample_weight_col: Optional[str] = None) -> pd.DataFrame:
+    factor = pdo / np.log(2)
+    if out is None:
+        odds_bad = np.exp((score - base_score) / -factor)
+        prob_default = odds_bad / (1 + odds_bad)
+        return prob_default
+
+    # odds / (1 + odds) == 1 / (1 + 1 / odds); every step writes into out,
+    # so no temporary array is allocated.
+    np.subtract(score, base_score, out=out)
+    np.divide(out, factor, out=out)
+    np.exp(out, out=out)
+    np.add(out, 1, out=out)
+    np.reciprocal(out, out=out)
+    return out
+
+
+def assign_score_bands(score: np.ndarray,
+                       band_edges: Tuple[int, ...] = (300, 580, 670, 740, 800, 851),
+                       labels: Optional[List[str]] = None,
+                       out: Optional[np.ndarray] = None):
     """
-    Generate a KS (Kolmogorov-Smirnov) table for model evaluation.
+    Assign credit scores to score bands.
+    
+    Band i holds scores in [band_edges[i], band_edges[i + 1]). Integer scores
+    in [300, 850] are mapped by indexing a cached lookup table, so repeated
+    calls cost a single gather.
     
     Parameters
     ----------
-    data : pd.DataFrame
-        DataFrame containing true labels and predicted probabilities/scores.
+    score : array-like
+        Credit scores.
     
-    y_true_col : str
-        Name of column with true binary labels (0 or 1).
+    band_edges : tuple of int, default=(300, 580, 670, 740, 800, 851)
+        Increasing band edges. Scores outside the edges get band code -1.
     
-    y_pred_col : str
-        Name of column with predicted probabilities (higher=riskier) 
-        or scores (lower=riskier).
+    labels : list of str, optional
+        Band names, one per band. If given, a pandas Categorical is returned.
     
-    n_bins : int, default=10
-        Number of bins to divide values into.
+    out : np.ndarray, optional
+        Preallocated array of any integer dtype for the band codes. Codes
+        are cast into it, so the result does not depend on the score dtype.
     
-    is_score : bool, default=False
-        True if y_pred_col contains scores (lower=riskier),
-        False if it contains probabilities (higher=riskier).
+    Returns
+    -------
+    np.ndarray or pd.Categorical
+        Band codes (0 = lowest band), or labelled bands if labels is given.
+    """
+    band_edges = tuple(int(edge) for edge in band_edges)
+    if len(band_edges) < 2 or any(b <= a for a, b in zip(band_edges, band_edges[1:])):
+        raise ValueError("band_edges must contain at least two strictly increasing values.")
+    if labels is not None and len(labels) != len(band_edges) - 1:
+        raise ValueError("labels must have one entry per band.")
+
+    if _is_integer_score_array(score):
+        table = _score_band_table(band_edges)
+        if out is None or out.dtype == table.dtype:
+            codes = np.take(table, score, out=out)
+        else:
+            np.copyto(out, np.take(table, score), casting='unsafe')
+            codes = out
+    else:
+        score = np.asarray(score, dtype=float)
+        codes = np.searchsorted(np.asarray(band_edges), score, side='right') - 1
+        codes[(score < band_edges[0]) | (score >= band_edges[-1]) | np.isnan(score)] = -1
+        if out is not None:
+            np.copyto(out, codes, casting='unsafe')
+            codes = out
+
+    if labels is not None:
+        return pd.Categorical.from_codes(codes, categories=list(labels))
+
+    return codes
+
+
+def score_parquet_file(
+    model,
+    input_path: str,
+    output_path: str,
+    feature_cols: Optional[List[str]] = None,
+    id_cols: Optional[List[str]] = None,
+    batch_size: int = 100_000,
+    pdo: int = 40,
+    base_score: int = 600,
+    model_name: Optional[str] = None,
+    pd_col: str = "prob_default",
+    score_col: str = "credit_score",
+    compression: str = "zstd",
+    verbose: bool = True,
+) -> Dict[str, Any]:
+    """
+    Score a Parquet dataset in batches and write PDs and credit scores to Parquet.
     
-    sample_weight_col : str, optional
-        Name of column containing sample weights.
+    Record batches are streamed from input_path, scored with predict_proba,
+    converted to PDO-based scores with calculate_score, and appended to a
+    single output file. Only one batch is held in memory at a time, so memory
+    use does not grow with the input size.
+    
+    Parameters
+    ----------
+    model : estimator
+        Fitted model with predict_proba, e.g. AutoGluonSklearnWrapper or
+        TabularPredictor.
+    
+    input_path : str
+        Parquet file, directory, or list of files readable by pyarrow.dataset.
+    
+    output_path : str
+        Destination Parquet file.
+    
+    feature_cols : list of str, optional
+        Columns passed to the model. Defaults to model.feature_names_ when
+        available, otherwise every input column not in id_cols.
+    
+    id_cols : list of str, optional
+        Columns copied unchanged to the output, e.g. a loan identifier.
+    
+    batch_size : int, default=100_000
+        Maximum rows per batch.
+    
+    pdo : int, default=40
+        Points to Double the Odds.
+    
+    base_score : int, default=600
+        Base score corresponding to odds of 1:1.
+    
+    model_name : str, optional
+        AutoGluon model name to score instead of the best model.
+    
+    pd_col : str, default="prob_default"
+        Output column name for the predicted PD (float32).
+    
+    score_col : str, default="credit_score"
+        Output column name for the credit score (int16).
+    
+    compression : str, default="zstd"
+        Parquet compression codec for the output file.
+    
+    verbose : bool, default=True
+        If True, print progress after each batch.
     
     Returns
     -------
-    pd.DataFrame
-        KS table with cumulative bad/good percentages and KS statistic.
+    dict
+        Summary with output_path, n_rows and n_batches.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    id_cols = list(id_cols) if id_cols else []
+    dataset = ds.dataset(input_path, format="parquet")
+
+    if feature_cols is None:
+        feature_cols = getattr(model, "feature_names_", None)
+    if feature_cols is None:
+        feature_cols = [name for name in dataset.schema.names if name not in id_cols]
+    feature_cols = list(feature_cols)
+
+    missing_cols = [col for col in feature_cols + id_cols if col not in dataset.schema.names]
+    if missing_cols:
+        raise ValueError(f"Columns not found in {input_path}: {missing_cols}")
+
+    read_cols = list(dict.fromkeys(id_cols + feature_cols))
+    output_schema = pa.schema(
+        [dataset.schema.field(col) for col in id_cols]
+        + [pa.field(pd_col, pa.float32()), pa.field(score_col, pa.int16())]
+    )
+
+    n_rows = 0
+    n_batches = 0
+    with pq.ParquetWriter(output_path, output_schema, compression=compression) as writer:
+        for batch in dataset.to_batches(columns=read_cols, batch_size=batch_size):
+            if batch.num_rows == 0:
+                continue
+
+            features = batch.select(feature_cols).to_pandas()
+            prob_default = predict_positive_class_scores(model, features, model_name=model_name)
+            scores = calculate_score(
+                prob_default, pdo=pdo, base_score=base_score,
+                out=np.empty(prob_default.shape[0], dtype=np.int16),
+            )
+
+            columns = [batch.column(col) for col in id_cols] + [
+                pa.array(prob_default.astype(np.float32)),
+                pa.array(scores),
+            ]
+            writer.write_table(pa.Table.from_arrays(columns, schema=output_schema))
+
+            n_rows += batch.num_rows
+            n_batches += 1
+            if verbose:
+                print(f"  Scored batch {n_batches}: {n_rows:,} rows written")
+
+    if verbose:
+        print(f"Wrote {n_rows:,} scored rows to {output_path}")
+
+    return {"output_path": output_path, "n_rows": n_rows, "n_batches": n_batches}
+
+
+# =============================================================================
+# KS TABLE AND EVALUATION UTILITIES
+# =============================================================================
+
+def _prepare_ks_arrays(
+    data: pd.DataFrame,
+    y_true_col: str,
+    y_pred_col: str,
+    sample_weight_col: Optional[str] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pull label, prediction, and weight columns as float arrays without copying the frame."""
+    y_pred = pd.to_numeric(data[y_pred_col], errors='coerce').to_numpy(dtype=float)
+    y_true = pd.to_numeric(data[y_true_col], errors='coerce').to_numpy(dtype=float)
+    if sample_weight_col:
+        weight = pd.to_numeric(data[sample_weight_col], errors='coerce').to_numpy(dtype=float)
+        weight = np.where(np.isnan(weight), 1.0, weight)
+    else:
+        weight = np.ones(y_pred.shape[0], dtype=float)
+
+    valid = ~np.isnan(y_pred)
+    if not valid.all():
+        y_true, y_pred, weight = y_true[valid], y_pred[valid], weight[valid]
+
+    return y_true, y_pred, weight
+
+
+def _rank_bin_starts(n_rows: int, n_bins: int) -> np.ndarray:
+    """
+    Return start offsets of equal-count rank bins over sorted positions.
+
+    Ranks 1..n are cut at evenly spaced edges, so bin sizes differ by at
+    most one. This follows pd.qcut(rank(method='first')) but not its
+    floating-point edges, so a few bins can be one row larger or smaller
+    than the duckdb engine's qcut bins.
     """
+    # Rounding absorbs float noise so integer edges stay integer.
+    ranks_at_edges = np.unique(np.round(1.0 + (n_rows - 1) * np.linspace(0.0, 1.0, n_bins + 1), 8))
+    if ranks_at_edges.shape[0] < 2:
+        return np.array([0])
+    # Bin i holds ranks in (edge_i, edge_i+1], so it starts after floor(edge_i) rows.
+    # Empty bins are dropped, as they are in a GROUP BY over qcut labels.
+    starts = np.unique(np.r_[0, np.floor(ranks_at_edges[1:-1]).astype(int)])
+    return starts[starts < n_rows]
+
+
+def _max_ks_from_sorted(
+    sorted_pred: np.ndarray,
+    sorted_bads: np.ndarray,
+    sorted_goods: np.ndarray,
+) -> float:
+    """Exact (unbinned) max KS in percent from weighted bads/goods sorted by prediction."""
+    total_bads = sorted_bads.sum()
+    total_goods = sorted_goods.sum()
+    if sorted_pred.shape[0] == 0 or total_bads <= 1e-9 or total_goods <= 1e-9:
+        return np.nan
+
+    # Only evaluate the split after the last row of each tied prediction value.
+    boundary = np.r_[sorted_pred[1:] != sorted_pred[:-1], True]
+    cum_bads_pct = np.cumsum(sorted_bads)[boundary] / total_bads
+    cum_goods_pct = np.cumsum(sorted_goods)[boundary] / total_goods
+
+    return float(np.max(np.abs(cum_bads_pct - cum_goods_pct)) * 100)
+
+
+def _ks_bins_numpy(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    weight: np.ndarray,
+    n_bins: int,
+) -> tuple[pd.DataFrame, float]:
+    """Sort once and build per-bin aggregates plus the exact max KS."""
+    order = np.argsort(y_pred, kind='mergesort')
+    sorted_pred = y_pred[order]
+    sorted_weight = weight[order]
+    sorted_bads = np.nan_to_num(y_true[order] * sorted_weight, nan=0.0)
+
+    starts = _rank_bin_starts(sorted_pred.shape[0], n_bins)
+    bin_sizes = np.diff(np.r_[starts, sorted_pred.shape[0]])
+    ks_df = pd.DataFrame({
+        'bin': np.arange(starts.shape[0]),
+        'min_value': sorted_pred[starts],
+        'max_value': sorted_pred[np.r_[starts[1:], sorted_pred.shape[0]] - 1],
+        'avg_value': np.add.reduceat(sorted_pred, starts) / bin_sizes,
+        'count': np.add.reduceat(sorted_weight, starts),
+        'bads': np.add.reduceat(sorted_bads, starts),
+    })
+
+    exact_ks = _max_ks_from_sorted(sorted_pred, sorted_bads, sorted_weight - sorted_bads)
+
+    return ks_df, exact_ks
+
+
+def _ks_bins_sketch(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    weight: np.ndarray,
+    n_bins: int,
+    sketch_k: int = 200,
+) -> pd.DataFrame:
+    """Build approximate equal-count bins from sketch quantiles without sorting."""
+    edges = np.unique(
+        sketch_quantiles(y_pred, np.linspace(0.0, 1.0, n_bins + 1), k=sketch_k)
+    )
+    # Bin i holds values in [edge_i, edge_i+1); the last bin also takes the max.
+    bin_codes = np.searchsorted(edges[1:-1], y_pred, side='right')
+    bads = np.nan_to_num(y_true * weight, nan=0.0)
+
+    ks_df = pd.DataFrame({
+        'bin': bin_codes,
+        'value': y_pred,
+        'count': weight,
+        'bads': bads,
+    }).groupby('bin', sort=True).agg(
+        min_value=('value', 'min'),
+        max_value=('value', 'max'),
+        avg_value=('value', 'mean'),
+        count=('count', 'sum'),
+        bads=('bads', 'sum'),
+    ).reset_index()
+
+    return ks_df
+
+
+def _ks_bins_duckdb(
+    data: pd.DataFrame,
+    y_true_col: str,
+    y_pred_col: str,
+    n_bins: int,
+    sample_weight_col: Optional[str] = None,
+) -> pd.DataFrame:
+    """Rank/qcut in pandas and aggregate bins in DuckDB."""
     import duckdb
     
     # Select relevant columns
@@ -1641,11 +3030,8 @@ def ks_table(data: pd.DataFrame, y_true_col: str, y_pred_col: str,
         bin_size = max(1, len(df) // n_bins)
         df['bin'] = ((ranks - 1) // bin_size).clip(upper=n_bins - 1).astype(int)
     
-    # Determine sort order
-    sort_ascending = is_score
-    
     # Aggregate using duckdb
-    ks_df = duckdb.query("""
+    return duckdb.query("""
         SELECT
             bin,
             MIN(y_pred) AS min_value,
@@ -1656,8 +3042,21 @@ def ks_table(data: pd.DataFrame, y_true_col: str, y_pred_col: str,
         FROM df
         GROUP BY bin
     """).to_df()
-    
-    ks_df = ks_df.reset_index().sort_values("min_value", ascending=sort_ascending)
+
+
+def _finalize_ks_table(
+    ks_df: pd.DataFrame,
+    value_name: str,
+    is_score: bool,
+    verbose: bool = True,
+) -> pd.DataFrame:
+    """Order per-bin aggregates by risk and add cumulative percentages and KS."""
+    # Determine sort order
+    sort_ascending = is_score
+    # Tied prediction values can span bins, so max_value and bin break ties.
+    ks_df = ks_df.reset_index(drop=True).sort_values(
+        ["min_value", "max_value", "bin"], ascending=sort_ascending, kind="mergesort"
+    )
     
     ks_df["goods"] = ks_df["count"] - ks_df["bads"]
     ks_df["bad_rate"] = np.where(ks_df["count"] > 1e-9, 
@@ -1670,7 +3069,8 @@ def ks_table(data: pd.DataFrame, y_true_col: str, y_pred_col: str,
         ks_df["cum_bads_pct"] = 0.0
         ks_df["cum_goods_pct"] = 0.0
         ks_df["ks"] = 0.0
-        print("Warning: KS calculation skipped - total goods or bads is zero.")
+        if verbose:
+            print("Warning: KS calculation skipped - total goods or bads is zero.")
     else:
         ks_df["cum_bads_pct"] = (ks_df["bads"].cumsum() / total_bads) * 100
         ks_df["cum_goods_pct"] = (ks_df["goods"].cumsum() / total_goods) * 100
@@ -1678,21 +3078,21 @@ def ks_table(data: pd.DataFrame, y_true_col: str, y_pred_col: str,
     
     # Rename columns
     ks_df.rename(columns={
-        'min_value': f'min_{y_pred_col}',
-        'max_value': f'max_{y_pred_col}',
-        'avg_value': f'avg_{y_pred_col}'
+        'min_value': f'min_{value_name}',
+        'max_value': f'max_{value_name}',
+        'avg_value': f'avg_{value_name}'
     }, inplace=True)
     
     # Print max KS info
-    if 'ks' in ks_df.columns and not ks_df['ks'].empty and total_bads > 1e-9 and total_goods > 1e-9:
+    if verbose and 'ks' in ks_df.columns and not ks_df['ks'].empty and total_bads > 1e-9 and total_goods > 1e-9:
         max_ks = ks_df['ks'].max()
         max_ks_row = ks_df.loc[ks_df['ks'].idxmax()]
         print(f"KS Statistic (Max KS): {max_ks:.4f}")
-        print(f"  Occurs in bin with range: [{max_ks_row[f'min_{y_pred_col}']:.4f} - {max_ks_row[f'max_{y_pred_col}']:.4f}]")
+        print(f"  Occurs in bin with range: [{max_ks_row[f'min_{value_name}']:.4f} - {max_ks_row[f'max_{value_name}']:.4f}]")
     
     # Select final columns
     final_cols = [
-        f"min_{y_pred_col}", f"max_{y_pred_col}", f"avg_{y_pred_col}",
+        f"min_{value_name}", f"max_{value_name}", f"avg_{value_name}",
         "count", "bads", "goods", "bad_rate",
         "cum_bads_pct", "cum_goods_pct", "ks"
     ]
@@ -1701,170 +3101,1480 @@ def ks_table(data: pd.DataFrame, y_true_col: str, y_pred_col: str,
     return ks_df[final_cols].reset_index(drop=True)
 
 
-# =============================================================================
-# BINNED PROBABILITY PLOT
-# =============================================================================
-
-def binned_prob_plot(
-    data: pd.DataFrame,
-    feature: str,
-    target_binary: str,
-    cont_feat_flag: Optional[bool] = None,
-    transform_log_odds: bool = False,
-    num_bins: int = 10,
-    show_plot: bool = True
-) -> Dict[str, Any]:
+def ks_table(data: pd.DataFrame, y_true_col: str, y_pred_col: str, 
+             n_bins: int = 10, is_score: bool = False, 
+             sample_weight_col: Optional[str] = None,
+             engine: str = "numpy",
+             quantile_method: str = "exact",
+             sketch_k: int = 200) -> pd.DataFrame:
     """
-    Plot average binary target against feature bins or categories.
-    
-    For continuous features, calculates Spearman correlation.
-    For categorical features, calculates Mutual Information.
+    Generate a KS (Kolmogorov-Smirnov) table for model evaluation.
     
     Parameters
     ----------
     data : pd.DataFrame
-        DataFrame containing the data.
+        DataFrame containing true labels and predicted probabilities/scores.
     
-    feature : str
-        Name of the feature to analyze.
+    y_true_col : str
+        Name of column with true binary labels (0 or 1).
     
-    target_binary : str
-        Name of the binary target variable.
+    y_pred_col : str
+        Name of column with predicted probabilities (higher=riskier) 
+        or scores (lower=riskier).
     
-    cont_feat_flag : bool, optional
-        True if feature is continuous, False if categorical.
-        If None, will be inferred from the data.
+    n_bins : int, default=10
+        Number of bins to divide values into.
     
-    transform_log_odds : bool, default=False
-        If True, transform probabilities to log odds.
+    is_score : bool, default=False
+        True if y_pred_col contains scores (lower=riskier),
+        False if it contains probabilities (higher=riskier).
     
-    num_bins : int, default=10
-        Number of bins for continuous features.
+    sample_weight_col : str, optional
+        Name of column containing sample weights.
     
-    show_plot : bool, default=True
-        If True, display the plot.
+    engine : {"numpy", "duckdb"}, default="numpy"
+        "numpy" sorts the prediction column once and builds equal-count rank
+        bins (sizes differ by at most one) and the exact (unbinned) max KS
+        from weighted cumulative sums. "duckdb" keeps the original pandas
+        qcut plus DuckDB GROUP BY path; qcut's floating-point edges can move
+        a bin boundary by one row relative to the numpy engine. The numpy
+        engine falls back to DuckDB when the label column is not numeric.
+    
+    quantile_method : {"exact", "sketch"}, default="exact"
+        "exact" builds rank bins from a full sort. "sketch" places bin
+        edges at KLLQuantileSketch quantiles and assigns rows with
+        searchsorted, so no sort is needed. Bin counts are then only
+        approximately equal and ``attrs["exact_ks"]`` is not set. Requires
+        the numpy engine.
+    
+    sketch_k : int, default=200
+        Accuracy parameter for the sketch when quantile_method="sketch".
     
     Returns
     -------
-    dict
-        Dictionary with feature name, measure name, value, and p-value.
+    pd.DataFrame
+        KS table with cumulative bad/good percentages and KS statistic.
+        With the numpy engine, ``attrs["exact_ks"]`` holds the max KS over
+        every distinct prediction value rather than over bin edges.
     """
-    df = data.copy()
-    
-    # Infer feature type if not provided
-    if cont_feat_flag is None:
-        tmp = df[feature].dropna()
-        sample_size = min(100, len(tmp))
-        if sample_size > 0:
-            tmp = tmp.sample(sample_size, replace=False, random_state=2025)
-            cont_feat_flag = tmp.nunique() > min(60, sample_size * 0.5)
+    if engine not in {"numpy", "duckdb"}:
+        raise ValueError("engine must be either 'numpy' or 'duckdb'.")
+    if quantile_method not in {"exact", "sketch"}:
+        raise ValueError("quantile_method must be either 'exact' or 'sketch'.")
+    if quantile_method == "sketch" and engine != "numpy":
+        raise ValueError("quantile_method='sketch' requires engine='numpy'.")
+
+    exact_ks = None
+    if engine == "numpy" and not pd.api.types.is_numeric_dtype(data[y_true_col]):
+        if quantile_method == "sketch":
+            raise ValueError("quantile_method='sketch' requires a numeric label column.")
+        engine = "duckdb"
+
+    if engine == "numpy":
+        y_true, y_pred, weight = _prepare_ks_arrays(
+            data, y_true_col, y_pred_col, sample_weight_col
+        )
+        if y_pred.shape[0] == 0:
+            print("Warning: No valid data points for KS table.")
+            return pd.DataFrame()
+        if quantile_method == "sketch":
+            ks_df = _ks_bins_sketch(y_true, y_pred, weight, n_bins, sketch_k=sketch_k)
         else:
-            cont_feat_flag = False
-        print(f"Feature {feature} inferred as {'continuous' if cont_feat_flag else 'categorical'}.")
-    
-    # Create bins
-    if cont_feat_flag:
-        try:
-            df["bin_label"] = pd.qcut(
-                df[feature].rank(method='first'),
-                q=num_bins,
-                duplicates="drop",
-                labels=[str(i) for i in range(1, num_bins + 1)]
-            )
-        except ValueError as e:
-            print(f"Warning: pd.qcut failed for {feature} ({e}). Using fallback.")
-            ranks = df[feature].rank(method='first')
-            bin_size = max(1, len(df) // num_bins)
-            df['bin_label'] = ((ranks - 1) // bin_size).clip(upper=num_bins - 1).astype(str)
+            ks_df, exact_ks = _ks_bins_numpy(y_true, y_pred, weight, n_bins)
     else:
-        df["bin_label"] = df[feature].astype("category")
-        df[feature + "_codes"] = df[feature].astype("category").cat.codes
-    
-    # Group and aggregate
-    grouped = df.groupby("bin_label", observed=False).agg(
-        **{
-            "average_" + target_binary: (target_binary, "mean"),
-            "count": (target_binary, "count")
-        }
-    )
-    
-    # Log-odds transform
+        ks_df = _ks_bins_duckdb(data, y_true_col, y_pred_col, n_bins, sample_weight_col)
+        if ks_df.empty:
+            return pd.DataFrame()
+
+    ks_df = _finalize_ks_table(ks_df, value_name=y_pred_col, is_score=is_score)
+
+    if exact_ks is not None and not np.isnan(exact_ks):
+        ks_df.attrs["exact_ks"] = exact_ks
+
+    return ks_df
+
+
+def ks_table_multi(
+    data: pd.DataFrame,
+    y_true_col: str,
+    y_pred_cols: List[str],
+    n_bins: int = 10,
+    is_score: bool | Dict[str, bool] | List[bool] = False,
+    sample_weight_col: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Generate KS tables for several prediction columns in one long-format table.
+    
+    The label and weight columns are read once and shared across every
+    prediction column. Each prediction column is then sorted once with the
+    same NumPy engine that ks_table uses.
+    
+    Parameters
+    ----------
+    data : pd.DataFrame
+        DataFrame containing true labels and predicted probabilities/scores.
+    
+    y_true_col : str
+        Name of column with true binary labels (0 or 1).
+    
+    y_pred_cols : list of str
+        Names of prediction columns to compare, for example champion and
+        challenger model outputs.
+    
+    n_bins : int, default=10
+        Number of bins to divide values into.
+    
+    is_score : bool, dict, or list of bool, default=False
+        Direction for each prediction column. True means lower=riskier.
+        A single bool applies to every column. A dict maps column names to
+        directions, and a list gives directions in y_pred_cols order.
+    
+    sample_weight_col : str, optional
+        Name of column containing sample weights.
+    
+    Returns
+    -------
+    pd.DataFrame
+        Long-format KS table with a ``score_col`` column identifying the
+        prediction column and a ``bin`` column numbering bins from the
+        riskiest end. ``attrs["exact_ks"]`` maps each prediction column to
+        its exact (unbinned) max KS. When the label column is not numeric,
+        bins come from ks_table's DuckDB path and ``attrs["exact_ks"]`` is
+        empty.
+    
+    Raises
+    ------
+    KeyError
+        If is_score is a dict without an entry for a prediction column.
+    """
+    if isinstance(y_pred_cols, str):
+        y_pred_cols = [y_pred_cols]
+    if not y_pred_cols:
+        raise ValueError("y_pred_cols must contain at least one column.")
+
+    if isinstance(is_score, dict):
+        missing_cols = [col for col in y_pred_cols if col not in is_score]
+        if missing_cols:
+            raise KeyError(f"is_score has no direction for columns: {missing_cols}")
+        directions = {col: bool(is_score[col]) for col in y_pred_cols}
+    elif isinstance(is_score, (list, tuple)):
+        if len(is_score) != len(y_pred_cols):
+            raise ValueError("is_score must have one entry per prediction column.")
+        directions = dict(zip(y_pred_cols, map(bool, is_score)))
+    else:
+        directions = {col: bool(is_score) for col in y_pred_cols}
+
+    # Non-numeric labels take ks_table's DuckDB path, one column at a time.
+    use_duckdb = not pd.api.types.is_numeric_dtype(data[y_true_col])
+    
+    # Read the shared label and weight columns once
+    y_true_all = pd.to_numeric(data[y_true_col], errors='coerce').to_numpy(dtype=float)
+    if sample_weight_col:
+        weight_all = pd.to_numeric(data[sample_weight_col], errors='coerce').to_numpy(dtype=float)
+        weight_all = np.where(np.isnan(weight_all), 1.0, weight_all)
+    else:
+        weight_all = np.ones(y_true_all.shape[0], dtype=float)
+
+    tables = []
+    exact_ks_by_col = {}
+    for y_pred_col in y_pred_cols:
+        if use_duckdb:
+            ks_df = _ks_bins_duckdb(data, y_true_col, y_pred_col, n_bins, sample_weight_col)
+            if ks_df.empty:
+                continue
+            ks_df = _finalize_ks_table(
+                ks_df, value_name="value", is_score=directions[y_pred_col], verbose=False
+            )
+            ks_df.insert(0, "bin", np.arange(1, len(ks_df) + 1))
+            ks_df.insert(0, "score_col", y_pred_col)
+            tables.append(ks_df)
+            print(f"{y_pred_col}: KS Statistic (Max KS) {ks_df['ks'].max():.4f}")
+            continue
+        
+        y_pred = pd.to_numeric(data[y_pred_col], errors='coerce').to_numpy(dtype=float)
+        valid = ~np.isnan(y_pred)
+        if not valid.any():
+            print(f"Warning: No valid data points for KS table of {y_pred_col}.")
+            continue
+        if valid.all():
+            y_true, weight = y_true_all, weight_all
+        else:
+            y_true, y_pred, weight = y_true_all[valid], y_pred[valid], weight_all[valid]
+
+        ks_df, exact_ks = _ks_bins_numpy(y_true, y_pred, weight, n_bins)
+        ks_df = _finalize_ks_table(
+            ks_df, value_name="value", is_score=directions[y_pred_col], verbose=False
+        )
+        ks_df.insert(0, "bin", np.arange(1, len(ks_df) + 1))
+        ks_df.insert(0, "score_col", y_pred_col)
+        tables.append(ks_df)
+        exact_ks_by_col[y_pred_col] = exact_ks
+
+        print(f"{y_pred_col}: KS Statistic (Max KS) {ks_df['ks'].max():.4f}, "
+              f"exact KS {exact_ks:.4f}")
+
+    if not tables:
+        return pd.DataFrame()
+
+    ks_long = pd.concat(tables, ignore_index=True)
+    ks_long.attrs["exact_ks"] = exact_ks_by_col
+
+    return ks_long
+
+
+# =============================================================================
+# QUANTILE SKETCH UTILITIES
+# =============================================================================
+
+class KLLQuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch for streaming binning.
+
+    Values are held in a stack of compactors. When a level fills up, it is
+    sorted and every other item (from a random offset) moves up one level
+    with double weight. Memory stays near O(k log(n / k)) items, and the
+    rank error of a quantile query is roughly 1.7 / k of n for k >= 100.
+
+    Parameters
+    ----------
+    k : int, default=200
+        Capacity of the top compactor. Larger k gives smaller rank error.
+
+    random_state : int, optional
+        Seed for the compaction offsets.
+    """
+
+    _CAPACITY_DECAY = 2.0 / 3.0
+
+    def __init__(self, k: int = 200, random_state: Optional[int] = None):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = int(k)
+        self.count = 0
+        self.min_value = np.inf
+        self.max_value = -np.inf
+        self._levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * self._CAPACITY_DECAY ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if items.shape[0] > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item stays behind so total weight is preserved exactly.
+                keep = items[:items.shape[0] % 2]
+                paired = items[items.shape[0] % 2:]
+                promoted = paired[self._rng.integers(0, 2)::2]
+                self._levels[level] = keep
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values) -> 'KLLQuantileSketch':
+        """Add a batch of values. Missing values are ignored."""
+        values = np.asarray(values, dtype=float).reshape(-1)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        self.count += int(values.size)
+        self.min_value = min(self.min_value, float(values.min()))
+        self.max_value = max(self.max_value, float(values.max()))
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+        return self
+
+    def merge(self, other: 'KLLQuantileSketch') -> 'KLLQuantileSketch':
+        """Merge another sketch into this one, in place."""
+        if not isinstance(other, KLLQuantileSketch):
+            raise ValueError("Can only merge another KLLQuantileSketch.")
+
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._compress()
+
+        return self
+
+    def quantile(self, q) -> np.ndarray:
+        """
+        Approximate quantiles for probabilities q in [0, 1].
+
+        q=0 and q=1 return the exact minimum and maximum.
+        """
+        q = np.asarray(q, dtype=float)
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("q must be in the interval [0, 1].")
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(level_items.shape[0], 2.0 ** level)
+            for level, level_items in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind="mergesort")
+        items = items[order]
+        cum_weights = np.cumsum(weights[order])
+
+        positions = np.searchsorted(cum_weights, q * cum_weights[-1], side="left")
+        result = items[np.clip(positions, 0, items.shape[0] - 1)]
+        result = np.where(q <= 0, self.min_value, result)
+        result = np.where(q >= 1, self.max_value, result)
+
+        return result
+
+    @property
+    def n_retained(self) -> int:
+        """Number of items currently held by the sketch."""
+        return int(sum(level_items.shape[0] for level_items in self._levels))
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str,
+        column: str,
+        k: int = 200,
+        batch_size: int = 1_000_000,
+        random_state: Optional[int] = None,
+    ) -> 'KLLQuantileSketch':
+        """Build a sketch of one Parquet column in a single streaming pass."""
+        import pyarrow.dataset as ds
+
+        sketch = cls(k=k, random_state=random_state)
+        dataset = ds.dataset(path, format="parquet")
+        for batch in dataset.to_batches(columns=[column], batch_size=batch_size):
+            sketch.update(batch.column(0).to_numpy(zero_copy_only=False))
+
+        return sketch
+
+
+def sketch_quantiles(
+    values,
+    q,
+    k: int = 200,
+    batch_size: int = 1_000_000,
+    random_state: Optional[int] = 2025,
+) -> np.ndarray:
+    """
+    Approximate quantiles of an array or an iterable of array chunks.
+
+    Parameters
+    ----------
+    values : array-like, pandas.Series, or iterable of array-like
+        Values to summarize. Arrays are streamed in slices of batch_size.
+
+    q : array-like
+        Quantile probabilities in [0, 1].
+
+    k : int, default=200
+        Sketch accuracy parameter, see KLLQuantileSketch.
+
+    batch_size : int, default=1_000_000
+        Slice length when values is a single array.
+
+    random_state : int, optional, default=2025
+        Seed for the sketch compaction offsets.
+
+    Returns
+    -------
+    np.ndarray
+        Approximate quantiles.
+    """
+    sketch = KLLQuantileSketch(k=k, random_state=random_state)
+    if isinstance(values, (np.ndarray, pd.Series, pd.Index, list, tuple)):
+        values = np.asarray(values, dtype=float).reshape(-1)
+        for start in range(0, values.shape[0], batch_size):
+            sketch.update(values[start:start + batch_size])
+    else:
+        for chunk in values:
+            sketch.update(chunk)
+
+    return sketch.quantile(q)
+
+
+# =============================================================================
+# STREAMING EVALUATION UTILITIES
+# =============================================================================
+
+class StreamingBinaryMetricAccumulator:
+    """
+    Mergeable score histogram for out-of-core binary classification metrics.
+
+    Each batch of (label, score, weight) rows is added to fixed-width score
+    bins that hold weighted positives, weighted negatives, row counts, and
+    score sums. Accumulators built on separate chunks or processes can be
+    merged, then queried for approximate AUC, KS, gains tables, and threshold
+    curves without holding the full label and score arrays in memory.
+
+    Parameters
+    ----------
+    n_bins : int, default=10000
+        Number of equal-width score bins.
+
+    score_range : tuple of float, default=(0.0, 1.0)
+        Lower and upper score bounds. Scores outside the range are counted in
+        the first or last bin. For integer credit scores, (300, 851) with 551
+        bins gives one bin per score point and exact results.
+
+    Notes
+    -----
+    Scores are treated as higher=riskier, as in find_best_threshold. For
+    credit scores (lower=riskier), roc_auc() returns 1 - AUC, and
+    gains_table(is_score=True) orders the groups from the riskiest end.
+
+    Threshold curves are exact at bin edges because every row in bin i has a
+    score at or above the lower edge of bin i. AUC treats rows that share a
+    bin as ties, and auc_error_bound() reports the largest possible shift
+    from that. KS is evaluated at bin edges, so it can miss the exact maximum
+    by at most the largest share of positives or negatives in a single bin.
+    """
+
+    def __init__(self, n_bins: int = 10000, score_range: Tuple[float, float] = (0.0, 1.0)):
+        if n_bins < 1:
+            raise ValueError("n_bins must be at least 1.")
+        if score_range[1] <= score_range[0]:
+            raise ValueError("score_range must be increasing.")
+
+        self.n_bins = int(n_bins)
+        self.score_range = (float(score_range[0]), float(score_range[1]))
+        self.bin_edges = np.linspace(self.score_range[0], self.score_range[1], self.n_bins + 1)
+        self.positive_weight = np.zeros(self.n_bins)
+        self.negative_weight = np.zeros(self.n_bins)
+        self.row_count = np.zeros(self.n_bins, dtype=np.int64)
+        self.score_sum = np.zeros(self.n_bins)
+        self.n_missing = 0
+
+    def _bin_index(self, y_score: np.ndarray) -> np.ndarray:
+        low, high = self.score_range
+        bin_index = np.floor((y_score - low) / (high - low) * self.n_bins)
+        return np.clip(bin_index, 0, self.n_bins - 1).astype(np.intp)
+
+    def update(self, y_true, y_score, sample_weight=None) -> 'StreamingBinaryMetricAccumulator':
+        """
+        Add one batch of labels, scores, and optional weights.
+
+        Rows with a missing score or label are skipped and counted in
+        n_missing.
+        """
+        y_true = np.asarray(y_true, dtype=float).reshape(-1)
+        y_score = extract_positive_class_scores(y_score).reshape(-1)
+        if y_true.shape[0] != y_score.shape[0]:
+            raise ValueError("y_true and y_score must have the same number of observations.")
+
+        if sample_weight is None:
+            sample_weight = np.ones(y_true.shape[0])
+        else:
+            sample_weight = np.asarray(sample_weight, dtype=float).reshape(-1)
+            if sample_weight.shape[0] != y_true.shape[0]:
+                raise ValueError("sample_weight and y_true must have the same number of observations.")
+
+        valid = ~(np.isnan(y_true) | np.isnan(y_score))
+        if not valid.all():
+            self.n_missing += int((~valid).sum())
+            y_true, y_score, sample_weight = y_true[valid], y_score[valid], sample_weight[valid]
+
+        bin_index = self._bin_index(y_score)
+        positive_weight = y_true * sample_weight
+        self.positive_weight += np.bincount(bin_index, weights=positive_weight, minlength=self.n_bins)
+        self.negative_weight += np.bincount(
+            bin_index, weights=sample_weight - positive_weight, minlength=self.n_bins
+        )
+        self.row_count += np.bincount(bin_index, minlength=self.n_bins)
+        self.score_sum += np.bincount(bin_index, weights=y_score, minlength=self.n_bins)
+
+        return self
+
+    def merge(self, other: 'StreamingBinaryMetricAccumulator') -> 'StreamingBinaryMetricAccumulator':
+        """Add another accumulator with the same bins into this one, in place."""
+        if not isinstance(other, StreamingBinaryMetricAccumulator):
+            raise ValueError("Can only merge another StreamingBinaryMetricAccumulator.")
+        if other.n_bins != self.n_bins or other.score_range != self.score_range:
+            raise ValueError("Accumulators must share n_bins and score_range to be merged.")
+
+        self.positive_weight += other.positive_weight
+        self.negative_weight += other.negative_weight
+        self.row_count += other.row_count
+        self.score_sum += other.score_sum
+        self.n_missing += other.n_missing
+
+        return self
+
+    def __add__(self, other: 'StreamingBinaryMetricAccumulator') -> 'StreamingBinaryMetricAccumulator':
+        merged = StreamingBinaryMetricAccumulator(self.n_bins, self.score_range)
+        return merged.merge(self).merge(other)
+
+    def _totals(self) -> tuple[float, float]:
+        total_positive = float(self.positive_weight.sum())
+        total_negative = float(self.negative_weight.sum())
+        if total_positive <= 0 or total_negative <= 0:
+            raise ValueError("Both positive and negative weight are needed for this metric.")
+        return total_positive, total_negative
+
+    def threshold_curve(self) -> pd.DataFrame:
+        """
+        Return weighted confusion counts for ``score >= threshold`` at every
+        non-empty bin's lower edge, in descending threshold order.
+        """
+        occupied = self.row_count > 0
+        thresholds = self.bin_edges[:-1][occupied][::-1]
+        tp = np.cumsum(self.positive_weight[occupied][::-1])
+        fp = np.cumsum(self.negative_weight[occupied][::-1])
+
+        return pd.DataFrame({
+            "threshold": thresholds,
+            "tp": tp,
+            "fp": fp,
+            "fn": self.positive_weight.sum() - tp,
+            "tn": self.negative_weight.sum() - fp,
+        })
+
+    def roc_auc(self) -> float:
+        """Approximate ROC-AUC, treating rows in the same bin as tied scores."""
+        total_positive, total_negative = self._totals()
+        tpr = np.r_[0.0, np.cumsum(self.positive_weight[::-1]) / total_positive]
+        fpr = np.r_[0.0, np.cumsum(self.negative_weight[::-1]) / total_negative]
+        return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+    def auc_error_bound(self) -> float:
+        """Largest possible gap between roc_auc() and the exact unbinned AUC."""
+        total_positive, total_negative = self._totals()
+        return float(
+            np.sum(self.positive_weight * self.negative_weight) / (2 * total_positive * total_negative)
+        )
+
+    def ks(self) -> float:
+        """Approximate max KS in percent, evaluated at bin edges."""
+        total_positive, total_negative = self._totals()
+        cum_positive = np.cumsum(self.positive_weight) / total_positive
+        cum_negative = np.cumsum(self.negative_weight) / total_negative
+        return float(np.max(np.abs(cum_positive - cum_negative)) * 100)
+
+    def best_threshold(self, scorer: str = "f1", scorer_kwargs: dict[str, Any] | None = None) -> float:
+        """
+        Best bin-edge threshold under a named find_best_threshold scorer.
+
+        Ties resolve to the lowest threshold.
+        """
+        scorer_fn = _resolve_threshold_scorer(scorer)
+        curve = self.threshold_curve()
+        if curve.empty:
+            raise ValueError("The accumulator does not contain any rows.")
+        scores = np.asarray(
+            scorer_fn(
+                curve["tp"].to_numpy(),
+                curve["fp"].to_numpy(),
+                curve["fn"].to_numpy(),
+                curve["tn"].to_numpy(),
+                **(scorer_kwargs or {}),
+            ),
+            dtype=float,
+        )
+        if not np.any(np.isfinite(scores)):
+            raise ValueError(f"Scorer '{scorer}' is not attainable at any threshold.")
+
+        best_thresholds = curve["threshold"].to_numpy()[np.isclose(scores, np.max(scores))]
+        return float(np.min(best_thresholds))
+
+    def gains_table(
+        self,
+        n_groups: int = 10,
+        is_score: bool = False,
+        value_name: str = "score",
+    ) -> pd.DataFrame:
+        """
+        Approximate KS/gains table with the same columns as ks_table.
+
+        Histogram bins are grouped into n_groups groups of roughly equal row
+        count. Group boundaries fall on bin edges, so min/max columns are bin
+        edges rather than observed scores.
+        """
+        occupied = np.flatnonzero(self.row_count > 0)
+        if occupied.size == 0:
+            print("Warning: No valid data points for KS table.")
+            return pd.DataFrame()
+
+        row_count = self.row_count[occupied]
+        cum_rows = np.cumsum(row_count)
+        # Assign each bin to a group by the cumulative share at its midpoint.
+        midpoint_share = (cum_rows - row_count / 2) / cum_rows[-1]
+        group = np.minimum((midpoint_share * n_groups).astype(int), n_groups - 1)
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        ends = np.r_[starts[1:], occupied.size] - 1
+
+        ks_df = pd.DataFrame({
+            'bin': np.arange(starts.shape[0]),
+            'min_value': self.bin_edges[occupied[starts]],
+            'max_value': self.bin_edges[occupied[ends] + 1],
+            'avg_value': np.add.reduceat(self.score_sum[occupied], starts)
+            / np.add.reduceat(row_count, starts),
+            'count': np.add.reduceat(
+                self.positive_weight[occupied] + self.negative_weight[occupied], starts
+            ),
+            'bads': np.add.reduceat(self.positive_weight[occupied], starts),
+        })
+
+        return _finalize_ks_table(ks_df, value_name=value_name, is_score=is_score)
+
+
+# =============================================================================
+# CONTINGENCY FEATURE SCORING
+# =============================================================================
+
+def _column_codes(values, n_bins: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """
+    Integer-code one column for contingency counting.
+
+    Missing values get their own code. With n_bins, numeric columns with
+    more than n_bins distinct values are cut into equal-count rank bins.
+    """
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    if (
+        n_bins is not None
+        and pd.api.types.is_numeric_dtype(values)
+        and not pd.api.types.is_bool_dtype(values)
+        and values.nunique() > n_bins
+    ):
+        ranks = values.rank(method='first').to_numpy()
+        n_valid = int(np.sum(~np.isnan(ranks)))
+        codes = np.floor((ranks - 1) * n_bins / max(n_valid, 1))
+        codes = np.where(np.isnan(codes), -1, codes).astype(np.int64)
+        n_codes = n_bins
+    else:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        codes = codes.astype(np.int64, copy=False)
+        n_codes = len(uniques)
+
+    if np.any(codes < 0):
+        codes = np.where(codes < 0, n_codes, codes)
+        n_codes += 1
+
+    return codes, max(n_codes, 1)
+
+
+def _weighted_contingency_tables(
+    X,
+    y,
+    sample_weight=None,
+    n_bins: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build stacked weighted contingency tables for every column of X.
+
+    Each column is coded and counted with its own bincount, so peak memory
+    stays O(n_rows) regardless of the number of columns.
+
+    Returns
+    -------
+    joint : np.ndarray of shape (sum of column cardinalities, n_classes)
+        Weighted counts, one row per (column, category) pair.
+
+    row_starts : np.ndarray
+        First row of each column's block in joint.
+
+    class_totals : np.ndarray of shape (n_classes,)
+        Weighted count of each class.
+    """
+    if isinstance(X, pd.DataFrame):
+        columns = [X.iloc[:, j] for j in range(X.shape[1])]
+    else:
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(-1, 1)
+        columns = [X[:, j] for j in range(X.shape[1])]
+
+    y = pd.Series(np.asarray(y).reshape(-1))
+    if len(columns) and len(columns[0]) != y.shape[0]:
+        raise ValueError("X and y must have the same number of observations.")
+
+    if sample_weight is None:
+        weight = np.ones(y.shape[0], dtype=float)
+    else:
+        weight = np.asarray(sample_weight, dtype=float).reshape(-1)
+        if weight.shape[0] != y.shape[0]:
+            raise ValueError("sample_weight and y must have the same number of observations.")
+
+    valid = y.notna().to_numpy()
+    y_codes, classes = pd.factorize(y[valid], sort=True)
+    n_classes = max(len(classes), 1)
+    weight = weight[valid]
+
+    tables = []
+    cardinalities = []
+    for values in columns:
+        codes, n_codes = _column_codes(values[valid] if len(values) else values, n_bins=n_bins)
+        tables.append(np.bincount(
+            codes * n_classes + y_codes, weights=weight, minlength=n_codes * n_classes,
+        ).reshape(n_codes, n_classes))
+        cardinalities.append(n_codes)
+
+    cardinalities = np.asarray(cardinalities, dtype=np.int64)
+    row_starts = np.r_[0, np.cumsum(cardinalities)[:-1]].astype(np.int64)
+    if not tables:
+        return np.zeros((0, n_classes)), row_starts, np.zeros(n_classes)
+
+    joint = np.concatenate(tables, axis=0)
+    class_totals = np.bincount(y_codes, weights=weight, minlength=n_classes)
+
+    return joint, row_starts, class_totals
+
+
+def contingency_mutual_info(
+    X,
+    y,
+    sample_weight=None,
+    n_bins: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Exact mutual information between each discrete column of X and y.
+
+    Computed from weighted contingency tables in natural-log units, the same
+    value as mutual_info_classif(..., discrete_features=True) without
+    weights. Usable as a SelectKBest score_func; pass weights with
+    functools.partial(contingency_mutual_info, sample_weight=w).
+
+    Parameters
+    ----------
+    X : pd.DataFrame or array-like of shape (n_samples, n_features)
+        Discrete (categorical or ordinal-coded) features. Missing values are
+        treated as their own category.
+
+    y : array-like of shape (n_samples,)
+        Class labels. Rows with missing labels are ignored.
+
+    sample_weight : array-like, optional
+        Observation weights.
+
+    n_bins : int, optional
+        If given, numeric columns with more than n_bins distinct values are
+        cut into n_bins equal-count bins first. Without it every distinct
+        value is a category, which overstates MI for continuous columns.
+
+    Returns
+    -------
+    np.ndarray
+        Mutual information per column.
+    """
+    joint, row_starts, class_totals = _weighted_contingency_tables(
+        X, y, sample_weight=sample_weight, n_bins=n_bins
+    )
+    total = class_totals.sum()
+    if joint.shape[0] == 0 or total <= 0:
+        return np.zeros(row_starts.shape[0])
+
+    row_totals = joint.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cell_terms = joint * np.log(joint * total / (row_totals * class_totals))
+    cell_terms = np.where(joint > 0, cell_terms, 0.0)
+
+    mutual_info = np.add.reduceat(cell_terms.sum(axis=1), row_starts) / total
+    return np.maximum(mutual_info, 0.0)
+
+
+def contingency_information_value(
+    X,
+    y,
+    sample_weight=None,
+    n_bins: Optional[int] = 10,
+    smoothing: float = 0.5,
+) -> np.ndarray:
+    """
+    Information value (IV) of each column of X for a binary target.
+
+    IV = sum over categories of (pct_good - pct_bad) * ln(pct_good / pct_bad),
+    computed from the same weighted contingency tables as
+    contingency_mutual_info. Usable as a SelectKBest score_func.
+
+    Parameters
+    ----------
+    X : pd.DataFrame or array-like of shape (n_samples, n_features)
+        Features. Missing values are treated as their own category.
+
+    y : array-like of shape (n_samples,)
+        Binary 0/1 labels (1 = bad).
+
+    sample_weight : array-like, optional
+        Observation weights.
+
+    n_bins : int, optional, default=10
+        Numeric columns with more than n_bins distinct values are cut into
+        n_bins equal-count bins. None treats every distinct value as a
+        category.
+
+    smoothing : float, default=0.5
+        Added to every good/bad cell count so empty cells give a finite WoE.
+
+    Returns
+    -------
+    np.ndarray
+        Information value per column.
+    """
+    labels = pd.Series(np.asarray(y).reshape(-1)).dropna().unique()
+    if not set(labels.tolist()).issubset({0, 1}):
+        raise ValueError("contingency_information_value requires binary 0/1 labels.")
+
+    joint, row_starts, class_totals = _weighted_contingency_tables(
+        X, y, sample_weight=sample_weight, n_bins=n_bins
+    )
+    if joint.shape[0] == 0 or class_totals.shape[0] < 2:
+        return np.zeros(row_starts.shape[0])
+
+    # Labels are factorized in sorted order, so column 0 is good and column 1 is bad.
+    cardinalities = np.diff(np.r_[row_starts, joint.shape[0]])
+    goods = joint[:, 0] + smoothing
+    bads = joint[:, 1] + smoothing
+    good_totals = np.add.reduceat(goods, row_starts)
+    bad_totals = np.add.reduceat(bads, row_starts)
+    pct_good = goods / np.repeat(good_totals, cardinalities)
+    pct_bad = bads / np.repeat(bad_totals, cardinalities)
+
+    return np.add.reduceat((pct_good - pct_bad) * np.log(pct_good / pct_bad), row_starts)
+
+
+# =============================================================================
+# BINNED PROBABILITY PLOT
+# =============================================================================
+
+def _infer_continuous_feature(values: pd.Series, feature: str) -> bool:
+    """Infer whether a feature is continuous from a 100-row sample of its values."""
+    tmp = values.dropna()
+    sample_size = min(100, len(tmp))
+    if sample_size > 0:
+        tmp = tmp.sample(sample_size, replace=False, random_state=2025)
+        cont_feat_flag = tmp.nunique() > min(60, sample_size * 0.5)
+    else:
+        cont_feat_flag = False
+    print(f"Feature {feature} inferred as {'continuous' if cont_feat_flag else 'categorical'}.")
+    return bool(cont_feat_flag)
+
+
+def _binned_target_table(
+    values: pd.Series,
+    target: pd.Series,
+    feature: str,
+    target_binary: str,
+    cont_feat_flag: bool,
+    transform_log_odds: bool = False,
+    num_bins: int = 10,
+    quantile_method: str = "exact",
+) -> Tuple[pd.DataFrame, Optional[pd.Series]]:
+    """
+    Bin one feature column and aggregate the target rate per bin.
+    
+    Works on the column Series directly, so the source frame is never
+    copied. Returns the per-bin table and, for categorical features, the
+    category codes used for mutual information.
+    """
+    codes = None
+    if cont_feat_flag and quantile_method == "sketch":
+        numeric_values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+        edges = np.unique(sketch_quantiles(numeric_values, np.linspace(0.0, 1.0, num_bins + 1)))
+        bin_codes = np.searchsorted(edges[1:-1], numeric_values, side='right')
+        bin_label = pd.Series(pd.Categorical.from_codes(
+            np.where(np.isnan(numeric_values), -1, bin_codes),
+            categories=[str(i) for i in range(1, max(len(edges) - 1, 1) + 1)]
+        ), index=values.index)
+    elif cont_feat_flag:
+        ranks = values.rank(method='first')
+        try:
+            bin_label = pd.qcut(
+                ranks,
+                q=num_bins,
+                duplicates="drop",
+                labels=[str(i) for i in range(1, num_bins + 1)]
+            )
+        except ValueError as e:
+            print(f"Warning: pd.qcut failed for {feature} ({e}). Using fallback.")
+            bin_size = max(1, len(values) // num_bins)
+            bin_label = ((ranks - 1) // bin_size).clip(upper=num_bins - 1).astype(str)
+    else:
+        bin_label = values.astype("category")
+        codes = bin_label.cat.codes
+    
+    grouped = target.groupby(bin_label.rename("bin_label"), observed=False).agg(
+        **{
+            "average_" + target_binary: "mean",
+            "count": "count"
+        }
+    )
+    
     if transform_log_odds:
         eps = 1e-6
         grouped["transform_avg_prob"] = special.logit(
             np.clip(grouped["average_" + target_binary], eps, 1 - eps)
         )
     
-    # Calculate statistics
-    measure_name = None
-    measure_value = None
-    p_value = None
+    return grouped, codes
+
+
+def _binned_target_measure(
+    grouped: pd.DataFrame,
+    codes: Optional[pd.Series],
+    target: pd.Series,
+    target_binary: str,
+    cont_feat_flag: bool,
+    transform_log_odds: bool = False,
+) -> Tuple[str, float, Optional[float]]:
+    """Spearman trend over bins for continuous features, mutual information otherwise."""
+    if cont_feat_flag:
+        y = "transform_avg_prob" if transform_log_odds else "average_" + target_binary
+        grouped_idx_numeric = pd.to_numeric(grouped.index, errors='coerce').fillna(0)
+        if len(grouped) > 1:
+            measure_value, p_value = stats.spearmanr(grouped_idx_numeric, grouped[y])
+        else:
+            measure_value, p_value = np.nan, np.nan
+        return "spearman_corr", measure_value, p_value
+    
+    valid = target.notna()
+    if valid.any():
+        measure_value = contingency_mutual_info(codes[valid].to_frame(), target[valid])[0]
+    else:
+        measure_value = np.nan
+    return "mutual_info", measure_value, None
+
+
+def plot_binned_table(
+    grouped: pd.DataFrame,
+    feature: str,
+    target_binary: str,
+    cont_feat_flag: bool,
+    transform_log_odds: bool = False,
+    measure_value: Optional[float] = None,
+) -> None:
+    """
+    Plot a binned target-rate table from binned_prob_plot or scan_feature_monotonicity.
+    
+    Parameters
+    ----------
+    grouped : pd.DataFrame
+        Per-bin table indexed by bin label with "average_<target>" and
+        "count" columns (and "transform_avg_prob" for log odds).
+    
+    feature : str
+        Feature name used for the axis label and title.
+    
+    target_binary : str
+        Name of the binary target variable.
+    
+    cont_feat_flag : bool
+        True if the feature was binned as continuous.
+    
+    transform_log_odds : bool, default=False
+        If True, plot the log-odds column.
+    
+    measure_value : float, optional
+        Spearman correlation or mutual information shown in the title.
+    """
+    y_col = "transform_avg_prob" if transform_log_odds else "average_" + target_binary
+    
+    fig, ax = plt.subplots(figsize=(12, 6))
+    plot_x = range(len(grouped)) if cont_feat_flag else grouped.index
+    
+    ax.plot(
+        plot_x, grouped[y_col],
+        marker="o", linestyle="-",
+        label="Log Odds" if transform_log_odds else "Probability"
+    )
+    ax.set_xlabel(feature, fontsize=14)
+    ax.set_ylabel("Log Odds" if transform_log_odds else "Probability", fontsize=14)
+    ax.tick_params(axis="both", labelsize=14)
+    
+    ax2 = ax.twinx()
+    ax2.bar(plot_x, grouped["count"], alpha=0.25, color="gray", 
+            align="center", label="Counts")
+    ax2.set_ylabel("Counts", fontsize=14)
+    ax2.tick_params(axis="y", labelsize=14)
+    ax2.set_ylim(0, ax2.get_ylim()[1] * 10)
+    
+    ax.set_xticks(plot_x)
+    ax.set_xticklabels(grouped.index, rotation=45, ha="right", fontsize=14)
+    
+    h1, l1 = ax.get_legend_handles_labels()
+    h2, l2 = ax2.get_legend_handles_labels()
+    ax.legend(h1 + h2, l1 + l2, loc="upper right", fontsize=14)
+    
+    title_suffix = (f" (Spearman: {measure_value:.3f})" if cont_feat_flag and measure_value is not None 
+                    else f" (MI: {measure_value:.3f})" if not cont_feat_flag and measure_value is not None 
+                    else "")
+    ax.set_title(f"Binned Probability Plot for {feature}{title_suffix}", fontsize=16)
+    ax.grid(alpha=0.3)
+    plt.tight_layout()
+    plt.show()
+
+
+def binned_prob_plot(
+    data: pd.DataFrame,
+    feature: str,
+    target_binary: str,
+    cont_feat_flag: Optional[bool] = None,
+    transform_log_odds: bool = False,
+    num_bins: int = 10,
+    show_plot: bool = True,
+    quantile_method: str = "exact"
+) -> Dict[str, Any]:
+    """
+    Plot average binary target against feature bins or categories.
+    
+    For continuous features, calculates Spearman correlation.
+    For categorical features, calculates Mutual Information.
+    To screen many features at once, use scan_feature_monotonicity.
+    
+    Parameters
+    ----------
+    data : pd.DataFrame
+        DataFrame containing the data.
+    
+    feature : str
+        Name of the feature to analyze.
+    
+    target_binary : str
+        Name of the binary target variable.
+    
+    cont_feat_flag : bool, optional
+        True if feature is continuous, False if categorical.
+        If None, will be inferred from the data.
+    
+    transform_log_odds : bool, default=False
+        If True, transform probabilities to log odds.
+    
+    num_bins : int, default=10
+        Number of bins for continuous features.
+    
+    show_plot : bool, default=True
+        If True, display the plot.
+    
+    quantile_method : {"exact", "sketch"}, default="exact"
+        How continuous features are binned. "exact" uses qcut on ranks.
+        "sketch" cuts at KLLQuantileSketch quantiles, which avoids ranking
+        the full column; tied values then always share a bin.
+    
+    Returns
+    -------
+    dict
+        Dictionary with feature name, measure name, value, and p-value.
+    """
+    if quantile_method not in {"exact", "sketch"}:
+        raise ValueError("quantile_method must be either 'exact' or 'sketch'.")
+    
+    values = data[feature]
+    target = data[target_binary]
+    
+    # Infer feature type if not provided
+    if cont_feat_flag is None:
+        cont_feat_flag = _infer_continuous_feature(values, feature)
+    
+    grouped, codes = _binned_target_table(
+        values, target, feature, target_binary, cont_feat_flag,
+        transform_log_odds=transform_log_odds, num_bins=num_bins,
+        quantile_method=quantile_method,
+    )
+    measure_name, measure_value, p_value = _binned_target_measure(
+        grouped, codes, target, target_binary, cont_feat_flag,
+        transform_log_odds=transform_log_odds,
+    )
+    
+    if show_plot:
+        plot_binned_table(
+            grouped, feature, target_binary, cont_feat_flag,
+            transform_log_odds=transform_log_odds, measure_value=measure_value,
+        )
+    
+    return {
+        "feature": feature,
+        "measure_name": measure_name,
+        "measure_value": measure_value,
+        "p_value": p_value,
+        "log_odds": transform_log_odds
+    }
+
+
+def _binned_scan_summary(
+    grouped: pd.DataFrame,
+    feature: str,
+    target_binary: str,
+    cont_feat_flag: bool,
+    measure_name: str,
+    measure_value: float,
+    p_value: Optional[float],
+    transform_log_odds: bool,
+) -> Dict[str, Any]:
+    """One summary row of a monotonicity scan from a binned target table."""
+    rates = grouped["average_" + target_binary].dropna()
+    steps = np.diff(rates.to_numpy())
+    is_monotonic = bool(cont_feat_flag and (np.all(steps >= 0) or np.all(steps <= 0)))
+    
+    return {
+        "feature": feature,
+        "feature_type": "continuous" if cont_feat_flag else "categorical",
+        "measure_name": measure_name,
+        "measure_value": measure_value,
+        "p_value": p_value,
+        "n_bins": int((grouped["count"] > 0).sum()),
+        "is_monotonic": is_monotonic,
+        "log_odds": transform_log_odds,
+    }
+
+
+def _scan_one_feature(
+    values: pd.Series,
+    target: pd.Series,
+    feature: str,
+    target_binary: str,
+    cont_feat_flag: Optional[bool],
+    transform_log_odds: bool,
+    num_bins: int,
+    quantile_method: str,
+) -> Tuple[Dict[str, Any], pd.DataFrame]:
+    """Build the binned table and trend statistics for one feature column."""
+    if cont_feat_flag is None:
+        cont_feat_flag = _infer_continuous_feature(values, feature)
+    
+    grouped, codes = _binned_target_table(
+        values, target, feature, target_binary, cont_feat_flag,
+        transform_log_odds=transform_log_odds, num_bins=num_bins,
+        quantile_method=quantile_method,
+    )
+    measure_name, measure_value, p_value = _binned_target_measure(
+        grouped, codes, target, target_binary, cont_feat_flag,
+        transform_log_odds=transform_log_odds,
+    )
+    
+    summary = _binned_scan_summary(
+        grouped, feature, target_binary, cont_feat_flag,
+        measure_name, measure_value, p_value, transform_log_odds,
+    )
+    
+    return summary, grouped
+
+
+def scan_feature_monotonicity(
+    data: pd.DataFrame,
+    features: List[str],
+    target_binary: str,
+    cont_feat_flags: Optional[bool | Dict[str, bool]] = None,
+    transform_log_odds: bool = False,
+    num_bins: int = 10,
+    quantile_method: str = "exact",
+    n_jobs: Optional[int] = None,
+    show_plots: bool = False,
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Compute binned target rates and trend statistics for many features at once.
+    
+    Batch version of binned_prob_plot for feature screening. Each feature
+    column is read directly from data (no frame copy), binned, and
+    summarized with Spearman correlation over bins (continuous) or mutual
+    information (categorical). Columns can be processed in parallel threads.
+    
+    Parameters
+    ----------
+    data : pd.DataFrame
+        DataFrame containing the features and target.
+    
+    features : list of str
+        Names of features to scan.
+    
+    target_binary : str
+        Name of the binary target variable.
+    
+    cont_feat_flags : bool or dict, optional
+        True/False applies to every feature. A dict maps feature names to
+        flags; features missing from the dict, or all features when None,
+        are inferred as in binned_prob_plot.
+    
+    transform_log_odds : bool, default=False
+        If True, transform probabilities to log odds before the Spearman
+        correlation.
+    
+    num_bins : int, default=10
+        Number of bins for continuous features.
+    
+    quantile_method : {"exact", "sketch"}, default="exact"
+        Binning method for continuous features, as in binned_prob_plot.
+    
+    n_jobs : int, optional
+        Number of joblib threads across columns. None or 1 runs sequentially.
+    
+    show_plots : bool, default=False
+        If True, plot each feature with plot_binned_table after the scan.
+    
+    Returns
+    -------
+    summary : pd.DataFrame
+        One row per feature with feature_type, measure_name, measure_value,
+        p_value, n_bins and is_monotonic (bin rates never change direction).
+    
+    tables : dict
+        Per-feature binned tables, suitable for plot_binned_table.
+    """
+    if quantile_method not in {"exact", "sketch"}:
+        raise ValueError("quantile_method must be either 'exact' or 'sketch'.")
+    
+    missing_cols = [col for col in list(features) + [target_binary] if col not in data.columns]
+    if missing_cols:
+        raise ValueError(f"Columns not found in data: {missing_cols}")
+    
+    if isinstance(cont_feat_flags, dict):
+        flags = {feature: cont_feat_flags.get(feature) for feature in features}
+    else:
+        flags = {feature: cont_feat_flags for feature in features}
+    
+    target = data[target_binary]
+    tasks = [
+        (data[feature], target, feature, target_binary, flags[feature],
+         transform_log_odds, num_bins, quantile_method)
+        for feature in features
+    ]
+    
+    if n_jobs is None or n_jobs == 1:
+        results = [_scan_one_feature(*task) for task in tasks]
+    else:
+        from joblib import Parallel, delayed
+        
+        results = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_scan_one_feature)(*task) for task in tasks
+        )
+    
+    summary = pd.DataFrame([row for row, _ in results])
+    tables = {row["feature"]: grouped for row, grouped in results}
+    
+    if show_plots:
+        for row in summary.itertuples(index=False):
+            plot_binned_table(
+                tables[row.feature], row.feature, target_binary,
+                row.feature_type == "continuous",
+                transform_log_odds=transform_log_odds,
+                measure_value=row.measure_value,
+            )
+    
+    return summary, tables
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name for DuckDB SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _quote_string_literal(value: str) -> str:
+    """Quote a path or other string as a DuckDB SQL literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def binned_target_stats_duckdb(
+    source,
+    features: List[str],
+    target_binary: str,
+    cont_feat_flags: Optional[bool | Dict[str, bool]] = None,
+    transform_log_odds: bool = False,
+    num_bins: int = 10,
+    method: str = "ntile",
+    sample_weight_col: Optional[str] = None,
+    con=None,
+    show_plots: bool = False,
+) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Binned target rates and trend statistics computed inside DuckDB.
+    
+    SQL-pushdown version of scan_feature_monotonicity for data that does not
+    fit comfortably in pandas. Binning and per-bin aggregation run in
+    DuckDB against a Parquet path or relation, so only the referenced
+    columns are scanned and only the per-bin aggregates come back to Python.
     
-    if cont_feat_flag:
-        measure_name = "spearman_corr"
-        y = "transform_avg_prob" if transform_log_odds else "average_" + target_binary
-        grouped_idx_numeric = pd.to_numeric(grouped.index, errors='coerce').fillna(0)
-        if len(grouped) > 1:
-            measure_value, p_value = stats.spearmanr(grouped_idx_numeric, grouped[y])
-        else:
-            measure_value, p_value = np.nan, np.nan
+    Parameters
+    ----------
+    source : str, duckdb.DuckDBPyRelation, or pd.DataFrame
+        Parquet path or glob, an existing DuckDB relation, or a DataFrame.
+    
+    features : list of str
+        Names of features to scan.
+    
+    target_binary : str
+        Name of the binary target variable.
+    
+    cont_feat_flags : bool or dict, optional
+        True/False applies to every feature. A dict maps feature names to
+        flags. Features without a flag are inferred from a 100-row sample,
+        using the same rule as binned_prob_plot.
+    
+    transform_log_odds : bool, default=False
+        If True, transform probabilities to log odds before the Spearman
+        correlation.
+    
+    num_bins : int, default=10
+        Number of bins for continuous features.
+    
+    method : {"ntile", "approx_quantile"}, default="ntile"
+        "ntile" assigns equal-count bins with NTILE() over a sort of each
+        feature, close to the qcut bins of binned_prob_plot. "approx_quantile"
+        cuts at approx_quantile() edges from one streaming aggregate and
+        avoids the sort; ties always share a bin.
+    
+    sample_weight_col : str, optional
+        Column of observation weights. Bin rates, counts and mutual
+        information are then weighted.
+    
+    con : duckdb.DuckDBPyConnection, optional
+        Connection used to read a path or DataFrame source. A new in-memory
+        connection is used by default.
+    
+    show_plots : bool, default=False
+        If True, plot each feature with plot_binned_table.
+    
+    Returns
+    -------
+    summary : pd.DataFrame
+        One row per feature, as returned by scan_feature_monotonicity.
+    
+    tables : dict
+        Per-feature binned tables. Continuous tables also carry the
+        min_value and max_value of each bin.
+    """
+    import duckdb
+    
+    if method not in {"ntile", "approx_quantile"}:
+        raise ValueError("method must be either 'ntile' or 'approx_quantile'.")
+    
+    if isinstance(source, duckdb.DuckDBPyRelation):
+        rel = source
     else:
-        measure_name = "mutual_info"
-        df_mi = df[[feature + "_codes", target_binary]].dropna()
-        if not df_mi.empty:
-            measure_value = mutual_info_classif(
-                df_mi[[feature + "_codes"]], df_mi[target_binary], 
-                discrete_features=True
-            )[0]
+        con = con if con is not None else duckdb.connect()
+        if isinstance(source, pd.DataFrame):
+            rel = con.from_df(source)
         else:
-            measure_value = np.nan
-        p_value = None
+            rel = con.read_parquet(source)
     
-    # Plotting
-    if show_plot:
-        y_col = "transform_avg_prob" if transform_log_odds else "average_" + target_binary
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        plot_x = range(len(grouped)) if cont_feat_flag else grouped.index
-        
-        ax.plot(
-            plot_x, grouped[y_col],
-            marker="o", linestyle="-",
-            label="Log Odds" if transform_log_odds else "Probability"
-        )
-        ax.set_xlabel(feature, fontsize=14)
-        ax.set_ylabel("Log Odds" if transform_log_odds else "Probability", fontsize=14)
-        ax.tick_params(axis="both", labelsize=14)
+    missing_cols = [
+        col for col in list(features) + [target_binary, sample_weight_col]
+        if col is not None and col not in rel.columns
+    ]
+    if missing_cols:
+        raise ValueError(f"Columns not found in source: {missing_cols}")
+    
+    if isinstance(cont_feat_flags, dict):
+        flags = {feature: cont_feat_flags.get(feature) for feature in features}
+    else:
+        flags = {feature: cont_feat_flags for feature in features}
+    
+    t = _quote_identifier(target_binary)
+    w = _quote_identifier(sample_weight_col) if sample_weight_col else "1.0"
+    # Rows with a missing target do not count, as in the pandas groupby mean/count.
+    target_aggregates = """
+        SUM(CASE WHEN target_ IS NOT NULL THEN weight_ END) AS count,
+        SUM(target_ * weight_) / SUM(CASE WHEN target_ IS NOT NULL THEN weight_ END) AS average
+    """
+    
+    results = []
+    tables = {}
+    for feature in features:
+        x = _quote_identifier(feature)
+        cont_feat_flag = flags[feature]
+        if cont_feat_flag is None:
+            n_distinct, n_sampled = rel.query("src", f"""
+                SELECT COUNT(DISTINCT {x}), COUNT(*)
+                FROM (SELECT {x} FROM src WHERE {x} IS NOT NULL)
+                USING SAMPLE reservoir(100 ROWS) REPEATABLE (2025)
+            """).fetchone()
+            cont_feat_flag = n_sampled > 0 and n_distinct > min(60, n_sampled * 0.5)
+            print(f"Feature {feature} inferred as {'continuous' if cont_feat_flag else 'categorical'}.")
         
-        ax2 = ax.twinx()
-        ax2.bar(plot_x, grouped["count"], alpha=0.25, color="gray", 
-                align="center", label="Counts")
-        ax2.set_ylabel("Counts", fontsize=14)
-        ax2.tick_params(axis="y", labelsize=14)
-        ax2.set_ylim(0, ax2.get_ylim()[1] * 10)
+        if cont_feat_flag:
+            if method == "ntile":
+                bin_expr = f"NTILE({int(num_bins)}) OVER (ORDER BY {x})"
+            else:
+                quantile_grid = ", ".join(str(q) for q in np.linspace(0.0, 1.0, num_bins + 1)[1:-1])
+                edges = rel.query(
+                    "src", f"SELECT approx_quantile({x}, [{quantile_grid}]) FROM src"
+                ).fetchone()[0] or []
+                edges = np.unique([float(edge) for edge in edges if edge is not None])
+                # Bin i + 1 holds values below edge i; values at or above the last edge go last.
+                when_clauses = " ".join(
+                    f"WHEN {x} < {float(edge)!r} THEN {i + 1}" for i, edge in enumerate(edges)
+                )
+                bin_expr = f"CASE {when_clauses} ELSE {len(edges) + 1} END" if len(edges) else "1"
+            
+            binned = rel.query("src", f"""
+                SELECT bin, MIN(x) AS min_value, MAX(x) AS max_value, {target_aggregates}
+                FROM (
+                    SELECT {x} AS x, {t} AS target_, {w} AS weight_, {bin_expr} AS bin
+                    FROM src WHERE {x} IS NOT NULL
+                )
+                GROUP BY bin ORDER BY bin
+            """).df()
+            
+            grouped = pd.DataFrame({
+                "average_" + target_binary: binned["average"].to_numpy(dtype=float),
+                "count": binned["count"].fillna(0).to_numpy(dtype=float),
+                "min_value": binned["min_value"].to_numpy(),
+                "max_value": binned["max_value"].to_numpy(),
+            }, index=pd.Index(binned["bin"].astype(int).astype(str), name="bin_label"))
+        else:
+            cells = rel.query("src", f"""
+                SELECT {x} AS category, {t} AS target_, SUM({w}) AS weight_
+                FROM src WHERE {t} IS NOT NULL
+                GROUP BY ALL
+            """).df()
+            # Missing categories are kept as their own level for MI but left out of the table.
+            observed = cells[cells["category"].notna()]
+            grouped = (
+                observed.assign(weighted_target=observed["target_"] * observed["weight_"])
+                .groupby("category", sort=True)[["weighted_target", "weight_"]].sum()
+            )
+            grouped = pd.DataFrame({
+                "average_" + target_binary: grouped["weighted_target"] / grouped["weight_"],
+                "count": grouped["weight_"].astype(float),
+            }, index=grouped.index.rename("bin_label"))
         
-        ax.set_xticks(plot_x)
-        ax.set_xticklabels(grouped.index, rotation=45, ha="right", fontsize=14)
+        if transform_log_odds:
+            eps = 1e-6
+            grouped["transform_avg_prob"] = special.logit(
+                np.clip(grouped["average_" + target_binary], eps, 1 - eps)
+            )
         
-        h1, l1 = ax.get_legend_handles_labels()
-        h2, l2 = ax2.get_legend_handles_labels()
-        ax.legend(h1 + h2, l1 + l2, loc="upper right", fontsize=14)
+        if cont_feat_flag:
+            measure_name, measure_value, p_value = _binned_target_measure(
+                grouped, None, None, target_binary, True,
+                transform_log_odds=transform_log_odds,
+            )
+        else:
+            measure_name, p_value = "mutual_info", None
+            measure_value = (
+                contingency_mutual_info(
+                    cells[["category"]], cells["target_"],
+                    sample_weight=cells["weight_"].to_numpy(dtype=float),
+                )[0]
+                if not cells.empty else np.nan
+            )
         
-        title_suffix = (f" (Spearman: {measure_value:.3f})" if cont_feat_flag and measure_value is not None 
-                        else f" (MI: {measure_value:.3f})" if not cont_feat_flag and measure_value is not None 
-                        else "")
-        ax.set_title(f"Binned Probability Plot for {feature}{title_suffix}", fontsize=16)
-        ax.grid(alpha=0.3)
-        plt.tight_layout()
-        plt.show()
+        results.append(_binned_scan_summary(
+            grouped, feature, target_binary, cont_feat_flag,
+            measure_name, measure_value, p_value, transform_log_odds,
+        ))
+        tables[feature] = grouped
+    
+    summary = pd.DataFrame(results)
+    
+    if show_plots:
+        for row in summary.itertuples(index=False):
+            plot_binned_table(
+                tables[row.feature], row.feature, target_binary,
+                row.feature_type == "continuous",
+                transform_log_odds=transform_log_odds,
+                measure_value=row.measure_value,
+            )
     
-    return {
-        "feature": feature,
-        "measure_name": measure_name,
-        "measure_value": measure_value,
-        "p_value": p_value,
-        "log_odds": transform_log_odds
-    }
+    return summary, tables
 
 
 # =============================================================================
@@ -1901,6 +4611,70 @@ def parse_emp_length(x) -> int:
         return -1
 
 
+def parse_emp_length_vectorized(values):
+    """
+    Vectorized parse_emp_length for pandas, Polars and Arrow inputs.
+    
+    pandas input is factorized, parse_emp_length runs once per distinct
+    value, and the results are gathered back by code, so outputs are
+    identical to Series.apply(parse_emp_length). Polars and Arrow inputs
+    use their native string kernels with the same rules. Those inputs are
+    expected to be string columns.
+    
+    Parameters
+    ----------
+    values : pd.Series, array-like, polars.Expr, polars.Series, or pyarrow array
+        Employment length strings (e.g., "10+ years", "< 1 year", "n/a").
+    
+    Returns
+    -------
+    pd.Series, polars.Expr, polars.Series, or pyarrow.Array
+        Integer years, same container type as the input (array-like input
+        returns a pandas Series).
+    """
+    try:
+        import polars as pl
+        if isinstance(values, (pl.Expr, pl.Series)):
+            expr = values if isinstance(values, pl.Expr) else pl.col(values.name)
+            expr = expr.cast(pl.Utf8)
+            parsed = (
+                pl.when(expr.is_null() | (expr == "n/a")).then(0)
+                .when(expr.str.contains("< 1 year", literal=True)).then(0)
+                .when(expr.str.contains("10+ years", literal=True)).then(10)
+                .otherwise(expr.str.extract(r"(\d+)", 1).cast(pl.Int64, strict=False).fill_null(-1))
+                .cast(pl.Int64)
+            )
+            if isinstance(values, pl.Expr):
+                return parsed
+            return values.to_frame().select(parsed.alias(values.name)).to_series()
+    except ImportError:
+        pass
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        if isinstance(values, (pa.Array, pa.ChunkedArray)):
+            strings = pc.cast(values, pa.string())
+            is_missing = pc.or_kleene(pc.is_null(strings), pc.equal(strings, "n/a"))
+            is_under_one = pc.fill_null(pc.match_substring(strings, "< 1 year"), False)
+            is_ten_plus = pc.fill_null(pc.match_substring(strings, "10+ years"), False)
+            digits = pc.struct_field(pc.extract_regex(strings, r"(?P<years>\d+)"), [0])
+            years = pc.fill_null(pc.cast(digits, pa.int64()), -1)
+            return pc.if_else(
+                pc.fill_null(is_missing, True), 0,
+                pc.if_else(is_under_one, 0, pc.if_else(is_ten_plus, 10, years))
+            )
+    except ImportError:
+        pass
+    
+    values = values if isinstance(values, pd.Series) else pd.Series(values)
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    # The extra last entry serves the -1 code pandas uses for missing values.
+    parsed_uniques = np.array([parse_emp_length(x) for x in uniques] + [0], dtype=np.int64)
+    
+    return pd.Series(parsed_uniques[codes], index=values.index, name=values.name)
+
+
 def generate_eda_report(df: pd.DataFrame, title: str, output_path: str,
                         sample_frac: float = 0.1, random_state: int = 2025) -> None:
     """
@@ -1944,8 +4718,40 @@ def generate_eda_report(df: pd.DataFrame, title: str, output_path: str,
 # DATA SPLITTING UTILITIES
 # =============================================================================
 
+SPLIT_LABELS = ("train", "calib", "test")
+
+
+def _hash_split_positions(
+    df: pd.DataFrame,
+    hash_key: str | List[str],
+    train_size: float,
+    calib_size_rel: float,
+    random_state: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Assign rows to splits from a stable hash of the key column(s)."""
+    key_cols = [hash_key] if isinstance(hash_key, str) else list(hash_key)
+    missing_cols = [col for col in key_cols if col not in df.columns]
+    if missing_cols:
+        raise ValueError(f"hash_key columns not found in df: {missing_cols}")
+
+    # hash_pandas_object needs a 16-character key; derive it from the seed.
+    seed_key = str(int(random_state)).zfill(16)[-16:]
+    key_values = df[key_cols[0]] if len(key_cols) == 1 else df[key_cols]
+    hashes = pd.util.hash_pandas_object(key_values, index=False, hash_key=seed_key).to_numpy()
+    # hash_key only seeds string hashing, so mix the seed in again for numeric keys.
+    hashes = pd.util.hash_array(hashes ^ np.uint64(int(random_state) % 2 ** 64))
+    # Top 53 bits give a uniform draw in [0, 1) that depends only on the key.
+    uniform = (hashes >> np.uint64(11)).astype(np.float64) / float(2 ** 53)
+
+    calib_cutoff = train_size + (1 - train_size) * (1 - calib_size_rel)
+    split_codes = np.searchsorted(np.array([train_size, calib_cutoff]), uniform, side='right')
+
+    return tuple(np.flatnonzero(split_codes == code) for code in range(3))
+
+
 def split_data(df: pd.DataFrame, target_col: str = None, train_size: float = 0.6, 
-               calib_size_rel: float = 0.5, random_state: int = 2025) -> tuple:
+               calib_size_rel: float = 0.5, random_state: int = 2025,
+               output: str = "frames", hash_key: Optional[str | List[str]] = None) -> tuple:
     """
     Split data into train, calibration, and test sets.
     
@@ -1966,49 +4772,219 @@ def split_data(df: pd.DataFrame, target_col: str = None, train_size: float = 0.6
     random_state : int, default=2025
         Random seed for reproducibility.
     
+    output : {"frames", "indices", "labels"}, default="frames"
+        "frames" returns three DataFrames. "indices" returns three arrays of
+        row positions for df.iloc/df.take, without copying any data.
+        "labels" returns one categorical Series aligned to df.index with
+        values "train", "calib" and "test".
+    
+    hash_key : str or list of str, optional
+        Column(s) identifying an entity such as a loan. Each row's split then
+        depends only on a hash of its key and random_state, so the same loan
+        lands in the same split across runs and data refreshes, and all rows
+        of one key stay together. Split sizes then match the requested
+        proportions in expectation, and target_col is used only for reporting.
+        The assignment differs from split_parquet_by_loan, which hashes
+        inside DuckDB.
+    
     Returns
     -------
-    tuple
-        (df_train, df_calib, df_test) DataFrames.
+    tuple or pd.Series
+        (df_train, df_calib, df_test) DataFrames, (train_idx, calib_idx,
+        test_idx) position arrays, or a Series of split labels.
     """
-    from sklearn.model_selection import train_test_split
+    if output not in {"frames", "indices", "labels"}:
+        raise ValueError("output must be one of 'frames', 'indices', or 'labels'.")
     
-    print(f"Splitting data (stratify={'Yes' if target_col else 'No'})...")
     y = df[target_col] if target_col else None
 
-    if target_col:
-        stratify_param = y
-        # First split: Train and Temp (with stratification)
-        df_train, df_temp, y_train, y_temp = train_test_split(
-            df, y, train_size=train_size, random_state=random_state, stratify=stratify_param
-        )
-        # Second split: Temp into Calibration and Test (with stratification)
-        stratify_param_temp = y_temp
-        df_calib, df_test, y_calib, y_test = train_test_split(
-            df_temp, y_temp, test_size=calib_size_rel, random_state=random_state, stratify=stratify_param_temp
+    if hash_key is not None:
+        print(f"Splitting data (hash of {hash_key})...")
+        train_idx, calib_idx, test_idx = _hash_split_positions(
+            df, hash_key, train_size, calib_size_rel, random_state
         )
     else:
-        # First split: Train and Temp (without stratification)
-        df_train, df_temp = train_test_split(
-            df, train_size=train_size, random_state=random_state, stratify=None
+        from sklearn.model_selection import train_test_split
+        
+        print(f"Splitting data (stratify={'Yes' if target_col else 'No'})...")
+        # Split row positions rather than the frame so nothing is copied here.
+        positions = np.arange(len(df))
+        # First split: Train and Temp (stratified when target_col is given)
+        train_idx, temp_idx = train_test_split(
+            positions, train_size=train_size, random_state=random_state, stratify=y
         )
-        # Second split: Temp into Calibration and Test (without stratification)
-        df_calib, df_test = train_test_split(
-            df_temp, test_size=calib_size_rel, random_state=random_state, stratify=None
+        # Second split: Temp into Calibration and Test
+        calib_idx, test_idx = train_test_split(
+            temp_idx, test_size=calib_size_rel, random_state=random_state,
+            stratify=y.iloc[temp_idx] if target_col else None
         )
-        # Assign None to y splits as they don't exist
-        y_train, y_temp, y_calib, y_test = None, None, None, None
 
-    print(f"  Train shape: {df_train.shape}")
-    print(f"  Calibration shape: {df_calib.shape}")
-    print(f"  Test shape: {df_test.shape}")
+    n_cols = df.shape[1]
+    print(f"  Train shape: {(len(train_idx), n_cols)}")
+    print(f"  Calibration shape: {(len(calib_idx), n_cols)}")
+    print(f"  Test shape: {(len(test_idx), n_cols)}")
     if target_col:
-        print(f"  Train target mean: {y_train.mean():.4f}")
-        print(f"  Calibration target mean: {y_calib.mean():.4f}")
-        print(f"  Test target mean: {y_test.mean():.4f}")
+        print(f"  Train target mean: {y.iloc[train_idx].mean():.4f}")
+        print(f"  Calibration target mean: {y.iloc[calib_idx].mean():.4f}")
+        print(f"  Test target mean: {y.iloc[test_idx].mean():.4f}")
+
+    if output == "indices":
+        return train_idx, calib_idx, test_idx
+
+    if output == "labels":
+        split_codes = np.empty(len(df), dtype=np.int8)
+        for code, idx in enumerate((train_idx, calib_idx, test_idx)):
+            split_codes[idx] = code
+        return pd.Series(
+            pd.Categorical.from_codes(split_codes, categories=list(SPLIT_LABELS)),
+            index=df.index, name="split",
+        )
+
+    # take() builds each split once, with no extra defensive copy
+    return df.take(train_idx), df.take(calib_idx), df.take(test_idx)
 
-    # Return copies
-    return df_train.copy(), df_calib.copy(), df_test.copy()
+
+def split_parquet_by_loan(
+    source: str,
+    output_dir: str,
+    loan_id_col: str = "loan_id",
+    train_size: float = 0.6,
+    calib_size_rel: float = 0.5,
+    stratify_col: Optional[str] = None,
+    random_state: int = 2025,
+    con=None,
+) -> pd.DataFrame:
+    """
+    Split a loan-level panel on disk into train/calibration/test Parquet outputs.
+    
+    Splits are assigned inside DuckDB from hash(loan_id, random_state), so
+    every month of a loan lands in the same split, and the result is stable
+    across runs and data refreshes. Rows are written with COPY ...
+    PARTITION_BY (split), so the panel is never loaded into Python. The
+    split=train/calib/test folders are replaced on every call, and the
+    summary comes from a loan-level pass over the key columns rather than
+    from re-reading the output.
+    
+    This is not interchangeable with split_data(hash_key=...): that function
+    hashes keys with pandas, so the same loan and random_state generally map
+    to a different split. Use one of the two for a given project.
+    
+    Parameters
+    ----------
+    source : str
+        Parquet path or glob, e.g. 'parquet-fanniemae-SFLP/*.parquet'.
+    
+    output_dir : str
+        Destination directory. Files are written to
+        output_dir/split=train, split=calib and split=test.
+    
+    loan_id_col : str, default="loan_id"
+        Column identifying a loan.
+    
+    train_size : float, default=0.6
+        Proportion of loans for the training set.
+    
+    calib_size_rel : float, default=0.5
+        Proportion of the remaining loans for the test set, matching
+        split_data.
+    
+    stratify_col : str, optional
+        Column whose per-loan MAX defines the loan-level outcome (e.g. an
+        ever-default flag). Loans are then ranked by hash within each outcome
+        so every split gets the same outcome mix. The write then joins the
+        panel to the loan-level assignment. Without it, rows are split in one
+        streaming pass.
+    
+    random_state : int, default=2025
+        Hash seed. Changing it gives a different, equally stable split.
+    
+    con : duckdb.DuckDBPyConnection, optional
+        Connection to use. A new in-memory connection is used by default.
+    
+    Returns
+    -------
+    pd.DataFrame
+        Row and loan counts per split (and outcome rate when stratified).
+    """
+    import duckdb
+    
+    con = con if con is not None else duckdb.connect()
+    source_sql = _quote_string_literal(source)
+    output_sql = _quote_string_literal(output_dir)
+    loan_id = _quote_identifier(loan_id_col)
+    calib_cutoff = train_size + (1 - train_size) * (1 - calib_size_rel)
+    
+    def split_case(position: str) -> str:
+        return (f"CASE WHEN {position} < {train_size!r} THEN 'train' "
+                f"WHEN {position} < {calib_cutoff!r} THEN 'calib' ELSE 'test' END")
+    
+    # Top 53 bits of the 64-bit hash give a uniform draw in [0, 1) per loan.
+    loan_uniform = f"(hash({loan_id}, {int(random_state)}) >> 11) / 9007199254740992.0"
+    
+    print(f"Splitting {source} by {loan_id_col} "
+          f"(stratify={'Yes' if stratify_col else 'No'})...")
+    
+    # One loan-level pass assigns splits and keeps the per-loan row counts,
+    # so the summary never re-reads the written files.
+    if stratify_col is None:
+        loan_splits = f"""
+            SELECT {loan_id} AS loan_key_, COUNT(*) AS n_rows_,
+                   {split_case(loan_uniform)} AS split
+            FROM read_parquet({source_sql})
+            GROUP BY {loan_id}
+        """
+        query = f"""
+            SELECT *, {split_case(loan_uniform)} AS split
+            FROM read_parquet({source_sql})
+        """
+    else:
+        outcome = _quote_identifier(stratify_col)
+        # Rank loans by hash inside each outcome so the split shares hold per stratum.
+        loan_splits = f"""
+            WITH loans AS (
+                SELECT {loan_id} AS loan_key_, COUNT(*) AS n_rows_,
+                       MAX({outcome}) AS outcome_, {loan_uniform} AS uniform_
+                FROM read_parquet({source_sql})
+                GROUP BY {loan_id}
+            )
+            SELECT loan_key_, n_rows_, outcome_,
+                   {split_case("(ROW_NUMBER() OVER (PARTITION BY outcome_ ORDER BY uniform_, loan_key_) - 1)"
+                               " / COUNT(*) OVER (PARTITION BY outcome_)")} AS split
+            FROM loans
+        """
+        query = f"""
+            SELECT panel.*, loan_splits_.split
+            FROM read_parquet({source_sql}) AS panel
+            JOIN loan_splits_ ON panel.{loan_id} IS NOT DISTINCT FROM loan_splits_.loan_key_
+        """
+    
+    con.execute(f"CREATE OR REPLACE TEMP TABLE loan_splits_ AS {loan_splits}")
+    try:
+        # Partitions from an earlier run would otherwise keep stale files
+        # next to the new ones; other contents of output_dir are left alone.
+        for split_name in ("train", "calib", "test"):
+            shutil.rmtree(os.path.join(output_dir, f"split={split_name}"), ignore_errors=True)
+        con.execute(f"""
+            COPY ({query}) TO {output_sql}
+            (FORMAT parquet, PARTITION_BY (split), OVERWRITE_OR_IGNORE)
+        """)
+        
+        outcome_summary = ""
+        if stratify_col:
+            outcome_summary = ", AVG(CAST(outcome_ AS DOUBLE)) AS loan_outcome_rate"
+        summary = con.execute(f"""
+            SELECT split, CAST(SUM(n_rows_) AS BIGINT) AS n_rows, COUNT(*) AS n_loans{outcome_summary}
+            FROM loan_splits_
+            GROUP BY split
+            ORDER BY CASE split WHEN 'train' THEN 0 WHEN 'calib' THEN 1 ELSE 2 END
+        """).df()
+    finally:
+        con.execute("DROP TABLE IF EXISTS loan_splits_")
+    
+    for row in summary.itertuples(index=False):
+        print(f"  {row.split}: {int(row.n_rows):,} rows, {int(row.n_loans):,} loans")
+    
+    return summary
 
 
 def train_autogluon_model(
@@ -2094,16 +5070,90 @@ def train_autogluon_model(
     return ag_model_wrapped
 
 
-def summarize_ttd_by_source(df_ttd: pd.DataFrame, target_col: str = 'default_flag', 
+def _summarize_ttd_duckdb(rel, target_col: str, weight_col: str, source_col: str) -> pd.DataFrame:
+    """TTD summary in one DuckDB aggregation."""
+    t = _quote_identifier(target_col)
+    w = _quote_identifier(weight_col)
+    s = _quote_identifier(source_col)
+    # Any missing target or weight makes the weighted rate missing, as np.average does.
+    return rel.query("ttd", f"""
+        SELECT {s},
+               COUNT(*) AS row_count,
+               SUM({w}) AS sum_weights,
+               AVG({t}) AS unweighted_default_rate,
+               CASE WHEN COUNT({t}) = COUNT(*) AND COUNT({w}) = COUNT(*) AND SUM({w}) > 0
+                    THEN SUM({t} * {w}) / SUM({w}) END AS weighted_default_rate
+        FROM ttd
+        GROUP BY {s}
+        ORDER BY {s}
+    """).df()
+
+
+def _summarize_ttd_polars(df_ttd, target_col: str, weight_col: str, source_col: str) -> pd.DataFrame:
+    """TTD summary in one Polars group_by aggregation."""
+    import polars as pl
+    
+    target = pl.col(target_col).cast(pl.Float64).fill_nan(None)
+    weight = pl.col(weight_col).cast(pl.Float64).fill_nan(None)
+    summary = (
+        df_ttd.lazy()
+        .group_by(source_col)
+        .agg(
+            pl.len().alias("row_count"),
+            weight.sum().alias("sum_weights"),
+            target.mean().alias("unweighted_default_rate"),
+            pl.when(
+                (target.null_count() == 0) & (weight.null_count() == 0) & (weight.sum() > 0)
+            ).then((target * weight).sum() / weight.sum()).alias("weighted_default_rate"),
+        )
+        .sort(source_col)
+        .collect()
+    )
+    return summary.to_pandas()
+
+
+def _summarize_ttd_pandas(df_ttd: pd.DataFrame, target_col: str, weight_col: str,
+                          source_col: str) -> pd.DataFrame:
+    """TTD summary in one vectorized pandas groupby."""
+    target = pd.to_numeric(df_ttd[target_col], errors='coerce').astype(float)
+    weight = pd.to_numeric(df_ttd[weight_col], errors='coerce').astype(float)
+    summary_df = pd.DataFrame({
+        "target": target,
+        "weight": weight,
+        "weighted_target": target * weight,
+        "has_missing": target.isna() | weight.isna(),
+        source_col: df_ttd[source_col],
+    }).groupby(source_col, observed=True).agg(
+        row_count=("target", "size"),
+        sum_weights=("weight", "sum"),
+        unweighted_default_rate=("target", "mean"),
+        weighted_target=("weighted_target", "sum"),
+        has_missing=("has_missing", "any"),
+    )
+    
+    # Weighted sum over sum of weights; missing values propagate, as np.average does.
+    valid = ~summary_df["has_missing"] & (summary_df["sum_weights"] > 0)
+    summary_df["weighted_default_rate"] = (
+        summary_df["weighted_target"] / summary_df["sum_weights"]
+    ).where(valid)
+    
+    return summary_df.drop(columns=["weighted_target", "has_missing"]).reset_index()
+
+
+def summarize_ttd_by_source(df_ttd, target_col: str = 'default_flag', 
                             weight_col: str = 'sample_weight', 
                             source_col: str = 'source') -> pd.DataFrame:
     """
     Calculate summary statistics for a TTD DataFrame grouped by source.
     
+    Every statistic comes from a single grouped aggregation. The weighted
+    default rate is the weighted sum of the target over the sum of weights.
+    
     Parameters
     ----------
-    df_ttd : pd.DataFrame
-        TTD DataFrame with source column.
+    df_ttd : pd.DataFrame, polars.DataFrame, polars.LazyFrame, duckdb relation, or str
+        TTD data with source column. A string is read as a Parquet path or
+        glob with DuckDB, e.g. the output_path of create_TTD_data.
     
     target_col : str, default='default_flag'
         Name of target column.
@@ -2120,20 +5170,28 @@ def summarize_ttd_by_source(df_ttd: pd.DataFrame, target_col: str = 'default_fla
         Summary statistics by source.
     """
     print(f"\n--- Summarizing TTD Data by '{source_col}' ---")
-    # Step 1: Calculate standard aggregations
-    summary_stats = df_ttd.groupby(source_col).agg(
-        row_count=(target_col, 'size'),
-        sum_weights=(weight_col, 'sum'),
-        unweighted_default_rate=(target_col, 'mean')
-    ).reset_index()
-
-    # Step 2: Calculate weighted default rate separately using apply
-    weighted_rates = df_ttd.groupby(source_col).apply(
-        lambda x: np.average(x[target_col], weights=x[weight_col]) if x[weight_col].sum() > 0 else np.nan
-    ).reset_index(name='weighted_default_rate')
-
-    # Step 3: Merge the results
-    summary_df = pd.merge(summary_stats, weighted_rates, on=source_col)
+    
+    if isinstance(df_ttd, (str, os.PathLike)):
+        import duckdb
+        df_ttd = duckdb.read_parquet(os.fspath(df_ttd))
+    
+    summary_df = None
+    try:
+        import duckdb
+        if isinstance(df_ttd, duckdb.DuckDBPyRelation):
+            summary_df = _summarize_ttd_duckdb(df_ttd, target_col, weight_col, source_col)
+    except ImportError:
+        pass
+    try:
+        import polars as pl
+        if isinstance(df_ttd, (pl.DataFrame, pl.LazyFrame)):
+            summary_df = _summarize_ttd_polars(df_ttd, target_col, weight_col, source_col)
+    except ImportError:
+        pass
+    if summary_df is None:
+        summary_df = _summarize_ttd_pandas(df_ttd, target_col, weight_col, source_col)
+    
+    summary_df["row_count"] = summary_df["row_count"].astype(np.int64)
 
     # Display the summary
     print("Summary of Default Rates by Source:")
@@ -2141,6 +5199,199 @@ def summarize_ttd_by_source(df_ttd: pd.DataFrame, target_col: str = 'default_fla
     return summary_df
 
 
+TTD_SOURCE_CATEGORIES = ("Accepted", "Rejected")
+
+
+def _map_row_chunks(
+    func: Callable,
+    data: pd.DataFrame,
+    batch_size: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+    prefer: str = "processes",
+    columns: Optional[list] = None,
+    func_args: tuple = (),
+) -> Tuple[list, list]:
+    """
+    Apply func(*func_args, chunk) to consecutive row chunks of data.
+    
+    Chunks are sliced lazily (and restricted to columns when given), so the
+    full input is never copied. With n_jobs, chunks fan out over a joblib
+    pool and batch_size defaults to an even split across workers. Returns
+    the chunk start offsets and results, both in row order.
+    """
+    n_rows = len(data)
+    if batch_size is None:
+        from joblib import effective_n_jobs
+        
+        batch_size = int(np.ceil(n_rows / effective_n_jobs(n_jobs))) if n_jobs else n_rows
+        batch_size = max(batch_size, 1)
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    
+    starts = list(range(0, n_rows, batch_size)) or [0]
+    
+    def chunk_at(start):
+        chunk = data.iloc[start:start + batch_size]
+        return chunk if columns is None else chunk[columns]
+    
+    if n_jobs is not None and n_jobs != 1:
+        from joblib import Parallel, delayed
+        
+        results = Parallel(n_jobs=n_jobs, prefer=prefer)(
+            delayed(func)(*func_args, chunk_at(start)) for start in starts
+        )
+    else:
+        results = [func(*func_args, chunk_at(start)) for start in starts]
+    
+    return starts, results
+
+
+def _stitch_row_chunks(starts: list, results: list, n_rows: int) -> np.ndarray:
+    """Write chunk results into one pre-allocated array in row order."""
+    first = np.asarray(results[0])
+    out = np.empty((n_rows,) + first.shape[1:], dtype=first.dtype)
+    for start, chunk in zip(starts, results):
+        chunk = np.asarray(chunk)
+        out[start:start + chunk.shape[0]] = chunk
+    return out
+
+
+def _predict_positive_chunk(model, features: pd.DataFrame) -> np.ndarray:
+    """Positive-class column of predict_proba for one chunk (module-level so it pickles)."""
+    return model.predict_proba(features)[:, 1]
+
+
+def _predict_positive_in_batches(
+    model,
+    data: pd.DataFrame,
+    columns: list,
+    batch_size: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+    prefer: str = "processes",
+) -> np.ndarray:
+    """
+    Score data[columns] with predict_proba in row chunks, optionally in parallel.
+    
+    Chunk results are written back in order, so the output matches a single
+    predict_proba call for row-wise models.
+    """
+    if batch_size is None and (n_jobs is None or n_jobs == 1):
+        return _predict_positive_chunk(model, data[columns])
+    
+    starts, chunk_scores = _map_row_chunks(
+        _predict_positive_chunk, data, batch_size=batch_size, n_jobs=n_jobs,
+        prefer=prefer, columns=columns, func_args=(model,),
+    )
+    return _stitch_row_chunks(starts, chunk_scores, len(data)).astype(float, copy=False)
+
+
+def _stack_ttd_column(pieces: list, n_rows: int):
+    """Stack column pieces into one pre-allocated array when they share a NumPy dtype."""
+    dtypes = {piece.dtype for piece in pieces}
+    if len(dtypes) == 1 and isinstance(next(iter(dtypes)), np.dtype):
+        out = np.empty(n_rows, dtype=next(iter(dtypes)))
+        start = 0
+        for piece in pieces:
+            out[start:start + len(piece)] = piece.to_numpy()
+            start += len(piece)
+        return out
+    # Mixed or extension dtypes: let pandas pick the common dtype, as concat would.
+    return pd.concat(pieces, ignore_index=True)
+
+
+def _ttd_frame(
+    segments: list,
+    modeling_features: list,
+    target_col: str,
+) -> pd.DataFrame:
+    """
+    Assemble a TTD frame column by column from segments.
+    
+    Each segment is (frame, target, weight, source_code). target is None to
+    keep frame[target_col], or a constant label (np.nan for unlabelled rows).
+    """
+    n_rows = sum(len(frame) for frame, _, _, _ in segments)
+    columns = {
+        col: _stack_ttd_column([frame[col] for frame, _, _, _ in segments], n_rows)
+        for col in modeling_features
+    }
+    columns[target_col] = _stack_ttd_column([
+        frame[target_col] if target is None else pd.Series(np.full(len(frame), target))
+        for frame, target, _, _ in segments
+    ], n_rows)
+    
+    sample_weight = np.empty(n_rows, dtype=np.float32)
+    source_codes = np.empty(n_rows, dtype=np.int8)
+    start = 0
+    for frame, _, weight, source_code in segments:
+        stop = start + len(frame)
+        sample_weight[start:stop] = weight
+        source_codes[start:stop] = source_code
+        start = stop
+    columns['sample_weight'] = sample_weight
+    columns['source'] = pd.Categorical.from_codes(
+        source_codes, categories=list(TTD_SOURCE_CATEGORIES)
+    )
+    
+    return pd.DataFrame(columns, copy=False)
+
+
+def _write_ttd_parquet(
+    segments: list,
+    modeling_features: list,
+    target_col: str,
+    output_path: str,
+    chunk_size: int,
+) -> int:
+    """Write TTD segments to one Parquet file, at most chunk_size rows at a time."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    # Zero-row slices give the pandas dtypes of the full TTD frame. Object
+    # columns carry no Arrow type at zero rows, so infer each one from the
+    # first non-null values across all segments (string if none exist);
+    # otherwise a chunk that starts all-null would pin the column to null.
+    empty_ttd = _ttd_frame(
+        [(frame.iloc[:0], target, 1.0, source_code) for frame, target, _, source_code in segments],
+        modeling_features, target_col,
+    )
+    ttd_dtypes = empty_ttd.dtypes
+    schema = pa.Schema.from_pandas(empty_ttd, preserve_index=False)
+    for i, field in enumerate(schema):
+        if not pa.types.is_null(field.type):
+            continue
+        arrow_type = pa.string()
+        for frame, _, _, _ in segments:
+            if field.name in frame.columns:
+                values = frame[field.name].dropna()
+                if len(values):
+                    arrow_type = pa.Array.from_pandas(values.iloc[:1000]).type
+                    break
+        schema = schema.set(i, field.with_type(arrow_type))
+    
+    n_rows = 0
+    writer = None
+    try:
+        for frame, target, weight, source_code in segments:
+            weight = np.broadcast_to(np.asarray(weight, dtype=np.float32), (len(frame),))
+            for start in range(0, len(frame), chunk_size):
+                stop = min(start + chunk_size, len(frame))
+                chunk = _ttd_frame(
+                    [(frame.iloc[start:stop], target, weight[start:stop], source_code)],
+                    modeling_features, target_col,
+                ).astype(ttd_dtypes)
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, schema)
+                writer.write_table(table)
+                n_rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    return n_rows
+
+
 def create_TTD_data(
     ri_model,
     df_rejected: pd.DataFrame,
@@ -2148,8 +5399,13 @@ def create_TTD_data(
     ri_features: list,
     modeling_features: list,
     target_col: str = 'default_flag',
-    clone_rejected: bool = True
-) -> pd.DataFrame:
+    clone_rejected: bool = True,
+    output_path: Optional[str] = None,
+    chunk_size: int = 1_000_000,
+    ri_batch_size: Optional[int] = None,
+    ri_n_jobs: Optional[int] = None,
+    ri_prefer: str = "processes"
+) -> pd.DataFrame | Dict[str, Any]:
     """
     Create a Through-the-Door (TTD) dataset using Fuzzy Augmentation.
     
@@ -2157,6 +5413,10 @@ def create_TTD_data(
     their probability of default, then creates weighted copies of the rejected data
     and combines them with the accepted data.
     
+    The output is assembled column by column into pre-allocated arrays, so
+    the inputs are not copied and the rejected clones are never built as
+    separate frames. 'sample_weight' is float32 and 'source' is categorical.
+    
     Parameters
     ----------
     ri_model : estimator or None
@@ -2181,81 +5441,64 @@ def create_TTD_data(
     clone_rejected : bool, default=True
         If True, creates two copies of rejected data (one for each class).
     
+    output_path : str, optional
+        If given, the TTD dataset is written to this Parquet file in chunks
+        instead of being returned, so the full TTD frame is never held in
+        memory.
+    
+    chunk_size : int, default=1_000_000
+        Maximum rows per chunk when output_path is given.
+    
+    ri_batch_size : int, optional
+        Score rejected applicants with ri_model in chunks of this many rows.
+        None scores them in one call unless ri_n_jobs is set.
+    
+    ri_n_jobs : int, optional
+        Number of joblib workers for RI scoring. Chunks default to an even
+        split across workers when ri_batch_size is None.
+    
+    ri_prefer : {"processes", "threads"}, default="processes"
+        joblib backend preference for RI scoring. Use "threads" for models
+        that release the GIL or are expensive to pickle.
+    
     Returns
     -------
-    pd.DataFrame
-        Augmented TTD dataset with 'sample_weight' and 'source' columns.
+    pd.DataFrame or dict
+        Augmented TTD dataset with 'sample_weight' and 'source' columns, or
+        a summary with output_path and n_rows when output_path is given.
+        Unlabelled rejected rows (ri_model=None) have a missing target.
     """
-    # Ensure dataframes are copies to avoid modifying originals
-    df_rejected_proc = df_rejected.copy()
-    df_accepted_proc = df_accepted.copy()
-
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    
+    # Each segment is (frame, target, sample_weight, source code); target None keeps the label.
+    segments = [(df_accepted, None, 1.0, 0)]
+    
     # Check if ri_model is None - skip fuzzy augmentation if so
     if ri_model is None:
         print("No RI model provided. Creating TTD data with uniform weights (sample_weight=1)...")
-        
-        # Prepare Accepted Data
-        df_accepted_weighted = df_accepted_proc[modeling_features + [target_col]].copy()
-        df_accepted_weighted['sample_weight'] = 1.0
-        df_accepted_weighted['source'] = 'Accepted'
-        
-        # Prepare Rejected Data
-        df_rejected_weighted = df_rejected_proc[modeling_features].copy()
-        df_rejected_weighted['sample_weight'] = 1.0
-        df_rejected_weighted[target_col] = None
-        df_rejected_weighted['source'] = 'Rejected'
-        
-        cols_for_ttd = modeling_features + [target_col, 'sample_weight', 'source']
-        
-        df_ttd = pd.concat(
-            [df_accepted_weighted[cols_for_ttd], df_rejected_weighted[cols_for_ttd]],
-            ignore_index=True
-        )
+        segments.append((df_rejected, np.nan, 1.0, 1))
     else:
         print("Applying RI model to rejected data and calculating weights...")
         
-        # 1. Prepare Rejected Data for RI Prediction
-        X_rej_ri = df_rejected_proc[ri_features]
-        
-        # 2. Predict Probabilities for Rejected Applicants
-        prob_default_rejected = ri_model.predict_proba(X_rej_ri)[:, 1]
-        prob_good_rejected = 1.0 - prob_default_rejected
-        
-        # 3. Create two weighted copies of rejected data
-        # Copy 1: Assumed Bad (target_col = 1)
-        df_rejected_bad = df_rejected_proc[modeling_features].copy()
-        df_rejected_bad['sample_weight'] = prob_default_rejected
-        df_rejected_bad[target_col] = 1
-        df_rejected_bad['source'] = 'Rejected'
-        
-        # Copy 2: Assumed Good (target_col = 0)
-        df_rejected_good = df_rejected_proc[modeling_features].copy()
-        df_rejected_good['sample_weight'] = prob_good_rejected
-        df_rejected_good[target_col] = 0
-        df_rejected_good['source'] = 'Rejected'
-        
-        # 4. Prepare Accepted Data
-        df_accepted_weighted = df_accepted_proc[modeling_features + [target_col]].copy()
-        df_accepted_weighted['sample_weight'] = 1.0
-        df_accepted_weighted['source'] = 'Accepted'
-        
-        # 5. Define columns for final TTD dataset
-        cols_for_ttd = modeling_features + [target_col, 'sample_weight', 'source']
+        # Predict probabilities for rejected applicants
+        prob_default_rejected = _predict_positive_in_batches(
+            ri_model, df_rejected, ri_features,
+            batch_size=ri_batch_size, n_jobs=ri_n_jobs, prefer=ri_prefer,
+        )
         
-        # 6. Concatenate
+        # Assumed Bad (target_col = 1), weighted by PD
+        segments.append((df_rejected, 1, prob_default_rejected, 1))
         if clone_rejected:
-            df_ttd = pd.concat(
-                [df_accepted_weighted[cols_for_ttd], 
-                 df_rejected_bad[cols_for_ttd], 
-                 df_rejected_good[cols_for_ttd]],
-                ignore_index=True
-            )
-        else:
-            # Use only bad copies
-            df_ttd = pd.concat(
-                [df_accepted_weighted[cols_for_ttd], df_rejected_bad[cols_for_ttd]],
-                ignore_index=True
-            )
+            # Assumed Good (target_col = 0), weighted by 1 - PD
+            segments.append((df_rejected, 0, 1.0 - prob_default_rejected, 1))
+    
+    if output_path is not None:
+        n_rows = _write_ttd_parquet(segments, modeling_features, target_col, output_path, chunk_size)
+        print(f"TTD dataset written to {output_path}. Rows: {n_rows:,}")
+        return {"output_path": output_path, "n_rows": n_rows}
+    
+    df_ttd = _ttd_frame(segments, modeling_features, target_col)
     
     print(f"TTD dataset created. Shape: {df_ttd.shape}")
     return df_ttd
@@ -2265,6 +5508,110 @@ def create_TTD_data(
 # ADVERSE ACTION CODES
 # =============================================================================
 
+def generate_adverse_action_codes_batch(
+    df_rejected: pd.DataFrame,
+    df_counterfactuals: pd.DataFrame,
+    dict_feature_to_action: Dict[str, str],
+    list_features_to_compare: List[str],
+    feature_scores=None,
+    max_codes: Optional[int] = None,
+    output: str = "lists"
+) -> List[List[str]] | pd.DataFrame:
+    """
+    Generate adverse action codes for many rejected applicants at once.
+    
+    Row i of df_counterfactuals is the chosen counterfactual for row i of
+    df_rejected (rows are matched by position). A feature produces a code
+    when its rejected and counterfactual values differ. Comparisons and
+    ranking are vectorized across all applicants.
+    
+    Parameters
+    ----------
+    df_rejected : pd.DataFrame
+        Rejected applicants, one row each.
+    
+    df_counterfactuals : pd.DataFrame
+        Counterfactuals aligned row by row with df_rejected.
+    
+    dict_feature_to_action : dict
+        Mapping from feature names to adverse action messages.
+    
+    list_features_to_compare : list
+        Feature names to compare, in order of importance. This order ranks
+        the codes and breaks ties in feature_scores.
+    
+    feature_scores : pd.DataFrame or array-like, optional
+        Per-applicant feature scores of shape (n_applicants, n_features),
+        e.g. local SHAP magnitudes, with columns in list_features_to_compare
+        order (or named by feature). Codes are then ranked by descending
+        score, with ties in importance order.
+    
+    max_codes : int, optional
+        Keep at most this many codes per applicant.
+    
+    output : {"lists", "matrix"}, default="lists"
+        "lists" returns one list of codes per applicant. "matrix" returns a
+        DataFrame with columns reason_code_1, ..., reason_code_k indexed like
+        df_rejected, padded with missing values.
+    
+    Returns
+    -------
+    list of list or pd.DataFrame
+        Ranked adverse action codes per applicant.
+    """
+    if output not in {"lists", "matrix"}:
+        raise ValueError("output must be either 'lists' or 'matrix'.")
+    if len(df_rejected) != len(df_counterfactuals):
+        raise ValueError("df_rejected and df_counterfactuals must have the same number of rows.")
+    
+    features = list(list_features_to_compare)
+    n_rows, n_features = len(df_rejected), len(features)
+    
+    differs = np.empty((n_rows, n_features), dtype=bool)
+    for j, feature in enumerate(features):
+        original_values = pd.Series(df_rejected[feature].to_numpy())
+        counterfactual_values = pd.Series(df_counterfactuals[feature].to_numpy())
+        # ne() treats a missing value on either side as a difference, like !=.
+        differs[:, j] = original_values.ne(counterfactual_values).fillna(True).to_numpy(dtype=bool)
+    
+    missing_actions = [
+        feature for j, feature in enumerate(features)
+        if feature not in dict_feature_to_action and differs[:, j].any()
+    ]
+    if missing_actions:
+        raise KeyError(missing_actions[0])
+    actions = np.array([dict_feature_to_action.get(feature) for feature in features], dtype=object)
+    
+    # Rank differing features first, by descending score, then by importance position.
+    if feature_scores is None:
+        primary_key = np.zeros((n_rows, n_features))
+    else:
+        if isinstance(feature_scores, pd.DataFrame) and set(features).issubset(feature_scores.columns):
+            feature_scores = feature_scores[features]
+        primary_key = -np.asarray(feature_scores, dtype=float)
+        if primary_key.shape != (n_rows, n_features):
+            raise ValueError("feature_scores must have shape (n_applicants, n_features).")
+        primary_key = np.nan_to_num(primary_key, nan=0.0)
+    primary_key = np.where(differs, primary_key, np.inf)
+    importance_key = np.broadcast_to(np.arange(n_features), (n_rows, n_features))
+    order = np.lexsort((importance_key, primary_key), axis=-1)
+    
+    n_codes = differs.sum(axis=1)
+    width = n_features if max_codes is None else min(int(max_codes), n_features)
+    n_codes = np.minimum(n_codes, width)
+    ranked_actions = actions[order[:, :width]]
+    ranked_actions[np.arange(width) >= n_codes[:, None]] = None
+    
+    if output == "matrix":
+        return pd.DataFrame(
+            ranked_actions,
+            index=df_rejected.index,
+            columns=[f"reason_code_{k}" for k in range(1, width + 1)],
+        )
+    
+    return [row[:count].tolist() for row, count in zip(ranked_actions, n_codes)]
+
+
 def generate_adverse_action_codes(
     df_rejected: pd.DataFrame,
     df_counterfactuals: pd.DataFrame,
@@ -2275,6 +5622,8 @@ def generate_adverse_action_codes(
     Generate adverse action codes based on differences between 
     a rejected applicant and counterfactuals.
     
+    Single-applicant form of generate_adverse_action_codes_batch.
+    
     Parameters
     ----------
     df_rejected : pd.DataFrame
@@ -2294,12 +5643,9 @@ def generate_adverse_action_codes(
     list
         List of adverse action code strings.
     """
-    adverse_action_codes = []
-    
-    for feature in list_features_to_compare:
-        original_value = df_rejected[feature].iloc[0]
-        counterfactual_value = df_counterfactuals[feature].iloc[0]
-        if original_value != counterfactual_value:
-            adverse_action_codes.append(dict_feature_to_action[feature])
-    
-    return adverse_action_codes
\ No newline at end of file
+    return generate_adverse_action_codes_batch(
+        df_rejected.iloc[:1],
+        df_counterfactuals.iloc[:1],
+        dict_feature_to_action,
+        list_features_to_compare,
+    )[0]
\ No newline at end of file
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.feature_selection import mutual_info_classif
+from sklearn.metrics import mutual_info_score
+
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import contingency_information_value, contingency_mutual_info
+
+
+@pytest.fixture
+def discrete():
+    rng = np.random.default_rng(5)
+    n = 3_000
+    y = rng.integers(0, 2, n)
+    X = pd.DataFrame({
+        "related": np.where(rng.random(n) < 0.7, y * 2 + rng.integers(0, 2, n), rng.integers(0, 4, n)),
+        "noise": rng.integers(0, 6, n),
+        "grade": pd.Categorical(rng.choice(list("ABC"), n)),
+    })
+    return X, y
+
+
+def test_mutual_info_matches_sklearn(discrete):
+    X, y = discrete
+    codes = X.assign(grade=X["grade"].cat.codes).to_numpy()
+    expected = mutual_info_classif(codes, y, discrete_features=True)
+    np.testing.assert_allclose(contingency_mutual_info(X, y), expected, rtol=1e-10, atol=1e-12)
+
+
+def test_integer_weights_match_repeated_rows(discrete):
+    X, y = discrete
+    weight = np.random.default_rng(6).integers(1, 4, y.size)
+    repeated = X.loc[X.index.repeat(weight)]
+    expected = [mutual_info_score(repeated[column], np.repeat(y, weight)) for column in X]
+    np.testing.assert_allclose(
+        contingency_mutual_info(X, y, sample_weight=weight), expected, rtol=1e-10, atol=1e-12
+    )
+
+
+def test_information_value_matches_manual_woe(discrete):
+    X, y = discrete
+    smoothing = 0.5
+    expected = []
+    for column in X:
+        counts = pd.crosstab(X[column], y).to_numpy() + smoothing
+        pct_good, pct_bad = counts[:, 0] / counts[:, 0].sum(), counts[:, 1] / counts[:, 1].sum()
+        expected.append(np.sum((pct_good - pct_bad) * np.log(pct_good / pct_bad)))
+
+    result = contingency_information_value(X, y, n_bins=None, smoothing=smoothing)
+    np.testing.assert_allclose(result, expected, rtol=1e-10)
+    assert result[0] > result[1]
+
+
+def test_information_value_rejects_non_binary_labels(discrete):
+    X, _ = discrete
+    with pytest.raises(ValueError):
+        contingency_information_value(X, np.arange(len(X)) % 3)
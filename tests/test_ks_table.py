@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import ks_table, ks_table_multi
+
+
+def _scored_frame(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, n)
+    return pd.DataFrame({
+        "y": y,
+        "p": np.clip(0.3 * y + 0.7 * rng.random(n), 0, 1),
+        "w": rng.uniform(0.5, 2.0, n),
+    })
+
+
+def _brute_force_ks(y, p, w):
+    values = np.unique(p)
+    bads = np.array([(w * y)[p <= v].sum() for v in values]) / (w * y).sum()
+    goods = np.array([(w * (1 - y))[p <= v].sum() for v in values]) / (w * (1 - y)).sum()
+    return np.max(np.abs(bads - goods)) * 100
+
+
+@pytest.mark.parametrize("is_score", [False, True])
+@pytest.mark.parametrize("sample_weight_col", [None, "w"])
+def test_numpy_engine_matches_duckdb_engine(is_score, sample_weight_col):
+    df = _scored_frame()
+    numpy_table = ks_table(df, "y", "p", is_score=is_score, sample_weight_col=sample_weight_col)
+    duckdb_table = ks_table(df, "y", "p", is_score=is_score, sample_weight_col=sample_weight_col,
+                            engine="duckdb")
+    pd.testing.assert_frame_equal(numpy_table, duckdb_table, check_dtype=False)
+
+
+def test_exact_ks_matches_brute_force():
+    df = _scored_frame(n=400)
+    df["p"] = df["p"].round(2)  # introduce ties
+    table = ks_table(df, "y", "p", sample_weight_col="w")
+    expected = _brute_force_ks(df["y"].to_numpy(), df["p"].to_numpy(), df["w"].to_numpy())
+    assert table.attrs["exact_ks"] == pytest.approx(expected)
+    assert table["ks"].max() <= table.attrs["exact_ks"] + 1e-9
+
+
+@pytest.mark.parametrize("n_rows,n_bins", [(151, 6), (1000, 7), (37, 10)])
+def test_numpy_engine_bin_sizes_differ_by_at_most_one(n_rows, n_bins):
+    table = ks_table(_scored_frame(n=n_rows), "y", "p", n_bins=n_bins)
+    assert table["count"].sum() == n_rows
+    assert table["count"].max() - table["count"].min() <= 1
+
+
+def test_ks_table_does_not_print_exact_ks(capsys):
+    ks_table(_scored_frame(), "y", "p")
+    assert "Exact KS" not in capsys.readouterr().out
+
+
+def _multi_frame():
+    df = _scored_frame()
+    df["q"] = np.random.default_rng(1).random(len(df))
+    return df
+
+
+@pytest.mark.parametrize("label_dtype", [None, object, "category"])
+def test_ks_table_multi_matches_ks_table(label_dtype):
+    df = _multi_frame()
+    if label_dtype is not None:
+        df["y"] = df["y"].astype(label_dtype)
+    multi = ks_table_multi(df, "y", ["p", "q"], is_score={"p": False, "q": True})
+    for col, is_score in [("p", False), ("q", True)]:
+        single = ks_table(df, "y", col, is_score=is_score)
+        block = multi[multi["score_col"] == col].reset_index(drop=True)
+        np.testing.assert_allclose(block["ks"], single["ks"])
+        np.testing.assert_allclose(block["count"], single["count"])
+        if label_dtype is None:
+            assert multi.attrs["exact_ks"][col] == pytest.approx(single.attrs["exact_ks"])
+
+
+def test_ks_table_multi_requires_direction_for_every_column():
+    with pytest.raises(KeyError):
+        ks_table_multi(_multi_frame(), "y", ["p", "q"], is_score={"p": False})
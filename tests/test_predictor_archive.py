@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+pytest.importorskip("autogluon.tabular")
+
+from course_utils import helpers
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path / "ag_predictor_cache"
+
+
+@pytest.fixture
+def packed(tmp_path):
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    (model_dir / "predictor.pkl").write_text("2.0")
+    return helpers._pack_predictor_dir(str(model_dir))
+
+
+def test_unpack_is_shared_and_owner_removes_it(cache_root, packed):
+    digest, payload = packed
+    path = helpers._unpack_predictor_archive(digest, payload, os.getpid())
+    assert open(os.path.join(path, "predictor.pkl")).read() == "2.0"
+    assert helpers._unpack_predictor_archive(digest, payload, os.getpid()) == path
+
+    helpers._remove_owned_predictor_copies(os.getpid(), digest)
+    assert os.listdir(cache_root) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="orphan pruning is POSIX only")
+def test_copies_of_dead_owners_are_pruned(cache_root, packed):
+    digest, payload = packed
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()
+    orphan = helpers._unpack_predictor_archive(digest, payload, child.pid)
+    (cache_root / f".{child.pid}-scratch").mkdir()
+
+    live = helpers._unpack_predictor_archive(digest, payload, os.getpid())
+    assert os.listdir(cache_root) == [os.path.basename(live)]
+    assert not os.path.exists(orphan)
+
+
+def test_clear_predictor_archive_cache(cache_root, packed):
+    helpers._unpack_predictor_archive(*packed, os.getpid())
+    helpers.clear_predictor_archive_cache()
+    assert not cache_root.exists()
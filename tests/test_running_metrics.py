@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    average_precision_score,
+    f1_score,
+    log_loss,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+    roc_curve,
+)
+
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import bootstrap_binary_metrics, build_running_metric_row
+
+LAB_04_COLUMNS = [
+    "Strategy", "Model", "Threshold Setting", "Test ROC-AUC", "Test Average Precision",
+    "Test Log Loss", "Threshold", "precision", "recall", "F1-score",
+]
+
+
+@pytest.fixture
+def scored():
+    rng = np.random.default_rng(3)
+    y = rng.integers(0, 2, 2_000)
+    # Rounded scores create ties, which the fused pass must handle like sklearn.
+    score = np.round(np.clip(0.3 * y + rng.random(y.size) * 0.7, 1e-6, 1 - 1e-6), 2)
+    weight = rng.uniform(0.5, 2.0, y.size)
+    return y, score, weight
+
+
+def _row(y, score, **kwargs):
+    return build_running_metric_row("s", "m", y, score, y, score, best_threshold=0.45, **kwargs)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_fused_metrics_match_sklearn(scored, weighted):
+    y, score, weight = scored
+    w = weight if weighted else None
+    row = _row(y, score, test_sample_weight=w, include_ks=True)
+    pred = (score >= 0.45).astype(int)
+    fpr, tpr, _ = roc_curve(y, score, sample_weight=w)
+
+    np.testing.assert_allclose(row["Test ROC-AUC"], roc_auc_score(y, score, sample_weight=w), rtol=1e-10)
+    np.testing.assert_allclose(
+        row["Test Average Precision"], average_precision_score(y, score, sample_weight=w), rtol=1e-10
+    )
+    np.testing.assert_allclose(row["Test Log Loss"], log_loss(y, score, sample_weight=w), rtol=1e-10)
+    np.testing.assert_allclose(row["Test KS"], np.max(tpr - fpr) * 100, rtol=1e-10)
+    np.testing.assert_allclose(row["precision"], precision_score(y, pred, sample_weight=w), rtol=1e-10)
+    np.testing.assert_allclose(row["recall"], recall_score(y, pred, sample_weight=w), rtol=1e-10)
+    np.testing.assert_allclose(row["F1-score"], f1_score(y, pred, sample_weight=w), rtol=1e-10)
+
+
+def test_default_row_keeps_lab_04_columns(scored):
+    y, score, _ = scored
+    assert list(_row(y, score)) == LAB_04_COLUMNS
+    assert list(_row(y, score, include_ks=True)) == LAB_04_COLUMNS[:6] + ["Test KS"] + LAB_04_COLUMNS[6:]
+
+
+def test_bootstrap_columns_and_reproducibility(scored):
+    y, score, weight = scored
+    row = _row(y, score, n_bootstrap=50, ci_metrics=("Test ROC-AUC", "Test KS"))
+    assert "Test KS" in row
+    for metric in ("Test ROC-AUC", "Test KS"):
+        assert row[f"{metric} CI Lower"] <= row[metric] <= row[f"{metric} CI Upper"]
+
+    serial = bootstrap_binary_metrics(y, score, n_bootstrap=64, sample_weight=weight, max_block_elements=20_000)
+    parallel = bootstrap_binary_metrics(
+        y, score, n_bootstrap=64, sample_weight=weight, max_block_elements=20_000, n_jobs=2
+    )
+    np.testing.assert_allclose(serial[["ci_lower", "ci_upper"]], parallel[["ci_lower", "ci_upper"]])
+
+
+def test_unknown_ci_metric_raises(scored):
+    y, score, _ = scored
+    with pytest.raises(ValueError):
+        _row(y, score, n_bootstrap=5, ci_metrics=("Test Brier",))
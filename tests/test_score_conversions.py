@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import assign_score_bands, calculate_score, score_to_probability
+
+
+def _score_to_probability_formula(score, pdo=40, base_score=600):
+    odds_bad = np.exp((np.asarray(score, dtype=float) - base_score) / -(pdo / np.log(2)))
+    return odds_bad / (1 + odds_bad)
+
+
+def test_score_to_probability_lookup_matches_formula():
+    score = np.arange(300, 851)
+    expected = _score_to_probability_formula(score)
+    np.testing.assert_allclose(score_to_probability(score), expected, rtol=1e-12)
+    np.testing.assert_allclose(score_to_probability(score, use_lookup=False), expected, rtol=1e-12)
+    np.testing.assert_allclose(score_to_probability(score.astype(float)), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("out_dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("score_dtype", [np.int64, np.float64])
+def test_score_to_probability_out(out_dtype, score_dtype):
+    score = np.array([300, 455, 600, 721, 850], dtype=score_dtype)
+    out = np.empty(score.shape, dtype=out_dtype)
+    result = score_to_probability(score, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, _score_to_probability_formula(score), rtol=1e-6)
+
+
+def test_calculate_score_round_trip():
+    prob_default = np.array([0.02, 0.05, 0.2, 0.5])
+    score = calculate_score(prob_default)
+    out = np.empty(score.shape, dtype=np.int16)
+    np.testing.assert_array_equal(calculate_score(prob_default, out=out), score)
+    np.testing.assert_allclose(score_to_probability(score.astype(float)), prob_default, rtol=0.05)
+
+
+@pytest.mark.parametrize("out_dtype", [None, np.int16, np.int32, np.int64])
+@pytest.mark.parametrize("score_dtype", [np.int64, np.float64])
+def test_assign_score_bands_out_dtypes(out_dtype, score_dtype):
+    score = np.array([300, 579, 580, 669, 670, 740, 799, 800, 850], dtype=score_dtype)
+    expected = np.array([0, 0, 1, 1, 2, 3, 3, 4, 4])
+    out = None if out_dtype is None else np.empty(score.shape, dtype=out_dtype)
+    result = assign_score_bands(score, out=out)
+    np.testing.assert_array_equal(result, expected)
+    if out is not None:
+        assert result is out
+
+
+def test_assign_score_bands_out_of_range_and_labels():
+    score = np.array([250.0, np.nan, 600.0, 900.0])
+    np.testing.assert_array_equal(assign_score_bands(score), [-1, -1, 1, -1])
+    labels = ["Poor", "Fair", "Good", "Very good", "Exceptional"]
+    banded = assign_score_bands(np.array([300, 850]), labels=labels)
+    assert list(banded) == ["Poor", "Exceptional"]
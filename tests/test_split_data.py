@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import train_test_split
+
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import split_data
+
+
+@pytest.fixture
+def loans():
+    rng = np.random.default_rng(8)
+    n_loans = 500
+    months = rng.integers(1, 8, n_loans)
+    return pd.DataFrame({
+        "loan_id": np.repeat(np.arange(n_loans) * 7 + 1000, months),
+        "y": np.repeat(rng.random(n_loans) < 0.3, months).astype(int),
+        "x": rng.random(months.sum()),
+    }, index=pd.RangeIndex(months.sum()) * 2)
+
+
+@pytest.mark.parametrize("target_col", [None, "y"])
+def test_positional_split_matches_frame_train_test_split(loans, target_col):
+    stratify = loans[target_col] if target_col else None
+    expected_train, temp = train_test_split(loans, train_size=0.6, random_state=2025, stratify=stratify)
+    expected_calib, expected_test = train_test_split(
+        temp, test_size=0.5, random_state=2025, stratify=temp[target_col] if target_col else None
+    )
+
+    frames = split_data(loans, target_col=target_col)
+    for result, expected in zip(frames, (expected_train, expected_calib, expected_test)):
+        pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("hash_key", [None, "loan_id"])
+def test_output_modes_agree(loans, hash_key):
+    frames = split_data(loans, target_col="y", hash_key=hash_key)
+    indices = split_data(loans, target_col="y", hash_key=hash_key, output="indices")
+    labels = split_data(loans, target_col="y", hash_key=hash_key, output="labels")
+
+    for name, frame, idx in zip(["train", "calib", "test"], frames, indices):
+        pd.testing.assert_frame_equal(frame, loans.take(idx))
+        assert labels.index[labels == name].equals(frame.index.sort_values())
+
+
+def test_hash_split_keeps_loans_together_and_is_stable(loans):
+    labels = split_data(loans, hash_key="loan_id", output="labels")
+    assert (labels.groupby(loans["loan_id"]).nunique() == 1).all()
+
+    # A shuffled subset of the panel assigns every loan to the same split.
+    subset = loans.sample(frac=0.5, random_state=1)
+    subset_labels = split_data(subset, hash_key="loan_id", output="labels")
+    pd.testing.assert_series_equal(subset_labels, labels.loc[subset.index])
+
+    loan_shares = labels.groupby(loans["loan_id"]).first().value_counts(normalize=True)
+    np.testing.assert_allclose(loan_shares[["train", "calib", "test"]], [0.6, 0.2, 0.2], atol=0.08)
+
+    # The seed changes the assignment for numeric and string keys alike.
+    for key_values in (loans["loan_id"], loans["loan_id"].astype(str)):
+        keyed = loans.assign(loan_id=key_values)
+        reseeded = split_data(keyed, hash_key="loan_id", output="labels", random_state=7)
+        assert (reseeded != split_data(keyed, hash_key="loan_id", output="labels")).mean() > 0.3
+
+
+def test_missing_hash_key_raises(loans):
+    with pytest.raises(ValueError):
+        split_data(loans, hash_key="borrower_id")
@@ -0,0 +1,45 @@
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import split_parquet_by_loan
+
+
+@pytest.fixture
+def panel_path(tmp_path):
+    rng = np.random.default_rng(0)
+    n_loans = 400
+    months = rng.integers(1, 6, n_loans)
+    loan_id = np.repeat(np.arange(n_loans), months)
+    default = np.repeat(rng.random(n_loans) < 0.2, months).astype(int)
+    path = tmp_path / "panel.parquet"
+    pd.DataFrame({"loan_id": loan_id, "default": default, "x": rng.random(loan_id.size)}).to_parquet(path)
+    return str(path)
+
+
+def _written_summary(output_dir):
+    return duckdb.sql(f"""
+        SELECT split, COUNT(*) AS n_rows, COUNT(DISTINCT loan_id) AS n_loans,
+               COUNT(DISTINCT loan_id) FILTER (WHERE "default" = 1) AS n_bad
+        FROM read_parquet('{output_dir}/*/*.parquet', hive_partitioning = true)
+        GROUP BY split
+    """).df().set_index("split").sort_index()
+
+
+@pytest.mark.parametrize("stratify_col", [None, "default"])
+def test_summary_matches_written_files_and_reruns_replace_them(tmp_path, panel_path, stratify_col):
+    output_dir = str(tmp_path / "out")
+    split_parquet_by_loan(panel_path, output_dir, stratify_col=stratify_col, random_state=1)
+    pd.read_parquet(panel_path).head(5).to_parquet(tmp_path / "out" / "split=train" / "stale.parquet")
+    summary = split_parquet_by_loan(panel_path, output_dir, stratify_col=stratify_col, random_state=2)
+
+    written = _written_summary(output_dir)
+    summary = summary.set_index("split").sort_index()
+    assert written["n_rows"].sum() == len(pd.read_parquet(panel_path))
+    assert (written["n_rows"] == summary["n_rows"]).all()
+    assert (written["n_loans"] == summary["n_loans"]).all()
+    if stratify_col:
+        np.testing.assert_allclose(summary["loan_outcome_rate"], written["n_bad"] / written["n_loans"])
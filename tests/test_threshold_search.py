@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from sklearn.metrics import confusion_matrix, f1_score, fbeta_score, matthews_corrcoef, precision_score, recall_score
+
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import find_best_threshold
+
+
+def _youden_j(y, pred, sample_weight=None):
+    tn, fp, fn, tp = confusion_matrix(y, pred, labels=[0, 1], sample_weight=sample_weight).ravel()
+    return tp / (tp + fn) - fp / (fp + tn)
+
+
+def _negative_cost(y, pred, sample_weight=None):
+    tn, fp, fn, tp = confusion_matrix(y, pred, labels=[0, 1], sample_weight=sample_weight).ravel()
+    return -(1.0 * fp + 20.0 * fn)
+
+
+def _precision_at_recall(y, pred, sample_weight=None):
+    if recall_score(y, pred, sample_weight=sample_weight) < 0.8:
+        return -np.inf
+    return precision_score(y, pred, zero_division=0, sample_weight=sample_weight)
+
+
+SCORERS = {
+    "f1": ({}, lambda y, pred, sample_weight=None: f1_score(y, pred, zero_division=0, sample_weight=sample_weight)),
+    "fbeta": ({"beta": 2.0}, lambda y, pred, sample_weight=None: fbeta_score(
+        y, pred, beta=2.0, zero_division=0, sample_weight=sample_weight)),
+    "youden_j": ({}, _youden_j),
+    "mcc": ({}, lambda y, pred, sample_weight=None: matthews_corrcoef(y, pred, sample_weight=sample_weight)),
+    "cost": ({"fp_cost": 1.0, "fn_cost": 20.0}, _negative_cost),
+    "precision_at_recall": ({"min_recall": 0.8}, _precision_at_recall),
+}
+
+
+@pytest.fixture
+def scored():
+    rng = np.random.default_rng(11)
+    y = rng.integers(0, 2, 600)
+    score = np.round(np.clip(0.25 * y + rng.random(y.size) * 0.75, 0, 1), 2)
+    weight = rng.uniform(0.2, 3.0, y.size)
+    return y, score, weight
+
+
+def _brute_force_best(y, score, scorer, thresholds, sample_weight):
+    return max(scorer(y, (score >= t).astype(int), sample_weight=sample_weight) for t in thresholds)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("name", sorted(SCORERS))
+def test_named_scorers_match_brute_force(scored, name, weighted):
+    y, score, weight = scored
+    w = weight if weighted else None
+    kwargs, reference = SCORERS[name]
+
+    best = find_best_threshold(y, score, scorer=name, scorer_kwargs=kwargs, sample_weight=w)
+    candidates = np.unique(score)
+    achieved = reference(y, (score >= best).astype(int), sample_weight=w)
+    np.testing.assert_allclose(achieved, _brute_force_best(y, score, reference, candidates, w), rtol=1e-9)
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_default_search_matches_callable_scorer_on_same_grid(scored, weighted):
+    y, score, weight = scored
+    w = weight if weighted else None
+    grid = np.unique(score)
+
+    default = find_best_threshold(y, score, sample_weight=w)
+    callable_best = find_best_threshold(
+        y, score, thresholds=grid, sample_weight=w,
+        scorer=lambda y_true, y_pred, sample_weight=None: f1_score(y_true, y_pred, sample_weight=sample_weight),
+    )
+    assert default == callable_best
+
+
+def test_unattainable_scorer_raises(scored):
+    y, score, _ = scored
+    with pytest.raises(ValueError):
+        find_best_threshold(y, score, scorer="precision_at_recall", scorer_kwargs={"min_recall": 1.1})
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("autogluon.tabular")
+
+from course_utils.helpers import create_TTD_data
+
+
+def test_create_ttd_parquet_column_null_at_start(tmp_path):
+    """An object column that is all-null in the first chunk must not pin the schema to null."""
+    n = 50
+    df_accepted = pd.DataFrame({
+        "a": np.arange(n, dtype=float),
+        "c": pd.Series([None] * 5 + ["u"] * (n - 5), dtype=object),
+        "default_flag": np.arange(n) % 2,
+    })
+    df_rejected = df_accepted.drop(columns="default_flag").iloc[:10]
+    output_path = tmp_path / "ttd.parquet"
+    
+    result = create_TTD_data(
+        None, df_rejected, df_accepted, ri_features=["a"], modeling_features=["a", "c"],
+        output_path=str(output_path), chunk_size=5,
+    )
+    
+    back = pd.read_parquet(output_path)
+    expected = create_TTD_data(None, df_rejected, df_accepted, ["a"], ["a", "c"])
+    assert result["n_rows"] == len(expected) == len(back)
+    assert back["c"].isna().sum() == expected["c"].isna().sum()
+    assert back["c"].dropna().eq("u").all()